@@ -5,18 +5,27 @@ This script ensures proper import paths regardless of how it's invoked.
 """
 import sys
 import os
+import asyncio
 import argparse
+import threading
 import traceback
 import json
+import time
 import random
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# orjson is optional; it parses large proxy dumps much faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add the project root to the Python path to ensure all imports work correctly
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, PROJECT_ROOT)
 
-from src.scrapers.google_maps_scraper import GoogleMapsScraper
-from src.proxy_harvester import ProxyHarvester
 from src.common.logger import (
     print_system_message,
     print_info_message,
@@ -25,10 +34,13 @@ from src.common.logger import (
     print_error_message
 )
 
-def main():
-    """Main function to run Google Maps scraper with command line arguments"""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser for the scraper entry point."""
     parser = argparse.ArgumentParser(description="Google Maps Scraper")
-    parser.add_argument("query", help="Search query for Google Maps")
+    parser.add_argument("query", nargs="?", default=None, help="Search query for Google Maps")
+    parser.add_argument("--queries-file", "-f", help="File containing search queries, one per line (scraped in parallel)")
+    parser.add_argument("--threads", "-t", type=int, default=None,
+                        help="Number of parallel browsers for --queries-file (default: min(CPU count, proxies))")
     parser.add_argument("--location", "-l", help="Location for the search")
     parser.add_argument("--output", "-o", default="data", help="Output directory for scraped data")
     parser.add_argument("--headless", action="store_true", help="Run browser in headless mode")
@@ -37,22 +49,175 @@ def main():
     parser.add_argument("--proxy-file", help="Load proxies from this file instead of harvesting new ones")
     parser.add_argument("--proxy-type", choices=["elite", "anonymous", "all"], default="elite", 
                         help="Type of proxy to use (elite, anonymous, all)")
+    parser.add_argument("--block-resources", action="store_true",
+                        help="Skip downloading images, fonts, media and trackers")
+    parser.add_argument("--debug", action="store_true", help="Print full tracebacks on errors")
+    return parser
+
+def _fast_dump(path: Path, data: Any) -> None:
+    """
+    Serialize data to JSON and write it with a single write() call.
+    
+    Used on Ctrl+C, where the regular pretty-printed save would delay shutdown.
+    
+    Args:
+        path: Output file path
+        data: JSON-serializable data
+    """
+    payload = orjson.dumps(data) if orjson else json.dumps(data, ensure_ascii=False).encode("utf-8")
+    
+    # The interrupt may come before anything else has created the output directory
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _make_scraper(output_dir: str, headless: bool, max_results: int,
+                  proxy: Optional[Dict[str, str]]) -> Any:
+    """Create a GoogleMapsScraper with the batch options"""
+    from src.scrapers.google_maps_scraper import GoogleMapsScraper
+    
+    return GoogleMapsScraper(
+        output_dir=output_dir,
+        headless=headless,
+        max_results=max_results,
+        proxy=proxy
+    )
+
+def run_one(
+    task: Tuple[str, Optional[str], Optional[Dict[str, str]]],
+    output_dir: str,
+    headless: bool,
+    max_results: int,
+    browser_options: Dict[str, Any],
+    scraper: Any = None
+) -> Tuple[str, List[Dict[str, Any]], str]:
+    """
+    Run a single scrape.
     
+    Args:
+        task: Tuple of (query, location, proxy)
+        output_dir: Output directory for scraped data
+        headless: Run browser in headless mode
+        max_results: Maximum number of results to scrape (0 = unlimited)
+        browser_options: Extra options passed to GoogleMapsScraper.setup
+        scraper: Scraper whose browser should be reused and left open for the
+            next task; by default the scrape runs in its own browser
+        
+    Returns:
+        Tuple of (query, scraped_data, output_file)
+    """
+    query, location, proxy = task
+    keep_browser = scraper is not None
+    
+    if scraper is None:
+        scraper = _make_scraper(output_dir, headless, max_results, proxy)
+    elif scraper.proxy != proxy:
+        # A different proxy needs a different browser
+        scraper.cleanup()
+        scraper.proxy = proxy
+    
+    try:
+        data, output_file = scraper.run(
+            query,
+            location,
+            keep_browser=keep_browser,
+            headless=headless,
+            proxy=proxy,
+            **browser_options
+        )
+        return query, data, output_file
+    except Exception as e:
+        print_error_message("Error scraping '%s': %s", query, e)
+        return query, [], ""
+    finally:
+        if not keep_browser:
+            try:
+                scraper.cleanup()
+            except Exception:
+                pass
+
+async def run_queries(
+    tasks: List[Tuple[str, Optional[str], Optional[Dict[str, str]]]],
+    max_workers: int,
+    **scrape_options
+) -> List[Tuple[str, List[Dict[str, Any]], str]]:
+    """
+    Scrape several queries concurrently, one browser per worker thread.
+    
+    Each worker keeps its browser open between queries (resetting it to a blank
+    page in between) and all browsers are closed once every query is done.
+    
+    Args:
+        tasks: List of (query, location, proxy) tuples
+        max_workers: Maximum number of browsers running at once
+        **scrape_options: Options forwarded to run_one
+        
+    Returns:
+        List of (query, scraped_data, output_file) tuples in task order
+    """
+    worker = threading.local()
+    scrapers = []
+    
+    def run_in_worker(task):
+        if not hasattr(worker, "scraper"):
+            worker.scraper = _make_scraper(
+                scrape_options["output_dir"],
+                scrape_options["headless"],
+                scrape_options["max_results"],
+                task[2]
+            )
+            scrapers.append(worker.scraper)
+        return run_one(task, scraper=worker.scraper, **scrape_options)
+    
+    loop = asyncio.get_running_loop()
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [loop.run_in_executor(pool, run_in_worker, task) for task in tasks]
+            return await asyncio.gather(*futures)
+    finally:
+        for scraper in scrapers:
+            try:
+                scraper.cleanup()
+            except Exception:
+                pass
+
+def main():
+    """Main function to run Google Maps scraper with command line arguments"""
+    parser = build_parser()
     args = parser.parse_args()
     
+    if not args.query and not args.queries_file:
+        parser.error("either a query or --queries-file must be provided")
+    
+    # Import the Selenium/requests stack only once we know we will scrape,
+    # so --help and argument errors return without paying for it
+    from src.scrapers.google_maps_scraper import GoogleMapsScraper
+    from src.proxy_harvester import ProxyHarvester
+    
     # Set process title to help with identification
     try:
         import setproctitle
-        setproctitle.setproctitle(f"tryloByte_scraper-{args.query}")
+        setproctitle.setproctitle(f"tryloByte_scraper-{args.query or args.queries_file}")
     except ImportError:
         # Not critical if this fails, just continue without setting the process title
         pass
     
-    print_system_message(f"Initializing Google Maps scraper for query: {args.query}")
+    if args.queries_file:
+        print_system_message(f"Initializing Google Maps scraper for queries in: {args.queries_file}")
+    else:
+        print_system_message(f"Initializing Google Maps scraper for query: {args.query}")
     
     # Handle proxy configuration
     proxy = None
     proxy_config = None
+    proxy_pool = []
     
     if args.use_proxy:
         print_info_message("Setting up proxy configuration...")
@@ -63,28 +228,35 @@ def main():
             
             if proxy_file.exists():
                 try:
-                    with open(proxy_file, "r") as f:
-                        proxies = json.load(f)
+                    # Read the whole file in one call and hand the bytes to the C parser
+                    raw = proxy_file.read_bytes()
+                    data = orjson.loads(raw) if orjson else json.loads(raw)
                         
-                    if isinstance(proxies, list) and len(proxies) > 0:
-                        # Filter by proxy type if needed
-                        if args.proxy_type != "all":
-                            proxies = [p for p in proxies if p.get("type", "").lower() == args.proxy_type.lower()]
+                    if isinstance(data, list) and len(data) > 0:
+                        # Choose a random proxy of the requested type in one pass
+                        # (size-1 reservoir sample, so no filtered copy is built)
+                        wanted = args.proxy_type.lower()
+                        proxy_data = None
+                        seen = 0
+                        for p in data:
+                            if wanted != "all" and p.get("type", "").lower() != wanted:
+                                continue
+                            seen += 1
+                            if random.random() * seen < 1:
+                                proxy_data = p
                         
-                        if proxies:
-                            # Choose a random proxy
-                            proxy_data = random.choice(proxies)
+                        if proxy_data:
                             proxy = {"http": f"http://{proxy_data['ip']}:{proxy_data['port']}"}
                             print_info_message(f"Using proxy: {proxy['http']}")
                         else:
-                            print_warning_message(f"No {args.proxy_type} proxies found in the file")
+                            print_warning_message("No %s proxies found in the file", args.proxy_type)
                     else:
                         print_warning_message("Invalid proxy file format or empty proxy list")
                 
                 except Exception as e:
-                    print_warning_message(f"Error loading proxies from file: {str(e)}")
+                    print_warning_message("Error loading proxies from file: %s", e)
             else:
-                print_warning_message(f"Proxy file not found: {args.proxy_file}")
+                print_warning_message("Proxy file not found: %s", args.proxy_file)
         
         if not proxy:
             # Harvest new proxies
@@ -99,21 +271,26 @@ def main():
                     best_proxy = proxies[0]
                     proxy = {"http": f"http://{best_proxy['ip']}:{best_proxy['port']}"}
                     proxy_config = {"http": f"http://{best_proxy['ip']}:{best_proxy['port']}"}
+                    proxy_pool = [{"http": f"http://{p['ip']}:{p['port']}"} for p in proxies]
                     print_info_message(f"Using harvested proxy: {best_proxy['ip']}:{best_proxy['port']}")
                 else:
                     print_warning_message("No working proxies found. Running without proxy.")
             except Exception as e:
-                print_warning_message(f"Error harvesting proxies: {str(e)}")
+                print_warning_message("Error harvesting proxies: %s", e)
                 print_warning_message("Running without proxy.")
     
     # Configure browser options for optimal stability
     browser_options = {
         'undetected': True,  # Use undetected Chrome driver
+        'block_resources': args.block_resources,
         'chrome_arguments': {
             'disable-features': 'VizDisplayCompositor,IsolateOrigins,site-per-process'
         }
     }
     
+    if args.queries_file:
+        return run_batch(args, proxy_pool or ([proxy] if proxy else []), browser_options)
+    
     # Configure scraper
     try:
         # Initialize the scraper
@@ -153,17 +330,25 @@ def main():
         # Save any data collected so far
         if 'scraper' in locals() and hasattr(scraper, 'data') and scraper.data:
             try:
-                # Generate output filename
-                output_file = scraper.save_data(scraper.data)
+                # Same layout as GoogleMapsScraper.save_data, minus the pretty-printing
+                timestamp = time.strftime("%Y%m%d_%H%M%S")
+                output_file = Path(args.output) / f"google_maps_interrupted_{timestamp}.json"
+                _fast_dump(output_file, {
+                    "search_query": f"{args.query} {args.location}" if args.location else args.query,
+                    "timestamp": timestamp,
+                    "count": len(scraper.data),
+                    "businesses": scraper.data
+                })
                 print_success_message(f"Successfully saved {len(scraper.data)} businesses collected before interruption")
                 print_success_message(f"Data saved to: {output_file}")
             except Exception as e:
-                print_error_message(f"Error saving data before exit: {str(e)}")
+                print_error_message("Error saving data before exit: %s", e)
         
         return 130  # Standard exit code for Ctrl+C
     except Exception as e:
-        print_error_message(f"Error during scraping: {str(e)}")
-        print_error_message(traceback.format_exc())
+        print_error_message("Error during scraping: %s: %s", type(e).__name__, e)
+        if args.debug:
+            print_error_message(traceback.format_exc())
         return 1
     finally:
         # Ensure resources are cleaned up
@@ -175,5 +360,71 @@ def main():
     
     return 0
 
+def run_batch(args: argparse.Namespace, proxy_pool: List[Dict[str, str]], browser_options: Dict[str, Any]) -> int:
+    """
+    Scrape every query in --queries-file with a bounded pool of browsers.
+    
+    Args:
+        args: Parsed command line arguments
+        proxy_pool: Proxies to spread across workers (empty for direct connection)
+        browser_options: Extra options passed to GoogleMapsScraper.setup
+        
+    Returns:
+        Process exit code
+    """
+    try:
+        with open(args.queries_file, "r", encoding="utf-8") as f:
+            queries = [line.strip() for line in f if line.strip()]
+    except Exception as e:
+        print_error_message("Failed to read queries file: %s", e)
+        return 1
+    
+    if not queries:
+        print_error_message(f"No queries found in {args.queries_file}")
+        return 1
+    
+    # Give each query its own proxy, cycling through the pool
+    tasks = [
+        (query, args.location, proxy_pool[i % len(proxy_pool)] if proxy_pool else None)
+        for i, query in enumerate(queries)
+    ]
+    
+    max_workers = args.threads
+    if not max_workers:
+        max_workers = min(os.cpu_count() or 1, len(proxy_pool) or len(tasks))
+    max_workers = max(1, min(max_workers, len(tasks)))
+    
+    # Every worker keeps its browser checked out until the batch ends, so the
+    # browser pool must allow at least one per worker
+    from src.browsers.selenium_browser import browser_pool
+    if browser_pool.size < max_workers:
+        browser_pool.resize(max_workers)
+    
+    print_system_message(f"Deploying {max_workers} parallel browsers for {len(tasks)} queries")
+    
+    try:
+        results = asyncio.run(run_queries(
+            tasks,
+            max_workers,
+            output_dir=args.output,
+            headless=args.headless,
+            max_results=args.max_results,
+            browser_options=browser_options
+        ))
+    except KeyboardInterrupt:
+        print_warning_message("\nScraping interrupted by user")
+        return 130  # Standard exit code for Ctrl+C
+    
+    failed = 0
+    for query, data, output_file in results:
+        if data:
+            print_success_message(f"{query}: scraped {len(data)} businesses -> {output_file}")
+        else:
+            failed += 1
+            print_error_message(f"{query}: scraping failed or no results found")
+    
+    print_system_message(f"Completed {len(results) - failed}/{len(results)} queries")
+    return 0 if failed < len(results) else 1
+
 if __name__ == "__main__":
     sys.exit(main())
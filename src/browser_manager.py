@@ -1,33 +1,45 @@
 import os
 import time
+import atexit
 import random
-from typing import Dict, Optional, Union
+import stat
+import shutil
+import tempfile
+import functools
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Union
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+# Selenium and webdriver_manager are imported lazily inside the methods that
+# need them; importing them here would add hundreds of ms to every cold start
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options as ChromeOptions
+    from selenium.webdriver.firefox.options import Options as FirefoxOptions
 
-# Import fake_useragent with proper error handling
+# Fallback user agents if fake_useragent fails
+FALLBACK_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36 Edg/91.0.864.59',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0'
+)
+
+# Import fake_useragent with proper error handling and sample a pool once at import
 try:
     from fake_useragent import UserAgent
     ua_instance = UserAgent()
+    _UA_POOL = tuple(ua_instance.random for _ in range(64))
     ua_available = True
 except Exception:
     ua_available = False
-    # Fallback user agents if fake_useragent fails
-    FALLBACK_USER_AGENTS = [
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36',
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36 Edg/91.0.864.59',
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0'
-    ]
+    _UA_POOL = FALLBACK_USER_AGENTS
+
+# Dedicated generator so browser setup does not share state with the global random module
+_UA_RANDOM = random.Random()
+
+from src.proxy_forwarder import ProxyForwarder
+from src.common.profile_template import seed_profile, save_profile_template, clear_profile_state
 
 # Import the centralized console output module
 from src.console_output import (
@@ -35,9 +47,83 @@ from src.console_output import (
     print_error_message, print_success_message
 )
 
+# Static Chrome flags applied to every browser instance
+_STATIC_CHROME_FLAGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-popup-blocking",
+)
+
+# Chrome profile preferences (0=ask, 1=allow, 2=block)
+_CHROME_PREFS = {
+    "profile.default_content_setting_values.geolocation": 2,
+    "credentials_enable_service": False,
+    "profile.password_manager_enabled": False,
+    "profile.default_content_setting_values.notifications": 2
+}
+
+# Warmed Chrome profile copied into each new profile directory so launches
+# skip first-run initialization; saved from the first cleanly closed browser
+_PROFILE_TEMPLATE_DIR = Path(os.environ.get(
+    "TRYLOBYTE_PROFILE_TEMPLATE",
+    os.path.join(tempfile.gettempdir(), "tb-profile-template")
+))
+
+# Sites whose storage is cleared when a running browser changes proxy, besides the open page's
+_CLEARED_ORIGINS = ("https://www.google.com", "https://consent.google.com")
+
+# Resolved chromedriver path, shared by every browser spawn in this process
+_DRIVER_PATH: Optional[str] = None
+_DRIVER_LOCK = threading.Lock()
+
+def _driver_path() -> str:
+    """Resolve the chromedriver path once, even when called from several threads."""
+    global _DRIVER_PATH
+    if _DRIVER_PATH is None:
+        with _DRIVER_LOCK:
+            if _DRIVER_PATH is None:
+                from webdriver_manager.chrome import ChromeDriverManager
+                _DRIVER_PATH = ChromeDriverManager().install()
+    return _DRIVER_PATH
+
+# Candidate Chrome/Chromium binary locations, checked in order
+_POSSIBLE_CHROME_PATHS = (
+    # Linux paths
+    "/usr/bin/chromium",
+    "/usr/bin/chromium-browser",
+    "/usr/bin/google-chrome",
+    "/usr/bin/google-chrome-stable",
+    # Add more paths as needed
+)
+
+@functools.lru_cache(maxsize=256)
+def _normalize_proxy(proxy_url: str) -> str:
+    """Strip the http:// prefix from a proxy URL, caching the result per proxy."""
+    if proxy_url.startswith('http://'):
+        return proxy_url[7:]
+    return proxy_url
+
+@functools.lru_cache(maxsize=1)
+def _find_chrome_binary() -> Optional[str]:
+    """Find the Chrome or Chromium binary on the system (probed once per process)."""
+    for path in _POSSIBLE_CHROME_PATHS:
+        # One stat() per path: existence and execute bits come back together
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode) and st.st_mode & 0o111:
+            return path
+            
+    return None
+
 class BrowserManager:
     """Manages browser instances with proxy configuration."""
     
+    __slots__ = ('headless', 'browser_type', 'user_agent', 'chromium_path', 'profile_dir', 'disk_cache_dir',
+                 'forwarder')
+    
     def __init__(self, headless: bool = False, browser_type: str = "chrome"):
         """
         Initialize the browser manager.
@@ -50,29 +136,84 @@ class BrowserManager:
         self.browser_type = browser_type.lower()
         
         # Set user agent
-        if ua_available:
-            try:
-                self.user_agent = ua_instance.random
-            except Exception:
-                self.user_agent = random.choice(FALLBACK_USER_AGENTS)
-        else:
-            self.user_agent = random.choice(FALLBACK_USER_AGENTS)
+        self.user_agent = _UA_RANDOM.choice(_UA_POOL)
         
         # Check for Chromium
-        self.chromium_path = self._find_chrome_binary()
+        self.chromium_path = _find_chrome_binary()
+        
+        # Chrome profile and tmpfs cache directories, reused across this manager's browser restarts
+        self.profile_dir: Optional[Path] = None
+        self.disk_cache_dir: Optional[Path] = None
+        
+        # Local proxy that rotatable browsers connect through, see set_proxy
+        self.forwarder: Optional[ProxyForwarder] = None
+    
+    def _get_profile_dir(self) -> Path:
+        """
+        Return this manager's Chrome user-data-dir, seeding it from the template on first use.
+        
+        Each manager gets its own directory because Chrome locks a profile to a
+        single running instance.
+        
+        Returns:
+            Path to the profile directory
+        """
+        if self.profile_dir is None:
+            profile_dir = Path(tempfile.gettempdir()) / f"tb-profile-{os.getpid()}-{id(self):x}"
+            if _PROFILE_TEMPLATE_DIR.is_dir() and not profile_dir.exists():
+                try:
+                    seed_profile(str(_PROFILE_TEMPLATE_DIR), str(profile_dir))
+                except Exception as e:
+                    print_warning_message("Could not seed Chrome profile from template: %s", e)
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            atexit.register(shutil.rmtree, profile_dir, True)
+            self.profile_dir = profile_dir
+            
+            # Keep the disk cache on tmpfs where available
+            if os.path.isdir("/dev/shm"):
+                self.disk_cache_dir = Path("/dev/shm") / f"tb-cache-{os.getpid()}-{id(self):x}"
+                atexit.register(shutil.rmtree, self.disk_cache_dir, True)
+        return self.profile_dir
+    
+    def _save_profile_template(self) -> None:
+        """Store this manager's (closed) profile, minus its browsing state, as the template for future launches."""
+        if self.profile_dir is not None:
+            save_profile_template(str(self.profile_dir), str(_PROFILE_TEMPLATE_DIR), f"{id(self):x}")
+    
+    def _clear_profile_state(self) -> None:
+        """
+        Drop the cookies, storage and caches of this manager's (closed) profile.
+        
+        The profile directory outlives each browser, so without this the next
+        browser, usually started with a different proxy, would carry the same identity.
+        """
+        if self.profile_dir is not None:
+            clear_profile_state(str(self.profile_dir))
+        if self.disk_cache_dir is not None:
+            shutil.rmtree(self.disk_cache_dir, ignore_errors=True)
+    
+    def _get_user_agent(self) -> str:
+        """Return the user agent selected for this browser manager."""
+        return self.user_agent
     
-    def get_browser(self, proxy: Optional[Dict[str, str]] = None) -> webdriver.Remote:
+    def get_browser(self, proxy: Optional[Dict[str, str]] = None, rotatable: bool = False) -> "webdriver.Remote":
         """
         Initialize and return a browser instance with the specified configuration.
         
         Args:
             proxy: Optional proxy configuration dict ('http'/'https' keys or 'direct: True')
+            rotatable: Connect the browser through a local forwarder so set_proxy()
+                can change its proxy later without a restart
             
         Returns:
             Configured WebDriver instance
         """
         print_system_message("Initializing chrome browser...")
         
+        if rotatable:
+            self.set_proxy(proxy, create=True)
+            proxy = {'http': f"http://{self.forwarder.address}"}
+        
         # Check if we're using a direct connection (no proxy)
         using_direct_connection = proxy is not None and proxy.get('direct', False)
         
@@ -98,17 +239,22 @@ class BrowserManager:
             print_error_message(f"Browser initialization failed: {str(e)}")
             raise
             
-    def _get_chrome_browser(self, options, direct_connection: bool = False) -> webdriver.Chrome:
+    def _get_chrome_browser(self, options, direct_connection: bool = False) -> "webdriver.Chrome":
         """Initialize a Chrome browser with the specified options."""
+        from selenium import webdriver
         from selenium.webdriver.chrome.service import Service
-        from webdriver_manager.chrome import ChromeDriverManager
         
         # Check for Chrome/Chromium location
-        chrome_path = self._find_chrome_binary()
+        chrome_path = _find_chrome_binary()
         if chrome_path:
             print_info_message(f"Found Chromium at: {chrome_path}")
             options.binary_location = chrome_path
         
+        # Reuse a warmed profile instead of building a fresh one on every launch
+        options.add_argument(f"--user-data-dir={self._get_profile_dir()}")
+        if self.disk_cache_dir:
+            options.add_argument(f"--disk-cache-dir={self.disk_cache_dir}")
+        
         # Configure proxy if specified
         if not direct_connection and options._proxy:
             print_system_message(f"Configuring Chrome/Chromium with proxy: {options._proxy}")
@@ -128,8 +274,8 @@ class BrowserManager:
         
         # Initialize Chrome driver with error handling
         try:
-            # Use ChromeDriverManager to automatically get the right chromedriver
-            service = Service(ChromeDriverManager().install())
+            # Use ChromeDriverManager to get the right chromedriver (resolved once per process)
+            service = Service(_driver_path())
             
             # Start browser with the configured options
             if not self.headless:
@@ -141,6 +287,10 @@ class BrowserManager:
             
             driver = webdriver.Chrome(service=service, options=options)
             
+            # Keep several chromedriver connections alive instead of Selenium's single one
+            from src.browsers.selenium_browser import widen_executor_pool
+            widen_executor_pool(driver)
+            
             # Explicitly set window size again after initialization
             if not self.headless:
                 driver.set_window_size(window_size["width"], window_size["height"])
@@ -154,7 +304,7 @@ class BrowserManager:
             print_error_message(f"Chrome initialization error: {str(e)}")
             raise
 
-    def _get_browser_options(self, proxy: Optional[Dict[str, str]] = None) -> Union[ChromeOptions, FirefoxOptions]:
+    def _get_browser_options(self, proxy: Optional[Dict[str, str]] = None) -> Union["ChromeOptions", "FirefoxOptions"]:
         """
         Configure browser options based on the browser type and settings.
         
@@ -165,11 +315,11 @@ class BrowserManager:
             Configured browser options object
         """
         if self.browser_type == "chrome":
+            from selenium.webdriver.chrome.options import Options as ChromeOptions
+            
             options = ChromeOptions()
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-extensions")
-            options.add_argument("--disable-popup-blocking")
+            for flag in _STATIC_CHROME_FLAGS:
+                options.add_argument(flag)
             
             # Add user agent
             user_agent = self._get_user_agent()
@@ -184,20 +334,12 @@ class BrowserManager:
                 print_info_message("Using direct connection (no proxy)")
             # Add proxy if provided and not direct
             elif proxy and 'http' in proxy:
-                proxy_server = proxy['http']
-                if proxy_server.startswith('http://'):
-                    proxy_server = proxy_server[7:]  # Remove http:// prefix
-                
+                proxy_server = _normalize_proxy(proxy['http'])
                 options.add_argument(f"--proxy-server={proxy_server}")
                 options._proxy = proxy_server  # Store for logging
             
             # Add preferences
-            options.add_experimental_option("prefs", {
-                "profile.default_content_setting_values.geolocation": 2,  # 0=ask, 1=allow, 2=block
-                "credentials_enable_service": False,
-                "profile.password_manager_enabled": False,
-                "profile.default_content_setting_values.notifications": 2
-            })
+            options.add_experimental_option("prefs", _CHROME_PREFS)
             
             # Disable automation flags
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
@@ -206,6 +348,8 @@ class BrowserManager:
             return options
             
         elif self.browser_type == "firefox":
+            from selenium.webdriver.firefox.options import Options as FirefoxOptions
+            
             options = FirefoxOptions()
             options.add_argument("--disable-blink-features=AutomationControlled")
             options.add_argument("--disable-extensions")
@@ -220,10 +364,7 @@ class BrowserManager:
             
             # Add proxy if provided and not direct
             if proxy and not proxy.get('direct', False) and 'http' in proxy:
-                proxy_server = proxy['http']
-                if proxy_server.startswith('http://'):
-                    proxy_server = proxy_server[7:]  # Remove http:// prefix
-                
+                proxy_server = _normalize_proxy(proxy['http'])
                 host, port = proxy_server.split(':')
                 options.set_preference("network.proxy.type", 1)
                 options.set_preference("network.proxy.http", host)
@@ -239,24 +380,52 @@ class BrowserManager:
         else:
             raise ValueError(f"Unsupported browser type: {self.browser_type}")
 
-    def _find_chrome_binary(self) -> Optional[str]:
-        """Find the Chrome or Chromium binary on the system."""
-        possible_paths = [
-            # Linux paths
-            "/usr/bin/chromium",
-            "/usr/bin/chromium-browser",
-            "/usr/bin/google-chrome",
-            "/usr/bin/google-chrome-stable",
-            # Add more paths as needed
-        ]
+    def set_proxy(self, proxy: Optional[Dict[str, str]], create: bool = False) -> bool:
+        """
+        Switch the proxy used by browsers started with rotatable=True. Their open
+        connections are closed, so the next request already uses the new proxy.
         
-        for path in possible_paths:
-            if os.path.exists(path) and os.access(path, os.X_OK):
-                return path
-                
-        return None
-
-    def close_browser(self, driver: webdriver.Remote) -> None:
+        Args:
+            proxy: Proxy configuration dict ('http'/'https' keys or 'direct: True'), None for direct
+            create: Start the forwarder if there is none yet
+            
+        Returns:
+            True if the proxy was switched, False if there is no forwarder
+        """
+        upstream = None
+        if proxy and not proxy.get('direct', False):
+            upstream = proxy.get('http') or proxy.get('https')
+        
+        if self.forwarder is None:
+            if not create:
+                return False
+            self.forwarder = ProxyForwarder(upstream)
+        else:
+            self.forwarder.set_upstream(upstream)
+        return True
+    
+    def clear_browsing_data(self, driver: "webdriver.Remote") -> None:
+        """
+        Clear the cookies, cache and site storage of a running browser, e.g. after
+        set_proxy, so the new proxy does not inherit the old proxy's identity.
+        
+        Args:
+            driver: Webdriver instance to clear
+        """
+        if not hasattr(driver, "execute_cdp_cmd"):
+            # No DevTools protocol (Firefox): only the current domain's cookies can go
+            driver.delete_all_cookies()
+            return
+        
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        origins = set(_CLEARED_ORIGINS)
+        origins.add(driver.execute_script("return location.origin;"))
+        for origin in origins:
+            if origin and origin.startswith("http"):
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+    
+    def close_browser(self, driver: "webdriver.Remote") -> None:
         """
         Safely close a browser instance.
         
@@ -266,4 +435,8 @@ class BrowserManager:
         try:
             driver.quit()
         except Exception as e:
-            print_warning_message(f"Error closing browser: {e}")
+            print_warning_message("Error closing browser: %s", e)
+            return
+        
+        self._save_profile_template()
+        self._clear_profile_state()
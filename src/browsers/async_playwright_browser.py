@@ -0,0 +1,296 @@
+"""
+Async Playwright Browser Module for web scraping.
+This module provides an asyncio-based browser implementation that runs many
+pages concurrently inside a single Chromium process.
+"""
+import asyncio
+import logging
+from typing import Dict, Optional, List, Any, Union
+
+# Playwright is optional; SeleniumBrowser remains the default implementation
+try:
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+_SELECTOR_PREFIXES = {
+    "css": "css=",
+    "xpath": "xpath=",
+    "id": "#",
+    "class": ".",
+    "class_name": ".",
+    "tag": "css=",
+    "partial_link_text": "text=",
+}
+
+
+def _to_playwright_selector(selector: str, by_type: str = "css") -> str:
+    """Translate a Selenium-style (selector, by) pair into a Playwright selector"""
+    by_type = by_type.lower()
+    if by_type == "name":
+        return f'css=[name="{selector}"]'
+    if by_type == "link_text":
+        return f'text="{selector}"'
+    return f"{_SELECTOR_PREFIXES.get(by_type, 'css=')}{selector}"
+
+
+class AsyncPlaywrightPage:
+    """
+    A single logical browsing session: one page in its own browser context.
+    Exposes the BaseBrowser operations as coroutines.
+    """
+
+    def __init__(self, owner: "AsyncPlaywrightBrowser", context: Any, page: Any):
+        self.owner = owner
+        self.context = context
+        self.page = page
+
+    async def navigate(self, url: str, timeout: int = 30) -> bool:
+        """Navigate to the specified URL"""
+        async with self.owner.semaphore:
+            try:
+                await self.page.goto(url, wait_until="domcontentloaded", timeout=timeout * 1000)
+                return True
+            except Exception as e:
+                logging.error(f"Error navigating to {url}: {str(e)}")
+                return False
+
+    async def get_page_source(self) -> str:
+        """Get the current page source"""
+        async with self.owner.semaphore:
+            try:
+                return await self.page.content()
+            except Exception as e:
+                logging.error(f"Error getting page source: {str(e)}")
+                return ""
+
+    async def execute_script(self, script: str, *args) -> Any:
+        """Evaluate a JavaScript expression or function in the page"""
+        try:
+            return await self.page.evaluate(script, list(args) if args else None)
+        except Exception as e:
+            logging.error(f"Error executing script: {str(e)}")
+            return None
+
+    async def find_element(self, selector: str, by_type: str = "css") -> Optional[Any]:
+        """Find a single element"""
+        try:
+            return await self.page.query_selector(_to_playwright_selector(selector, by_type))
+        except Exception:
+            logging.debug(f"Element not found: {selector} (by: {by_type})")
+            return None
+
+    async def find_elements(self, selector: str, by_type: str = "css") -> List[Any]:
+        """Find multiple elements"""
+        try:
+            return await self.page.query_selector_all(_to_playwright_selector(selector, by_type))
+        except Exception:
+            logging.debug(f"Elements not found: {selector} (by: {by_type})")
+            return []
+
+    async def wait_for_element(self, selector: str, timeout: int = 10, by_type: str = "css") -> Optional[Any]:
+        """Wait for an element to be attached to the page and return it"""
+        try:
+            return await self.page.wait_for_selector(
+                _to_playwright_selector(selector, by_type),
+                state="attached",
+                timeout=timeout * 1000
+            )
+        except Exception:
+            logging.warning(f"Timeout waiting for element: {selector}")
+            return None
+
+    async def _resolve(self, element_or_selector: Any) -> Optional[Any]:
+        if isinstance(element_or_selector, str):
+            return await self.find_element(element_or_selector)
+        return element_or_selector
+
+    async def click(self, element_or_selector: Any) -> bool:
+        """Click on an element or selector"""
+        try:
+            element = await self._resolve(element_or_selector)
+            if not element:
+                return False
+            await element.click()
+            return True
+        except Exception as e:
+            logging.error(f"Error clicking element: {str(e)}")
+            return False
+
+    async def send_keys(self, element_or_selector: Any, text: str) -> bool:
+        """Type text into an element"""
+        try:
+            element = await self._resolve(element_or_selector)
+            if not element:
+                return False
+            if text == "\n":
+                await element.press("Enter")
+            else:
+                await element.type(text)
+            return True
+        except Exception as e:
+            logging.error(f"Error sending keys: {str(e)}")
+            return False
+
+    async def scroll(self, direction: str = "down", amount: int = 500) -> None:
+        """Scroll the page"""
+        deltas = {"down": (0, amount), "up": (0, -amount), "right": (amount, 0), "left": (-amount, 0)}
+        try:
+            direction = direction.lower()
+            if direction == "bottom":
+                await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            elif direction == "top":
+                await self.page.evaluate("window.scrollTo(0, 0)")
+            elif direction in deltas:
+                await self.page.mouse.wheel(*deltas[direction])
+        except Exception as e:
+            logging.error(f"Error scrolling: {str(e)}")
+
+    async def get_text(self, element_or_selector: Any) -> Optional[str]:
+        """Get text content from an element"""
+        try:
+            element = await self._resolve(element_or_selector)
+            return await element.inner_text() if element else None
+        except Exception as e:
+            logging.error(f"Error getting text: {str(e)}")
+            return None
+
+    async def get_attribute(self, element_or_selector: Any, attribute: str) -> Optional[str]:
+        """Get an attribute from an element"""
+        try:
+            element = await self._resolve(element_or_selector)
+            return await element.get_attribute(attribute) if element else None
+        except Exception as e:
+            logging.error(f"Error getting attribute: {str(e)}")
+            return None
+
+    async def close(self) -> None:
+        """Close the page and its browser context"""
+        try:
+            await self.context.close()
+        except Exception as e:
+            logging.warning(f"Error closing browser context: {str(e)}")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class AsyncPlaywrightBrowser:
+    """
+    Playwright-based browser for concurrent scraping from asyncio code.
+    One Chromium process is shared by many isolated browser contexts, and an
+    asyncio semaphore bounds how many of them load pages at the same time.
+    """
+
+    def __init__(self, max_concurrency: int = 4):
+        """
+        Initialize the async browser.
+
+        Args:
+            max_concurrency: Maximum number of pages loading at once
+        """
+        self.max_concurrency = max_concurrency
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.user_agent = None
+        self.initialized = False
+        self._playwright = None
+        self._browser = None
+
+    async def initialize(self, headless: bool = True,
+                         chrome_arguments: Optional[Dict[str, str]] = None,
+                         proxy: Optional[Union[str, Dict[str, str]]] = None,
+                         user_agent: Optional[str] = None) -> bool:
+        """
+        Launch Chromium.
+
+        Args:
+            headless: Run browser in headless mode (no GUI)
+            chrome_arguments: Additional Chrome arguments
+            proxy: Proxy configuration (string 'host:port' or dict with 'http'/'https' keys)
+            user_agent: User agent applied to every context
+
+        Returns:
+            bool: True if initialization successful
+        """
+        if not PLAYWRIGHT_AVAILABLE:
+            logging.error("playwright is not installed. Install it with 'pip install playwright'.")
+            return False
+
+        args = []
+        for key, value in (chrome_arguments or {}).items():
+            args.append(f"--{key}={value}" if value else f"--{key}")
+
+        launch_options: Dict[str, Any] = {"headless": headless, "args": args}
+        if isinstance(proxy, dict):
+            proxy = proxy.get("http") or proxy.get("https")
+        if proxy:
+            launch_options["proxy"] = {"server": proxy}
+
+        try:
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(**launch_options)
+        except Exception as e:
+            logging.error(f"Error initializing Playwright browser: {str(e)}")
+            await self.close()
+            return False
+
+        self.user_agent = user_agent
+        self.initialized = True
+        logging.info(f"Playwright browser initialized (headless: {headless})")
+        return True
+
+    async def new_page(self) -> AsyncPlaywrightPage:
+        """Open a page in a fresh, isolated browser context"""
+        if not self.initialized:
+            raise RuntimeError("Browser not initialized. Call initialize() first.")
+
+        context = await self._browser.new_context(
+            user_agent=self.user_agent,
+            viewport={"width": 1920, "height": 1080}
+        )
+        page = await context.new_page()
+        return AsyncPlaywrightPage(self, context, page)
+
+    async def fetch(self, url: str, timeout: int = 30) -> str:
+        """Load a URL in its own context and return the page source"""
+        async with await self.new_page() as page:
+            if not await page.navigate(url, timeout):
+                return ""
+            return await page.get_page_source()
+
+    async def fetch_all(self, urls: List[str], timeout: int = 30) -> List[str]:
+        """
+        Load several URLs concurrently.
+
+        Args:
+            urls: URLs to load
+            timeout: Per-page navigation timeout in seconds
+
+        Returns:
+            Page sources in the same order as urls ("" for failed pages)
+        """
+        return await asyncio.gather(*(self.fetch(url, timeout) for url in urls))
+
+    async def close(self) -> None:
+        """Close the browser and stop Playwright"""
+        try:
+            if self._browser:
+                await self._browser.close()
+            if self._playwright:
+                await self._playwright.stop()
+        except Exception as e:
+            logging.error(f"Error closing browser: {str(e)}")
+        finally:
+            self._browser = None
+            self._playwright = None
+            self.initialized = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
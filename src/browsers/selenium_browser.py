@@ -3,13 +3,28 @@ Selenium Browser Module for web scraping.
 This module provides a Selenium-based browser implementation.
 """
 import os
+import re
+import base64
 import time
+import shutil
 import json
+import atexit
+import asyncio
+import signal
 import random
 import logging
 import tempfile
-import subprocess
-from typing import Dict, Optional, List, Any, Union
+import weakref
+import threading
+import contextlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+import urllib3
+import requests
+from typing import Callable, Dict, Optional, List, Any, Tuple, Union
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -19,17 +34,649 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 
-# Try to import undetected_chromedriver for better anti-bot detection
+
+@functools.lru_cache(maxsize=1)
+def _load_uc() -> Any:
+    """
+    Import undetected_chromedriver on first use (importing it patches chromedriver,
+    which is slow). Returns None if it is not installed.
+    """
+    try:
+        import undetected_chromedriver as uc
+        return uc
+    except ImportError:
+        logging.warning("undetected_chromedriver not available. Using standard ChromeDriver.")
+        return None
+
+
+# Chrome major version and patched chromedriver from the first undetected launch.
+# Passing them to later launches skips uc's version probe and driver download.
+_UC_VERSION_MAIN: Optional[int] = None
+_UC_DRIVER_PATH: Optional[str] = None
+_UC_CACHE_LOCK = threading.Lock()
+
+
+def _remember_uc_driver(driver: Any) -> None:
+    """Keep a copy of the patched chromedriver so later launches can reuse it"""
+    global _UC_VERSION_MAIN, _UC_DRIVER_PATH
+    if _UC_DRIVER_PATH is not None:
+        return
+    with _UC_CACHE_LOCK:
+        if _UC_DRIVER_PATH is not None:
+            return
+        try:
+            version_main = int(driver.capabilities["browserVersion"].split(".")[0])
+            source = driver.patcher.executable_path
+            # uc deletes the binary it downloaded once its patcher is gone, so copy it
+            target = os.path.join(tempfile.gettempdir(), f"tb-chromedriver-{version_main}{os.path.splitext(source)[1]}")
+            staging = f"{target}.{os.getpid()}"
+            shutil.copy2(source, staging)
+            os.replace(staging, target)
+        except Exception as e:
+            logging.debug(f"Could not cache patched chromedriver: {str(e)}")
+            return
+        _UC_VERSION_MAIN, _UC_DRIVER_PATH = version_main, target
+
+
+def _forget_uc_driver() -> None:
+    """Drop the cached chromedriver, e.g. after Chrome was updated underneath us"""
+    global _UC_VERSION_MAIN, _UC_DRIVER_PATH
+    with _UC_CACHE_LOCK:
+        _UC_VERSION_MAIN, _UC_DRIVER_PATH = None, None
+
+
+# psutil is optional; without it only the top-level driver processes are tracked
 try:
-    import undetected_chromedriver as uc
-    UNDETECTED_AVAILABLE = True
+    import psutil
+    PSUTIL_AVAILABLE = True
 except ImportError:
-    UNDETECTED_AVAILABLE = False
-    logging.warning("undetected_chromedriver not available. Using standard ChromeDriver.")
+    PSUTIL_AVAILABLE = False
+
+from .base import BrowserContextMixin
+from ..common.profile_template import seed_profile, save_profile_template
+
+# Low-memory flags that keep Chrome stable in containers: shared memory in /tmp
+# instead of the (often tiny) /dev/shm, and no background services
+CONTAINER_SAFE_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-software-rasterizer",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-translate",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+    "--safebrowsing-disable-auto-update",
+)
+
+# Chrome features always disabled. Chrome only honours the last --disable-features
+# switch, so these are merged with any caller-supplied ones into a single flag.
+_DISABLED_FEATURES = (
+    "UseOzonePlatform",
+    "VizDisplayCompositor",
+    "IsolateOrigins",
+    "site-per-process",
+    "TranslateUI",
+    "BlinkGenPropertyTrees",
+)
+
+# Selector type names accepted by the lookup methods
+_BY_MAP = MappingProxyType({
+    "css": By.CSS_SELECTOR,
+    "xpath": By.XPATH,
+    "id": By.ID,
+    "class": By.CLASS_NAME,
+    "class_name": By.CLASS_NAME,
+    "name": By.NAME,
+    "tag": By.TAG_NAME,
+    "link_text": By.LINK_TEXT,
+    "partial_link_text": By.PARTIAL_LINK_TEXT,
+})
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_by(by_type: str) -> str:
+    """Map a selector type name (any case) to its By strategy, defaulting to CSS"""
+    return _BY_MAP.get(by_type.lower(), By.CSS_SELECTOR)
+
+_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/94.0.4606.81 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/94.0.4606.81 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/93.0.4577.82 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/94.0.4606.81 Safari/537.36",
+)
+
+# Newer Chrome versions are picked more often, since outdated ones stand out
+_UA_MAJORS = tuple(int(re.search(r"Chrome/(\d+)", ua).group(1)) for ua in _USER_AGENTS)
+_UA_WEIGHTS = tuple(major - min(_UA_MAJORS) + 1 for major in _UA_MAJORS)
+
+# Dedicated generator so browser setup does not share state with the global random module
+_UA_RANDOM = random.Random()
+
+# Reads every field of a bulk_extract() spec in one script call. Text uses innerText
+# to match WebElement.text; attributes prefer the DOM property (e.g. resolved href)
+# like WebElement.get_attribute().
+_BULK_EXTRACT_JS = """
+return Object.fromEntries(Object.entries(arguments[0]).map(([key, field]) => [
+    key,
+    Array.from(document.querySelectorAll(field.selector)).map(e =>
+        field.attr ? (field.attr in e ? e[field.attr] : e.getAttribute(field.attr)) : e.innerText)
+]));
+"""
+
+# Gzips the document with the browser's CompressionStream and returns it base64-encoded
+_GZIP_PAGE_SOURCE_JS = """
+const done = arguments[arguments.length - 1];
+const stream = new Blob([document.documentElement.outerHTML]).stream()
+    .pipeThrough(new CompressionStream("gzip"));
+new Response(stream).arrayBuffer().then(buffer => {
+    const bytes = new Uint8Array(buffer);
+    let binary = "";
+    for (let i = 0; i < bytes.length; i += 0x8000) {
+        binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+    }
+    done(btoa(binary));
+}).catch(() => done(null));
+"""
+
+# One dict per element matching arguments[0], holding the attributes named in
+# arguments[1] and, if arguments[2] is true, the element text under "__text"
+_BATCH_EXTRACT_JS = """
+const [selector, attributes, withText] = arguments;
+return Array.from(document.querySelectorAll(selector), e => {
+    const item = {};
+    for (const name of attributes) item[name] = e.getAttribute(name);
+    if (withText) item.__text = e.innerText;
+    return item;
+});
+"""
+
+# Resolves true once the window load event has fired, or false after arguments[0] ms
+_WAIT_FOR_LOAD_JS = """
+const [timeout, done] = arguments;
+if (document.readyState === "complete") {
+    done(true);
+    return;
+}
+const timer = setTimeout(() => done(false), timeout);
+window.addEventListener("load", () => {
+    clearTimeout(timer);
+    done(true);
+}, {once: true});
+"""
+
+# Resolves with the first element matching arguments[0] as soon as it appears,
+# or null after arguments[1] milliseconds
+_WAIT_FOR_SELECTOR_JS = """
+const [selector, timeout, done] = arguments;
+const existing = document.querySelector(selector);
+if (existing) {
+    done(existing);
+    return;
+}
+const observer = new MutationObserver(() => {
+    const element = document.querySelector(selector);
+    if (element) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(element);
+    }
+});
+const timer = setTimeout(() => {
+    observer.disconnect();
+    done(null);
+}, timeout);
+observer.observe(document, {subtree: true, childList: true, attributes: true});
+"""
+
+# Runs an interact() plan: each step acts on the element found by the latest
+# find/wait step, and the plan stops at the first step that has no element
+_INTERACT_JS = """
+const [steps, done] = arguments;
+const waitFor = (selector, timeout) => new Promise(resolve => {
+    const existing = document.querySelector(selector);
+    if (existing) return resolve(existing);
+    const observer = new MutationObserver(() => {
+        const element = document.querySelector(selector);
+        if (element) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(element);
+        }
+    });
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        resolve(null);
+    }, timeout);
+    observer.observe(document, {subtree: true, childList: true, attributes: true});
+});
+(async () => {
+    const results = [];
+    let current = null;
+    for (const step of steps) {
+        let value = null;
+        switch (step.op) {
+            case "find": value = current = document.querySelector(step.sel); break;
+            case "wait": value = current = await waitFor(step.sel, step.timeout); break;
+            case "scroll":
+            case "click":
+                if (!current) break;
+                current.scrollIntoView({block: "center", behavior: "instant"});
+                if (step.op === "click") current.click();
+                value = true;
+                break;
+            case "text": value = current && current.innerText; break;
+            case "attr":
+                if (current) value = step.name in current ? current[step.name] : current.getAttribute(step.name);
+                break;
+            default: throw new Error(`Unknown interact op: ${step.op}`);
+        }
+        results.push(value);
+        if (!current) break;
+    }
+    return results;
+})().then(done, () => done(null));
+"""
+
+# Markers of bot-challenge interstitials; a static fetch that hits one falls back to the browser
+_CHALLENGE_MARKERS = ("cf-browser-verification", "challenge-platform", "<title>Just a moment...</title>")
+
+# Characters that send_keys must type as key events: line breaks and selenium Keys
+_SPECIAL_KEYS_RE = re.compile("[\r\n\ue000-\uf8ff]")
+
+# Centres arguments[0] in the viewport, waits two animation frames (one paint) and
+# reports whether the element ended up fully visible. Occluded windows get no
+# animation frames, so a 100 ms timer finishes the wait in that case.
+_SCROLL_INTO_VIEW_JS = """
+const [element, done] = arguments;
+let finished = false;
+const finish = () => {
+    if (finished) return;
+    finished = true;
+    const r = element.getBoundingClientRect();
+    done(r.top >= 0 && r.bottom <= window.innerHeight);
+};
+element.scrollIntoView({block: "center", behavior: "instant"});
+requestAnimationFrame(() => requestAnimationFrame(finish));
+setTimeout(finish, 100);
+"""
+
+# Scrolls the container matching arguments[0] until the number of elements matching
+# arguments[1] reaches arguments[2] (0 = no limit), stops growing for arguments[4]
+# rounds, or arguments[5] milliseconds pass. Resolves with the final count, or null
+# if there is no container. One round in five waits an extra 0.5-2 s, like a reader.
+SCROLL_UNTIL_LOADED_JS = """
+const [containerSelector, itemSelector, maxItems, pauseMs, stableRounds, timeout, done] = arguments;
+const container = document.querySelector(containerSelector);
+if (!container) {
+    done(null);
+    return;
+}
+const deadline = Date.now() + timeout;
+let last = -1;
+let stable = 0;
+const step = () => {
+    const count = document.querySelectorAll(itemSelector).length;
+    if (maxItems > 0 && count >= maxItems) return done(count);
+    stable = count === last ? stable + 1 : 0;
+    if (stable >= stableRounds || Date.now() >= deadline) return done(count);
+    last = count;
+    container.scrollTop = container.scrollHeight;
+    setTimeout(step, pauseMs + (Math.random() < 0.2 ? 500 + Math.random() * 1500 : 0));
+};
+step();
+"""
+
+# Chrome content settings applied at launch when resources are blocked (2 = block)
+_MEDIA_BLOCKING_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+    "profile.managed_default_content_settings.plugins": 2,
+}
 
-from .base import BaseBrowser
+# Requests dropped when a browser is initialized with block_resources=True.
+# Result pages only need their HTML and scripts, not images, fonts, media or trackers.
+BLOCKED_RESOURCE_PATTERNS = (
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf",
+    "*.mp4", "*.webm",
+    "*google-analytics.com*", "*doubleclick.net*", "*googletagmanager.com*", "*facebook.net*",
+)
 
-class SeleniumBrowser(BaseBrowser):
+
+def _driver_pids(driver: Any, profile_dir: Optional[str] = None) -> List[int]:
+    """PIDs of the chromedriver and Chrome processes started for a driver"""
+    pids = []
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    if isinstance(service, _SharedService):
+        # The chromedriver is shared; only this session's Chrome belongs to the driver
+        if process is not None and profile_dir and PSUTIL_AVAILABLE:
+            flag = f"--user-data-dir={profile_dir}"
+            with contextlib.suppress(psutil.Error):
+                pids.extend(child.pid for child in psutil.Process(process.pid).children()
+                            if flag in child.cmdline())
+    elif process is not None:
+        pids.append(process.pid)
+    browser_pid = getattr(driver, "browser_pid", None)  # set by undetected_chromedriver
+    if browser_pid:
+        pids.append(browser_pid)
+    return pids
+
+
+def _terminate_processes(pids: List[int], timeout: float = 2.0, force: bool = False) -> None:
+    """
+    Terminate the given processes and everything they spawned.
+    Only these process trees are touched, never unrelated Chrome instances.
+    With force, the processes are killed outright instead of being asked to exit.
+    """
+    if not PSUTIL_AVAILABLE:
+        for pid in pids:
+            with contextlib.suppress(ProcessLookupError, PermissionError):
+                os.kill(pid, signal.SIGTERM)
+        return
+
+    procs = []
+    for pid in pids:
+        try:
+            root = psutil.Process(pid)
+            procs.extend(root.children(recursive=True))
+            procs.append(root)
+        except psutil.Error:
+            continue
+    if force:
+        for proc in procs:
+            with contextlib.suppress(psutil.Error):
+                proc.kill()
+        return
+    for proc in procs:
+        with contextlib.suppress(psutil.Error):
+            proc.terminate()
+    _, alive = psutil.wait_procs(procs, timeout=timeout)
+    for proc in alive:
+        with contextlib.suppress(psutil.Error):
+            proc.kill()
+
+
+class _SharedService(Service):
+    """
+    A chromedriver service that outlives the drivers using it. chromedriver
+    serves many sessions on one port, so standard (non-undetected) launches share
+    a single process instead of starting one each; quitting a driver only ends
+    its session.
+    """
+
+    def start(self) -> None:
+        if self.process is None or self.process.poll() is not None:
+            super().start()
+
+    def stop(self) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        """Stop the chromedriver process"""
+        super().stop()
+
+
+_SHARED_SERVICE: Optional[_SharedService] = None
+_SHARED_SERVICE_LOCK = threading.Lock()
+
+
+def _get_service() -> _SharedService:
+    """Return the shared chromedriver service, starting it if it is not running"""
+    global _SHARED_SERVICE
+    with _SHARED_SERVICE_LOCK:
+        if _SHARED_SERVICE is None:
+            _SHARED_SERVICE = _SharedService()
+        _SHARED_SERVICE.start()
+        return _SHARED_SERVICE
+
+
+# Profile captured from the first cleanly closed browser. Later launches start from a
+# copy of it, skipping Chrome's first-run profile creation.
+_PROFILE_TEMPLATE_DIR = os.environ.get(
+    "TRYLOBYTE_SELENIUM_PROFILE_TEMPLATE",
+    os.path.join(tempfile.gettempdir(), "tb-selenium-profile-template")
+)
+_profile_template_ready = False
+
+
+def _have_profile_template() -> bool:
+    """Whether the profile template exists; once it does the answer is cached, as it is never removed"""
+    global _profile_template_ready
+    if not _profile_template_ready:
+        _profile_template_ready = os.path.isdir(_PROFILE_TEMPLATE_DIR)
+    return _profile_template_ready
+
+
+def _new_profile_dir() -> str:
+    """Create a Chrome user-data-dir, seeded from the profile template when one exists"""
+    profile_dir = tempfile.mkdtemp(prefix="tb-selenium-profile-")
+    if not _have_profile_template():
+        return profile_dir
+    
+    try:
+        seed_profile(_PROFILE_TEMPLATE_DIR, profile_dir)
+    except Exception as e:
+        logging.warning(f"Could not seed Chrome profile from template: {str(e)}")
+    return profile_dir
+
+
+def _save_profile_template(profile_dir: str) -> None:
+    """Store a closed browser's profile, minus its browsing state, as the template for future launches"""
+    global _profile_template_ready
+    if not _have_profile_template():
+        _profile_template_ready = save_profile_template(profile_dir, _PROFILE_TEMPLATE_DIR, f"{threading.get_ident():x}")
+
+
+# Connections kept to chromedriver per driver. Selenium's default pool holds a single
+# connection, so overlapping commands (e.g. a wait alongside a lookup) would each
+# open and drop a new socket.
+_EXECUTOR_POOL_SIZE = 20
+
+# Page load timeout set at launch, in seconds; navigate() keeps it unless given another
+_PAGE_LOAD_TIMEOUT = 20
+
+# WebDriver's async script timeout, in seconds; longer calls raise it only for their duration
+_DEFAULT_SCRIPT_TIMEOUT = 30
+
+
+def widen_executor_pool(driver: Any, maxsize: int = _EXECUTOR_POOL_SIZE) -> None:
+    """Give the driver's WebDriver HTTP client a larger keep-alive connection pool"""
+    executor = getattr(driver, "command_executor", None)
+    conn = getattr(executor, "_conn", None)
+    # Leave proxy managers alone; they cannot be rebuilt from their pool kwargs
+    if type(conn) is not urllib3.PoolManager:
+        return
+    pool_kw = dict(conn.connection_pool_kw, maxsize=maxsize, block=False)
+    executor._conn = urllib3.PoolManager(**pool_kw)
+    conn.clear()
+
+
+@dataclass
+class BrowserInstance:
+    """A pooled Chrome driver and its usage bookkeeping"""
+    driver: Any
+    key: Tuple
+    created_at: float = field(default_factory=time.monotonic)
+    pages_processed: int = 0
+    is_busy: bool = True
+    blocked_urls: Tuple[str, ...] = ()
+    page_load_timeout: Optional[int] = None
+    pids: List[int] = field(default_factory=list)
+    profile_dir: Optional[str] = None
+    # Removes profile_dir; also runs at exit for instances that were never quit
+    remove_profile: Optional[weakref.finalize] = field(default=None, repr=False)
+    user_agent: Optional[str] = None
+
+
+class SeleniumBrowserPool:
+    """
+    Keeps warm Chrome instances around between SeleniumBrowser sessions.
+
+    Instances are keyed by launch configuration (browser type, headless flag and
+    Chrome arguments, which include the proxy) and are handed out to one browser
+    at a time. An instance is retired once it has served ``max_uses`` pages or
+    is older than ``max_age`` seconds.
+    """
+
+    def __init__(self, size: int = 4, max_uses: int = 50, max_age: float = 1800.0):
+        self.size = size
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self._pool: List[BrowserInstance] = []
+        self._lock = threading.Lock()
+        self._checked_out = 0
+        self._slot_freed = threading.Condition(self._lock)
+
+    def resize(self, size: int) -> None:
+        """Change how many instances may be checked out at once"""
+        with self._lock:
+            self.size = size
+            self._slot_freed.notify_all()
+
+    def reserve(self, count: int) -> None:
+        """Grow the pool so count more instances can be checked out right away"""
+        with self._lock:
+            self.size = max(self.size, self._checked_out + count)
+            self._slot_freed.notify_all()
+
+    def _take_slot(self) -> None:
+        with self._lock:
+            while self._checked_out >= self.size:
+                self._slot_freed.wait()
+            self._checked_out += 1
+
+    def _give_slot(self) -> None:
+        with self._lock:
+            self._checked_out -= 1
+            self._slot_freed.notify()
+
+    def _expired(self, instance: BrowserInstance) -> bool:
+        return (instance.pages_processed >= self.max_uses
+                or time.monotonic() - instance.created_at > self.max_age)
+
+    @staticmethod
+    def _alive(instance: BrowserInstance) -> bool:
+        try:
+            instance.driver.title
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(instance: BrowserInstance) -> None:
+        # A graceful quit spends seconds closing tabs and flushing a profile that is
+        # about to be deleted. Once a template has been captured nothing reads the
+        # profile again, so kill the browser's own processes instead.
+        if PSUTIL_AVAILABLE and instance.pids and _have_profile_template():
+            _terminate_processes(instance.pids, force=True)
+            if isinstance(getattr(instance.driver, "service", None), _SharedService):
+                # The shared chromedriver keeps serving; end the dead browser's session
+                # there too, or it stays registered until chromedriver exits
+                try:
+                    instance.driver.quit()
+                except Exception:
+                    pass
+        else:
+            try:
+                instance.driver.quit()
+                if instance.profile_dir:
+                    _save_profile_template(instance.profile_dir)
+            except Exception as e:
+                logging.warning(f"Error quitting pooled driver: {str(e)}")
+                # quit() failed, so make sure this driver's own processes do not linger
+                _terminate_processes(instance.pids)
+        if instance.remove_profile is not None:
+            # Deleting a profile takes tens of milliseconds; do it off the caller's thread
+            threading.Thread(target=instance.remove_profile, daemon=True).start()
+
+    def acquire(self, key: Tuple, launch: Callable[[], Tuple[Any, Optional[str]]]) -> BrowserInstance:
+        """
+        Check out an idle instance matching key, launching a new one if needed.
+        launch returns the new driver and the profile directory it owns.
+
+        Blocks while ``size`` instances are already checked out.
+        """
+        self._take_slot()
+        try:
+            while True:
+                with self._lock:
+                    instance = next((i for i in self._pool if not i.is_busy and i.key == key), None)
+                    if instance is None:
+                        break
+                    instance.is_busy = True
+                if not self._expired(instance) and self._alive(instance):
+                    return instance
+                self._discard(instance)
+
+            driver, profile_dir = launch()
+            instance = BrowserInstance(driver=driver, key=key, pids=_driver_pids(driver, profile_dir),
+                                       profile_dir=profile_dir)
+            if profile_dir:
+                instance.remove_profile = weakref.finalize(instance, shutil.rmtree, profile_dir, True)
+            with self._lock:
+                self._pool.append(instance)
+            return instance
+        except BaseException:
+            self._give_slot()
+            raise
+
+    def release(self, instance: BrowserInstance) -> None:
+        """Reset an instance's state and return it to the pool, or retire it"""
+        try:
+            keep = not self._expired(instance)
+            if keep:
+                try:
+                    instance.driver.delete_all_cookies()
+                    instance.driver.get("about:blank")
+                except Exception:
+                    keep = False
+
+            if keep:
+                with self._lock:
+                    idle = [i for i in self._pool if not i.is_busy]
+                    # Evict the oldest idle instance once more than size are parked
+                    victim = min(idle, key=lambda i: i.created_at) if len(idle) >= self.size else None
+                    instance.is_busy = False
+                if victim is not None:
+                    self._discard(victim)
+            else:
+                self._discard(instance)
+        finally:
+            self._give_slot()
+
+    def _discard(self, instance: BrowserInstance) -> None:
+        with self._lock:
+            if instance in self._pool:
+                self._pool.remove(instance)
+        self._quit(instance)
+
+    def drain(self) -> None:
+        """Quit every pooled instance"""
+        with self._lock:
+            instances, self._pool = self._pool, []
+        for instance in instances:
+            self._quit(instance)
+
+
+browser_pool = SeleniumBrowserPool(size=int(os.environ.get("TRYLOBYTE_BROWSER_POOL_SIZE", "4")))
+
+
+def drain_browser_pool() -> None:
+    """Quit all pooled Chrome instances and the shared chromedriver; registered to run at interpreter exit"""
+    browser_pool.drain()
+    if _SHARED_SERVICE is not None:
+        _SHARED_SERVICE.shutdown()
+
+
+atexit.register(drain_browser_pool)
+
+
+class SeleniumBrowser(BrowserContextMixin):
     """
     Selenium-based browser implementation for web scraping.
     Supports both regular ChromeDriver and undetected_chromedriver for better bot detection avoidance.
@@ -39,25 +686,33 @@ class SeleniumBrowser(BaseBrowser):
         """Initialize the Selenium browser"""
         super().__init__()
         self.driver = None
-        self.temp_dir = tempfile.mkdtemp()  # Create a temp directory immediately
         self.user_agent = None
         self.proxy = None
         self.headless = False
         self.initialized = False
+        self._instance: Optional[BrowserInstance] = None
+        # Bumped by navigation and by the actions that change the DOM (click, send_keys,
+        # scroll, interact, reset_session); read-only lookups and scripts leave it alone
+        self._nav_counter = 0
+        self._page_source_cache: Optional[Tuple[Tuple[int, bool], str]] = None
+        # WebDriverWait objects for the current driver, keyed by timeout
+        self._waits: Dict[float, WebDriverWait] = {}
+        # requests session carrying this browser's cookies and user agent, for static fetches
+        self._http_session: Optional[requests.Session] = None
+        # Viewport centre where scroll() dispatches wheel events, measured once per driver
+        self._viewport_center: Optional[Tuple[int, int]] = None
     
-    def _generate_user_agent(self) -> str:
-        """Get a random user agent string"""
-        user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/94.0.4606.81 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/94.0.4606.81 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/93.0.4577.82 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/94.0.4606.81 Safari/537.36"
-        ]
-        return random.choice(user_agents)
+    def _generate_user_agent(self, weighted: bool = True) -> str:
+        """Get a random user agent string, favouring newer Chrome versions unless weighted is False"""
+        if weighted:
+            return _UA_RANDOM.choices(_USER_AGENTS, weights=_UA_WEIGHTS)[0]
+        return _UA_RANDOM.choice(_USER_AGENTS)
     
     def initialize(self, headless: bool = False, browser_type: str = "chrome", 
                   chrome_arguments: Optional[Dict[str, str]] = None, 
-                  proxy: Optional[Union[str, Dict[str, str]]] = None) -> bool:
+                  proxy: Optional[Union[str, Dict[str, str]]] = None,
+                  block_resources: bool = False,
+                  undetected: bool = True) -> bool:
         """
         Initialize the Selenium browser.
         
@@ -66,18 +721,15 @@ class SeleniumBrowser(BaseBrowser):
             browser_type: Type of browser to use ('chrome' or 'firefox')
             chrome_arguments: Additional Chrome arguments
             proxy: Proxy configuration (string 'host:port' or dict with 'http'/'https' keys)
+            block_resources: Skip images, fonts, media and trackers (content settings
+                at launch plus CDP request blocking)
+            undetected: Use undetected_chromedriver when it is installed
             
         Returns:
             bool: True if initialization successful
         """
-        # Create a temporary directory if it doesn't exist
-        if not os.path.exists(self.temp_dir):
-            os.makedirs(self.temp_dir, exist_ok=True)
-            
-        # Set up user agent
-        self.user_agent = self._generate_user_agent()
-        
         # Set up proxy if provided
+        self.proxy = proxy
         if proxy:
             chrome_arguments = chrome_arguments or {}
             
@@ -91,11 +743,13 @@ class SeleniumBrowser(BaseBrowser):
                     chrome_arguments["proxy-server"] = proxy["https"]
                     
         # Initialize the browser
-        if browser_type.lower() == "chrome":
-            success = self._initialize_chrome(headless, chrome_arguments)
-        elif browser_type.lower() == "firefox":
-            logging.warning("Firefox not fully implemented yet, using Chrome")
-            success = self._initialize_chrome(headless, chrome_arguments)
+        if browser_type.lower() in ("chrome", "firefox"):
+            if browser_type.lower() == "firefox":
+                logging.warning("Firefox not fully implemented yet, using Chrome")
+            key = (headless, undetected, block_resources, tuple(sorted((chrome_arguments or {}).items())))
+            success = self._acquire_chrome(key, headless, chrome_arguments, undetected, block_resources)
+            if success:
+                self._set_blocked_urls(BLOCKED_RESOURCE_PATTERNS if block_resources else ())
         else:
             logging.error(f"Unsupported browser type: {browser_type}")
             return False
@@ -108,124 +762,361 @@ class SeleniumBrowser(BaseBrowser):
             logging.error("Failed to initialize browser")
             return False
     
-    def _initialize_chrome(self, headless: bool = False, chrome_arguments: Optional[Dict[str, str]] = None) -> bool:
-        """Initialize Chrome browser"""
+    def _acquire_chrome(self, key: Tuple, headless: bool,
+                        chrome_arguments: Optional[Dict[str, str]], undetected: bool = True,
+                        block_media: bool = False) -> bool:
+        """Check out a Chrome instance from the shared pool"""
+        if self._instance is not None:
+            browser_pool.release(self._instance)
+            self._instance = None
         try:
-            options = webdriver.ChromeOptions()
-            
-            # Essential options for stability
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            
+            self._instance = browser_pool.acquire(
+                key, lambda: self._initialize_chrome(headless, chrome_arguments, undetected, block_media))
+        except Exception as e:
+            logging.error(f"Error initializing Chrome: {str(e)}")
+            return False
+        self.driver = self._instance.driver
+        # A fresh launch has just set self.user_agent; a reused driver keeps its own
+        if self._instance.user_agent is None:
+            self._instance.user_agent = self.user_agent
+        self.user_agent = self._instance.user_agent
+        self._waits.clear()
+        self._viewport_center = None
+        return True
+
+    def _set_blocked_urls(self, patterns: Tuple[str, ...]) -> None:
+        """Apply CDP request blocking, skipping the call if the pooled driver already matches"""
+        if self._instance is None or self._instance.blocked_urls == patterns:
+            return
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+            self._instance.blocked_urls = patterns
+        except Exception as e:
+            logging.warning(f"Could not configure request blocking: {str(e)}")
+
+    def _release_driver(self) -> None:
+        """Hand the driver back to the pool (or quit it if it was not pooled)"""
+        if self._instance is not None:
+            browser_pool.release(self._instance)
+        elif self.driver:
+            self.driver.quit()
+        self._instance = None
+
+    def _initialize_chrome(self, headless: bool = False, chrome_arguments: Optional[Dict[str, str]] = None,
+                           undetected: bool = True, block_media: bool = False) -> Tuple[Any, Optional[str]]:
+        """
+        Launch a new Chrome browser and return its driver and the profile directory
+        created for it (None when the caller supplied its own user-data-dir)
+        """
+        if chrome_arguments and chrome_arguments.get("user-data-dir"):
+            return self._launch_chrome(headless, chrome_arguments, undetected, None, block_media), None
+        
+        profile_dir = _new_profile_dir()
+        try:
+            return self._launch_chrome(headless, chrome_arguments, undetected, profile_dir, block_media), profile_dir
+        except Exception:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+            raise
+    
+    def _launch_chrome(self, headless: bool, chrome_arguments: Optional[Dict[str, str]],
+                       undetected: bool, profile_dir: Optional[str], block_media: bool = False) -> Any:
+        """Start Chrome with the given options and return its driver"""
+        options = webdriver.ChromeOptions()
+        if profile_dir:
+            options.add_argument(f"--user-data-dir={profile_dir}")
+        
+        # Return from get() at DOMContentLoaded instead of waiting for every subresource
+        options.page_load_strategy = "eager"
+        
+        # Essential options for stability and memory use
+        for arg in CONTAINER_SAFE_ARGS:
+            options.add_argument(arg)
+        
+        if headless:
+            # headless=new rasterizes on the GPU when one is available, which is much
+            # faster than SwiftShader; the visible-window workarounds below are not needed
+            options.add_argument("--enable-gpu-rasterization")
+            options.add_argument("--enable-zero-copy")
+        else:
             # Advanced Linux-specific rendering fixes for transparency/freezing issues
             options.add_argument("--disable-gpu")
             options.add_argument("--disable-accelerated-2d-canvas")
             options.add_argument("--disable-accelerated-video-decode")
             options.add_argument("--disable-webgl")
-            options.add_argument("--disable-features=UseOzonePlatform")
-            options.add_argument("--disable-features=VizDisplayCompositor")
             options.add_argument("--ignore-gpu-blocklist")
             
-            # Force compositing mode for better visibility
-            options.add_argument("--force-device-scale-factor=1")
-            options.add_argument("--force-color-profile=srgb")
-            
             # Advanced compositing fixes for Linux transparency
             options.add_argument("--in-process-gpu")
             options.add_argument("--disable-gpu-compositing")
             options.add_argument("--disable-gpu-sandbox")
-            options.add_argument("--disable-software-rasterizer")
             
             # Enable software rendering mode - often helps with Linux display issues
             options.add_argument("--use-gl=swiftshader")
             options.add_argument("--use-angle=swangle")
-            
-            # Window settings - explicit and forced
-            options.add_argument("--window-size=1920,1080")
-            options.add_argument("--window-position=0,0")
-            options.add_argument("--start-maximized")
-            
-            # User agent
-            options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36")
-            
-            # Disable automation flags
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option("useAutomationExtension", False)
-            
-            # Disable unnecessary extensions/features for better performance
-            options.add_argument("--disable-extensions")
-            options.add_argument("--disable-notifications")
-            options.add_argument("--disable-popup-blocking")
-            
-            # Add additional chrome arguments if provided
-            if chrome_arguments:
-                for key, value in chrome_arguments.items():
-                    if value:
-                        options.add_argument(f"--{key}={value}")
-                    else:
-                        options.add_argument(f"--{key}")
-            
-            # Try to use undetected_chromedriver if available
+        
+        # Force compositing mode for better visibility
+        options.add_argument("--force-device-scale-factor=1")
+        options.add_argument("--force-color-profile=srgb")
+        
+        # Window settings - explicit and forced
+        options.add_argument("--window-size=1920,1080")
+        options.add_argument("--window-position=0,0")
+        options.add_argument("--start-maximized")
+        
+        # User agent, chosen once per launch since it is fixed for the life of the browser
+        chrome_arguments = dict(chrome_arguments or {})
+        self.user_agent = chrome_arguments.pop("user-agent", None) or self._generate_user_agent()
+        options.add_argument(f"--user-agent={self.user_agent}")
+        
+        # Disable automation flags
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option("useAutomationExtension", False)
+        
+        # Content settings: never prompt for notifications, and skip images,
+        # fonts and plugins entirely when only the markup is needed
+        prefs = {"profile.default_content_setting_values.notifications": 2}
+        if block_media:
+            prefs.update(_MEDIA_BLOCKING_PREFS)
+        options.add_experimental_option("prefs", prefs)
+        
+        # Disable unnecessary features for better performance
+        options.add_argument("--disable-notifications")
+        options.add_argument("--disable-popup-blocking")
+        
+        # Add additional chrome arguments if provided
+        disabled_features = list(_DISABLED_FEATURES)
+        if chrome_arguments:
+            for key, value in chrome_arguments.items():
+                if key == "disable-features":
+                    disabled_features.extend(f for f in value.split(",") if f and f not in disabled_features)
+                elif value:
+                    options.add_argument(f"--{key}={value}")
+                else:
+                    options.add_argument(f"--{key}")
+        
+        options.add_argument(f"--disable-features={','.join(disabled_features)}")
+        
+        if headless:
+            options.add_argument("--headless=new")
+        
+        # Try to use undetected_chromedriver if requested and available
+        driver = None
+        uc = _load_uc() if undetected else None
+        if uc is not None:
+            cached_driver = _UC_DRIVER_PATH
             try:
-                if headless:
-                    options.add_argument("--headless=new")
-                
-                self.driver = uc.Chrome(
+                driver = uc.Chrome(
                     options=options,
-                    driver_executable_path=None,
-                    version_main=None  # Auto-detect Chrome version
+                    driver_executable_path=cached_driver,
+                    version_main=_UC_VERSION_MAIN  # None auto-detects the Chrome version
                 )
                 logging.info("Using undetected-chromedriver for better anti-bot detection")
+                if cached_driver is None:
+                    _remember_uc_driver(driver)
             except Exception as e:
-                logging.warning("undetected_chromedriver not available. Using standard ChromeDriver.")
-                
-                # Fallback to standard Chrome
-                options.add_argument("--disable-blink-features=AutomationControlled")
-                
-                if headless:
-                    options.add_argument("--headless=new")
-                    
-                service = Service()
-                self.driver = webdriver.Chrome(service=service, options=options)
+                if cached_driver is not None:
+                    _forget_uc_driver()
+                logging.warning(f"undetected_chromedriver failed to start ({str(e)}). Using standard ChromeDriver.")
+        
+        if driver is None:
+            # Fallback to standard Chrome
+            options.add_argument("--disable-blink-features=AutomationControlled")
             
-            # Explicitly set window size for better visualization
-            if not headless:
-                self.driver.maximize_window()
-                self.driver.set_window_position(0, 0)  # Position window at top-left corner
+            driver = webdriver.Chrome(service=_get_service(), options=options)
+        
+        widen_executor_pool(driver)
+        
+        # Explicitly set window size for better visualization
+        if not headless:
+            driver.maximize_window()
+            driver.set_window_position(0, 0)  # Position window at top-left corner
+        
+        # Set page load timeout (eager loads reach DOMContentLoaded well within this)
+        driver.set_page_load_timeout(_PAGE_LOAD_TIMEOUT)
+        
+        return driver
+    
+    def navigate(self, url: str, timeout: Optional[int] = None, wait_full: bool = False) -> bool:
+        """
+        Navigate to the specified URL.
+        
+        Returns at DOMContentLoaded (eager page loads) unless wait_full is set,
+        in which case it also waits, up to timeout, for the window load event.
+        timeout defaults to the driver's current page load timeout.
+        """
+        if not self.initialized or not self.driver:
+            logging.error("Browser not initialized. Call initialize() first.")
+            return False
+        
+        self._nav_counter += 1
+        try:
+            if timeout is None:
+                timeout = (self._instance and self._instance.page_load_timeout) or _PAGE_LOAD_TIMEOUT
+            elif self._instance is None or self._instance.page_load_timeout != timeout:
+                self.driver.set_page_load_timeout(timeout)
+                if self._instance is not None:
+                    self._instance.page_load_timeout = timeout
             
-            # Set page load timeout
-            self.driver.set_page_load_timeout(60)
+            try:
+                self.driver.get(url)
+            except TimeoutException:
+                # The document is usable even if some subresources are still loading
+                logging.warning(f"Page load timed out after {timeout}s, using partial page: {url}")
+                self.driver.execute_script("window.stop();")
+            else:
+                if wait_full:
+                    with self._script_timeout(timeout + 1):
+                        loaded = self.driver.execute_async_script(_WAIT_FOR_LOAD_JS, int(timeout * 1000))
+                    if not loaded:
+                        logging.warning(f"Page did not finish loading within {timeout}s: {url}")
             
+            if self._instance is not None:
+                self._instance.pages_processed += 1
             return True
-            
         except Exception as e:
-            logging.error(f"Error initializing Chrome: {str(e)}")
+            logging.error(f"Error navigating to {url}: {str(e)}")
             return False
     
-    def navigate(self, url: str, timeout: int = 30) -> bool:
-        """Navigate to the specified URL"""
-        if not self.initialized or not self.driver:
-            logging.error("Browser not initialized. Call initialize() first.")
+    def session_alive(self) -> bool:
+        """Check whether the WebDriver session still responds"""
+        if not self.driver:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+    
+    def reset_session(self, keep_cookies: bool = False, clear_cache: bool = False) -> bool:
+        """
+        Return the browser to a blank page without quitting it, so Chrome's DNS,
+        connection and compiled-code caches carry over to the next scrape.
+        
+        Args:
+            keep_cookies: Keep the cookies set by previous pages
+            clear_cache: Also clear the HTTP cache
+            
+        Returns:
+            bool: True if the session was reset, False if the driver is unusable
+        """
+        if not self.driver:
             return False
         
+        self._nav_counter += 1
         try:
-            self.driver.get(url)
+            self.driver.execute_script("window.stop();")
+            
+            # Close any tabs opened by the previous page
+            handles = self.driver.window_handles
+            for handle in handles[1:]:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            self.driver.switch_to.window(handles[0])
+            
+            if clear_cache:
+                self.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            if not keep_cookies:
+                self.driver.delete_all_cookies()
+                self._http_session = None
+            self.driver.get("about:blank")
             return True
-        except Exception as e:
-            logging.error(f"Error navigating to {url}: {str(e)}")
+        except WebDriverException as e:
+            logging.warning(f"Error resetting browser session: {str(e)}")
             return False
     
-    def get_page_source(self) -> str:
-        """Get the current page source"""
+    def _static_session(self) -> requests.Session:
+        """Build (once per browser session) a requests session with the browser's cookies, user agent and proxy"""
+        if self._http_session is None:
+            session = requests.Session()
+            session.headers["User-Agent"] = self.user_agent or self._generate_user_agent()
+            for cookie in self.driver.get_cookies():
+                session.cookies.set(cookie["name"], cookie["value"],
+                                    domain=cookie.get("domain"), path=cookie.get("path", "/"))
+            # One proxy for both schemes, chosen the same way as Chrome's --proxy-server
+            proxy_url = None
+            if isinstance(self.proxy, str):
+                proxy_url = self.proxy
+            elif isinstance(self.proxy, dict) and not self.proxy.get("direct", False):
+                proxy_url = self.proxy.get("http") or self.proxy.get("https")
+            if proxy_url:
+                if "://" not in proxy_url:
+                    proxy_url = f"http://{proxy_url}"
+                session.proxies = {"http": proxy_url, "https": proxy_url}
+            self._http_session = session
+        return self._http_session
+    
+    def _fetch_static_source(self) -> Optional[str]:
+        """Fetch the current URL over plain HTTP; None if the page needs the browser"""
+        try:
+            response = self._static_session().get(self.driver.current_url, timeout=10)
+        except Exception as e:
+            logging.debug(f"Static fetch failed, using the browser DOM: {str(e)}")
+            return None
+        if response.status_code != 200 or any(marker in response.text for marker in _CHALLENGE_MARKERS):
+            return None
+        return response.text
+    
+    def get_page_source(self, static_ok: bool = False) -> str:
+        """
+        Get the current page source.
+        
+        Args:
+            static_ok: The page does not need JavaScript, so fetch its URL over plain
+                HTTP (with the browser's cookies and user agent) instead of serializing
+                the live DOM. Falls back to the browser on errors or bot challenges.
+        """
         if not self.initialized or not self.driver:
             logging.error("Browser not initialized. Call initialize() first.")
             return ""
         
+        # Static and live-DOM sources of the same page differ, so they are cached apart
+        cache_key = (self._nav_counter, static_ok)
+        cache = self._page_source_cache
+        if cache and cache[0] == cache_key:
+            return cache[1]
+        
+        if static_ok:
+            source = self._fetch_static_source()
+            if source is not None:
+                self._page_source_cache = (cache_key, source)
+                return source
+        
+        try:
+            # Read outerHTML over CDP, which skips WebDriver's page_source command
+            result = self.driver.execute_cdp_cmd(
+                "Runtime.evaluate",
+                {"expression": "document.documentElement.outerHTML", "returnByValue": True}
+            )
+            source = result["result"]["value"]
+        except Exception:
+            try:
+                source = self.driver.page_source
+            except Exception as e:
+                logging.error(f"Error getting page source: {str(e)}")
+                return ""
+        
+        self._page_source_cache = ((self._nav_counter, False), source)
+        return source
+    
+    def get_page_source_gzipped(self) -> bytes:
+        """
+        Get the current page source gzip-compressed inside the browser, so large
+        pages cross the chromedriver connection in a fraction of the size.
+        
+        Returns:
+            bytes: gzip data (decompress with gzip.decompress), empty on failure
+        """
+        if not self.initialized or not self.driver:
+            logging.error("Browser not initialized. Call initialize() first.")
+            return b""
+        
         try:
-            return self.driver.page_source
+            encoded = self.driver.execute_async_script(_GZIP_PAGE_SOURCE_JS)
         except Exception as e:
-            logging.error(f"Error getting page source: {str(e)}")
-            return ""
+            logging.error(f"Error getting compressed page source: {str(e)}")
+            return b""
+        return base64.b64decode(encoded) if encoded else b""
     
     def execute_script(self, script: str, *args) -> Any:
         """
@@ -241,13 +1132,150 @@ class SeleniumBrowser(BaseBrowser):
         if not self.driver:
             logging.error("Browser not initialized")
             return None
-            
+        
         try:
             return self.driver.execute_script(script, *args)
         except Exception as e:
             logging.error(f"Error executing script: {str(e)}")
             return None
     
+    def bulk_extract(self, spec: Dict[str, Dict[str, str]]) -> Dict[str, List[Any]]:
+        """
+        Read text or attributes for several CSS selectors in a single round trip.
+        
+        Args:
+            spec: Mapping of result key to {"selector": css, "attr": optional attribute};
+                without "attr" the element text is returned
+            
+        Returns:
+            Mapping of result key to the list of values of all matching elements
+        """
+        result = self.execute_script(_BULK_EXTRACT_JS, spec)
+        return result if isinstance(result, dict) else {key: [] for key in spec}
+    
+    def interact(self, steps: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Run a sequence of element operations inside the page in a single round trip,
+        e.g. [{"op": "wait", "sel": ".btn"}, {"op": "click"}, {"op": "wait", "sel": ".result"}, {"op": "text"}].
+        
+        Args:
+            steps: Operations applied in order, each acting on the element from the
+                latest "find" or "wait" step:
+                {"op": "find", "sel": css}, {"op": "wait", "sel": css, "timeout": seconds (default 10)},
+                {"op": "scroll"}, {"op": "click"}, {"op": "text"}, {"op": "attr", "name": attribute}
+            
+        Returns:
+            One result per step that ran (the element for find/wait, True for scroll/click,
+            the value for text/attr); the plan stops after a step that finds no element.
+            Empty if the script failed.
+        """
+        self._nav_counter += 1
+        wait_seconds = 0.0
+        plan = []
+        for step in steps:
+            if step.get("op") == "wait":
+                timeout = step.get("timeout", 10)
+                wait_seconds += timeout
+                step = {**step, "timeout": int(timeout * 1000)}
+            plan.append(step)
+        try:
+            with self._script_timeout(wait_seconds + 1):
+                result = self.driver.execute_async_script(_INTERACT_JS, plan)
+        except Exception as e:
+            logging.error(f"Error running interaction plan: {str(e)}")
+            return []
+        return result if isinstance(result, list) else []
+    
+    def _wait(self, timeout: float) -> WebDriverWait:
+        """Get the (reused) WebDriverWait for this driver and timeout"""
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = WebDriverWait(self.driver, timeout, poll_frequency=0.2)
+        return wait
+    
+    def batch_extract(self, selector: str, attributes: Tuple[str, ...] = (),
+                      get_text: bool = True) -> List[Dict[str, Any]]:
+        """
+        Read attributes (and optionally text) of every element matching a CSS
+        selector in a single round trip.
+        
+        Args:
+            selector: CSS selector
+            attributes: Attribute names to read from each element
+            get_text: Include each element's text under the "__text" key
+            
+        Returns:
+            One dict per matching element, in document order
+        """
+        result = self.execute_script(_BATCH_EXTRACT_JS, selector, list(attributes), get_text)
+        return result if isinstance(result, list) else []
+    
+    def scroll_until_loaded(self, container_selector: str, item_selector: str,
+                            max_items: int = 0, pause: float = 1.5,
+                            stable_rounds: int = 3, timeout: float = 300) -> Optional[int]:
+        """
+        Keep scrolling a lazily loading list until it stops growing, entirely
+        inside the page, so the whole loop costs one round trip.
+        
+        Args:
+            container_selector: CSS selector of the scrollable container
+            item_selector: CSS selector of the loaded items
+            max_items: Stop once this many items are loaded (0 = no limit)
+            pause: Seconds to wait after each scroll
+            stable_rounds: Stop after this many scrolls without new items
+            timeout: Give up scrolling after this many seconds
+            
+        Returns:
+            Number of items loaded, or None if the container was missing or the script failed
+        """
+        self._nav_counter += 1
+        try:
+            with self._script_timeout(timeout + 5):
+                return self.driver.execute_async_script(
+                    SCROLL_UNTIL_LOADED_JS, container_selector, item_selector,
+                    max_items, int(pause * 1000), stable_rounds, int(timeout * 1000)
+                )
+        except Exception as e:
+            logging.error(f"Error scrolling results: {str(e)}")
+            return None
+    
+    @contextlib.contextmanager
+    def _script_timeout(self, seconds: float):
+        """
+        Let async scripts in the block run for at least seconds, then go back to the
+        default timeout so one long call doesn't leave a hung script minutes to
+        stall later ones on the same (pooled) driver
+        """
+        if seconds <= _DEFAULT_SCRIPT_TIMEOUT:
+            yield
+            return
+        
+        self.driver.set_script_timeout(seconds)
+        try:
+            yield
+        finally:
+            try:
+                self.driver.set_script_timeout(_DEFAULT_SCRIPT_TIMEOUT)
+            except Exception as e:
+                logging.debug(f"Could not restore the script timeout: {str(e)}")
+    
+    def _wait_for_element_cdp(self, selector: str, timeout: float) -> Tuple[bool, Optional[Any]]:
+        """
+        Wait for a CSS selector with a MutationObserver inside the page, which
+        reacts as soon as the element is inserted instead of polling.
+        
+        Returns:
+            (True, element or None on timeout) if the in-page wait ran,
+            (False, None) if it could not run and the caller should poll instead
+        """
+        try:
+            # The async script must be allowed to outlive the wait itself
+            with self._script_timeout(timeout + 1):
+                return True, self.driver.execute_async_script(_WAIT_FOR_SELECTOR_JS, selector, int(timeout * 1000))
+        except Exception as e:
+            logging.debug(f"In-page wait for {selector} failed, polling instead: {str(e)}")
+            return False, None
+    
     def wait_for_element(self, selector: str, by: str = "css", timeout: int = 10) -> Optional[Any]:
         """
         Wait for an element to be present on the page and return it.
@@ -265,20 +1293,16 @@ class SeleniumBrowser(BaseBrowser):
             return None
         
         try:
-            by_map = {
-                "css": By.CSS_SELECTOR,
-                "xpath": By.XPATH,
-                "id": By.ID,
-                "class": By.CLASS_NAME,
-                "name": By.NAME,
-                "tag": By.TAG_NAME,
-                "link_text": By.LINK_TEXT,
-                "partial_link_text": By.PARTIAL_LINK_TEXT
-            }
+            by_type = _resolve_by(by)
             
-            by_type = by_map.get(by.lower(), By.CSS_SELECTOR)
+            if by_type == By.CSS_SELECTOR:
+                found, element = self._wait_for_element_cdp(selector, timeout)
+                if found:
+                    if element is None:
+                        logging.warning(f"Timeout waiting for element: {selector}")
+                    return element
             
-            element = WebDriverWait(self.driver, timeout).until(
+            element = self._wait(timeout).until(
                 EC.presence_of_element_located((by_type, selector))
             )
             return element
@@ -290,26 +1314,25 @@ class SeleniumBrowser(BaseBrowser):
             logging.error(f"Error waiting for element: {str(e)}")
             return None
     
-    def cleanup(self) -> None:
-        """Clean up resources"""
-        try:
-            if self.driver:
-                self.driver.quit()
-        except Exception as e:
-            logging.warning(f"Error quitting driver: {str(e)}")
-        
-        # Clean up temporary directory
+    def _shutdown(self) -> None:
+        """Hand the driver back and mark the browser closed; safe to call more than once"""
         try:
-            if self.temp_dir and os.path.exists(self.temp_dir):
-                import shutil
-                shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self._release_driver()
         except Exception as e:
-            logging.warning(f"Error cleaning up temporary directory: {str(e)}")
-        
-        self.initialized = False
-        self.driver = None
+            logging.warning(f"Error closing browser: {str(e)}")
+        finally:
+            self.driver = None
+            self.initialized = False
+            self._page_source_cache = None
+            self._http_session = None
+            self._waits.clear()
+            self._viewport_center = None
+    
+    def cleanup(self) -> None:
+        """Clean up resources"""
+        self._shutdown()
 
-    # Implement required abstract methods
+    # Remaining BaseBrowser interface methods
     def click(self, element_or_selector: Any) -> bool:
         """
         Click on an element or selector.
@@ -320,6 +1343,7 @@ class SeleniumBrowser(BaseBrowser):
         Returns:
             bool: True if click was successful
         """
+        self._nav_counter += 1
         try:
             if isinstance(element_or_selector, str):
                 element = self.find_element(element_or_selector)
@@ -328,12 +1352,13 @@ class SeleniumBrowser(BaseBrowser):
             else:
                 element = element_or_selector
                 
-            # Try to scroll element into view before clicking
+            # Scroll the element into view and let one frame paint, in a single round trip
             try:
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                time.sleep(0.5)  # Small delay after scrolling
+                in_view = self.driver.execute_async_script(_SCROLL_INTO_VIEW_JS, element)
             except Exception:
-                pass
+                in_view = False
+            if not in_view:
+                time.sleep(0.1)
                 
             element.click()
             return True
@@ -343,23 +1368,7 @@ class SeleniumBrowser(BaseBrowser):
     
     def close(self) -> None:
         """Close the browser and clean up resources"""
-        try:
-            if self.driver:
-                self.driver.quit()
-        except Exception as e:
-            logging.error(f"Error closing browser: {str(e)}")
-        finally:
-            self.driver = None
-            self.initialized = False
-            
-            # Clean up temporary directory
-            if self.temp_dir and os.path.exists(self.temp_dir):
-                try:
-                    import shutil
-                    shutil.rmtree(self.temp_dir, ignore_errors=True)
-                except Exception:
-                    pass
-                self.temp_dir = None
+        self._shutdown()
     
     def find_element(self, selector: str, by_type: str = "css") -> Optional[Any]:
         """
@@ -376,19 +1385,7 @@ class SeleniumBrowser(BaseBrowser):
             return None
             
         try:
-            by_map = {
-                "css": By.CSS_SELECTOR,
-                "xpath": By.XPATH,
-                "id": By.ID,
-                "class": By.CLASS_NAME,
-                "class_name": By.CLASS_NAME,
-                "name": By.NAME,
-                "tag": By.TAG_NAME,
-                "link_text": By.LINK_TEXT,
-                "partial_link_text": By.PARTIAL_LINK_TEXT
-            }
-            
-            by_method = by_map.get(by_type.lower(), By.CSS_SELECTOR)
+            by_method = _resolve_by(by_type)
             element = self.driver.find_element(by_method, selector)
             return element
         except Exception as e:
@@ -410,19 +1407,7 @@ class SeleniumBrowser(BaseBrowser):
             return []
             
         try:
-            by_map = {
-                "css": By.CSS_SELECTOR,
-                "xpath": By.XPATH,
-                "id": By.ID,
-                "class": By.CLASS_NAME,
-                "class_name": By.CLASS_NAME,
-                "name": By.NAME,
-                "tag": By.TAG_NAME,
-                "link_text": By.LINK_TEXT,
-                "partial_link_text": By.PARTIAL_LINK_TEXT
-            }
-            
-            by_method = by_map.get(by_type.lower(), By.CSS_SELECTOR)
+            by_method = _resolve_by(by_type)
             elements = self.driver.find_elements(by_method, selector)
             return elements
         except Exception as e:
@@ -484,19 +1469,27 @@ class SeleniumBrowser(BaseBrowser):
         """
         if not self.driver:
             return
-            
+        
+        self._nav_counter += 1
+        direction = direction.lower()
+        deltas = {"down": (0, amount), "up": (0, -amount), "right": (amount, 0), "left": (-amount, 0)}
         try:
-            if direction.lower() == "down":
-                self.driver.execute_script(f"window.scrollBy(0, {amount});")
-            elif direction.lower() == "up":
-                self.driver.execute_script(f"window.scrollBy(0, -{amount});")
-            elif direction.lower() == "right":
-                self.driver.execute_script(f"window.scrollBy({amount}, 0);")
-            elif direction.lower() == "left":
-                self.driver.execute_script(f"window.scrollBy(-{amount}, 0);")
-            elif direction.lower() == "bottom":
+            if direction in deltas:
+                dx, dy = deltas[direction]
+                try:
+                    # A real wheel event at the viewport centre, dispatched straight through DevTools
+                    if self._viewport_center is None:
+                        width, height = self.driver.execute_script("return [window.innerWidth, window.innerHeight];")
+                        self._viewport_center = (width // 2, height // 2)
+                    x, y = self._viewport_center
+                    self.driver.execute_cdp_cmd("Input.dispatchMouseEvent", {
+                        "type": "mouseWheel", "x": x, "y": y, "deltaX": dx, "deltaY": dy
+                    })
+                except Exception:
+                    self.driver.execute_script("window.scrollBy(arguments[0], arguments[1]);", dx, dy)
+            elif direction == "bottom":
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            elif direction.lower() == "top":
+            elif direction == "top":
                 self.driver.execute_script("window.scrollTo(0, 0);")
         except Exception as e:
             logging.error(f"Error scrolling: {str(e)}")
@@ -512,15 +1505,116 @@ class SeleniumBrowser(BaseBrowser):
         Returns:
             bool: True if successful
         """
+        self._nav_counter += 1
         try:
             element = element_or_selector
             if isinstance(element_or_selector, str):
                 element = self.find_element(element_or_selector)
                 
-            if element:
-                element.send_keys(text)
-                return True
-            return False
+            if not element:
+                return False
+            
+            # Plain text goes in with one CDP call; newlines and Selenium Keys
+            # (private-use code points) still need real key events
+            if text and not _SPECIAL_KEYS_RE.search(text):
+                try:
+                    self.driver.execute_script("arguments[0].focus();", element)
+                    self.driver.execute_cdp_cmd("Input.insertText", {"text": text})
+                    return True
+                except Exception:
+                    pass
+            
+            element.send_keys(text)
+            return True
         except Exception as e:
             logging.error(f"Error sending keys: {str(e)}")
             return False
+
+
+class BrowserFarm:
+    """
+    A fixed set of SeleniumBrowser instances fed from a shared work queue, for
+    loading many URLs in parallel from asyncio code. Each browser takes the next
+    URL as soon as it is free, so slow pages do not hold up the rest.
+    """
+
+    def __init__(self, size: int = 4, **browser_options: Any):
+        """
+        Initialize the farm.
+
+        Args:
+            size: Number of browsers (and pages loading at once)
+            **browser_options: Passed to SeleniumBrowser.initialize (defaults to headless)
+        """
+        self.size = size
+        self.browser_options = {"headless": True, **browser_options}
+        self._browsers: List[SeleniumBrowser] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def initialize(self) -> bool:
+        """Launch the browsers; returns True if at least one started"""
+        # Slots held by other browsers don't count towards the farm's
+        browser_pool.reserve(self.size)
+        self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="browser-farm")
+        # Browsers launch concurrently; the failed ones come back as None
+        for browser in self._executor.map(self._launch, range(self.size)):
+            if browser is not None:
+                self._browsers.append(browser)
+        if not self._browsers:
+            logging.error("Browser farm could not start any browsers")
+            self.close()
+            return False
+        return True
+
+    def _launch(self, _: int) -> Optional[SeleniumBrowser]:
+        browser = SeleniumBrowser()
+        try:
+            if browser.initialize(**self.browser_options):
+                return browser
+        except Exception as e:
+            logging.error(f"Browser farm launch failed: {str(e)}")
+        browser.cleanup()
+        return None
+
+    @staticmethod
+    def _load(browser: SeleniumBrowser, url: str, timeout: int) -> str:
+        if not browser.navigate(url, timeout):
+            return ""
+        return browser.get_page_source()
+
+    async def fetch_all(self, urls: List[str], timeout: int = 30) -> List[str]:
+        """
+        Load several URLs across the farm's browsers.
+
+        Args:
+            urls: URLs to load
+            timeout: Per-page navigation timeout in seconds
+
+        Returns:
+            Page sources in the same order as urls ("" for failed pages)
+        """
+        if not self._browsers:
+            raise RuntimeError("Browser farm not initialized. Call initialize() first.")
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in enumerate(urls):
+            queue.put_nowait(item)
+        results = [""] * len(urls)
+
+        async def worker(browser: SeleniumBrowser) -> None:
+            while not queue.empty():
+                index, url = queue.get_nowait()
+                results[index] = await loop.run_in_executor(self._executor, self._load, browser, url, timeout)
+
+        await asyncio.gather(*(worker(browser) for browser in self._browsers))
+        return results
+
+    def close(self) -> None:
+        """Hand every browser back to the pool"""
+        for browser in self._browsers:
+            browser.cleanup()
+        self._browsers.clear()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
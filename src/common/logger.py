@@ -1,3 +1,4 @@
+import os
 import time
 import sys
 from typing import Any, Optional
@@ -16,6 +17,42 @@ RED = "\033[31m"
 RESET = "\033[0m"
 BOLD = "\033[1m"
 
+# Colour only helps on a terminal; NO_COLOR and FORCE_COLOR override the detection
+if os.environ.get("NO_COLOR") or (not os.environ.get("FORCE_COLOR") and not sys.stdout.isatty()):
+    NEON_GREEN = INFO_CYAN = WARNING_YELLOW = ALERT_RED = SUCCESS_GREEN = ""
+    GREEN = BLUE = CYAN = YELLOW = RED = RESET = BOLD = ""
+
+# Per-type style prefixes, built once
+_SYS_PFX = f"{BLUE}{BOLD}"
+_INFO_PFX = CYAN
+_SUCCESS_PFX = f"{GREEN}{BOLD}"
+_WARN_PFX = YELLOW
+_ERR_PFX = f"{RED}{BOLD}"
+
+# Message levels; messages below the minimum are dropped before any formatting
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+_min_level = INFO
+
+def set_min_level(level: int) -> None:
+    """
+    Set the minimum level of messages that are printed.
+    
+    Args:
+        level: One of DEBUG, INFO, WARNING, ERROR
+    """
+    global _min_level
+    _min_level = level
+
+def is_enabled(level: int) -> bool:
+    """Return True if messages at the given level are printed."""
+    return level >= _min_level
+
+# Last formatted timestamp as (epoch second, string); swapped as a whole so threads never see a torn pair
+_ts_cache = (0, "")
+
 def print_with_typing_effect(message: str, delay: float = 0.02, color: str = RESET) -> None:
     """
     Print text with a typing effect.
@@ -25,11 +62,17 @@ def print_with_typing_effect(message: str, delay: float = 0.02, color: str = RES
         delay: Delay between characters in seconds
         color: ANSI color code to use
     """
+    # Nobody watches the animation when output is redirected, so write it in one go
+    if delay <= 0 or not sys.stdout.isatty():
+        sys.stdout.write(f"{color}{message}{RESET}\n")
+        return
+    
+    sys.stdout.write(color)
     for char in message:
-        sys.stdout.write(f"{color}{char}{RESET}")
+        sys.stdout.write(char)
         sys.stdout.flush()
         time.sleep(delay)
-    sys.stdout.write("\n")
+    sys.stdout.write(f"{RESET}\n")
 
 def format_message(message_type: str, message: Any) -> str:
     """
@@ -42,7 +85,12 @@ def format_message(message_type: str, message: Any) -> str:
     Returns:
         Formatted message string
     """
-    timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+    global _ts_cache
+    now = int(time.time())
+    second, timestamp = _ts_cache
+    if now != second:
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+        _ts_cache = (now, timestamp)
     return f"[{timestamp}] {message_type}: {message}"
 
 def print_message(message: Any, message_type: str = "INFO", color: str = RESET, 
@@ -64,93 +112,123 @@ def print_message(message: Any, message_type: str = "INFO", color: str = RESET,
     else:
         print(f"{color}{formatted}{RESET}")
 
-def print_system_message(message: Any, typing_effect: bool = False) -> None:
+def print_system_message(message: Any, *args: Any, typing_effect: bool = False, level: int = INFO) -> None:
     """
     Print a system message in blue.
     
     Args:
         message: Message to print
+        *args: Values interpolated into message with %-formatting
         typing_effect: Whether to use typing effect
+        level: Message level, checked before any formatting
     """
+    if not is_enabled(level):
+        return
+    if args:
+        message = message % args
+    
     if typing_effect:
         print_with_typing_effect(format_message("SYSTEM", message), color=BLUE)
     else:
-        formatted = format_message("SYSTEM", message)
-        print(f"{BLUE}{BOLD}{formatted}{RESET}")
+        print(_SYS_PFX, format_message("SYSTEM", message), RESET, sep="")
 
-def print_info_message(message: Any, typing_effect: bool = False) -> None:
+def print_info_message(message: Any, *args: Any, typing_effect: bool = False, level: int = INFO) -> None:
     """
     Print an info message in cyan.
     
     Args:
         message: Message to print
+        *args: Values interpolated into message with %-formatting
         typing_effect: Whether to use typing effect
+        level: Message level, checked before any formatting
     """
+    if not is_enabled(level):
+        return
+    if args:
+        message = message % args
+    
     if typing_effect:
         print_with_typing_effect(format_message("INFO", message), color=CYAN)
     else:
-        formatted = format_message("INFO", message)
-        print(f"{CYAN}{formatted}{RESET}")
+        print(_INFO_PFX, format_message("INFO", message), RESET, sep="")
 
-def print_success_message(message: Any, typing_effect: bool = False) -> None:
+def print_success_message(message: Any, *args: Any, typing_effect: bool = False, level: int = INFO) -> None:
     """
     Print a success message in green.
     
     Args:
         message: Message to print
+        *args: Values interpolated into message with %-formatting
         typing_effect: Whether to use typing effect
+        level: Message level, checked before any formatting
     """
+    if not is_enabled(level):
+        return
+    if args:
+        message = message % args
+    
     if typing_effect:
         print_with_typing_effect(format_message("SUCCESS", message), color=GREEN)
     else:
-        formatted = format_message("SUCCESS", message)
-        print(f"{GREEN}{BOLD}{formatted}{RESET}")
+        print(_SUCCESS_PFX, format_message("SUCCESS", message), RESET, sep="")
 
-def print_warning_message(message: Any, typing_effect: bool = False) -> None:
+def print_warning_message(message: Any, *args: Any, typing_effect: bool = False, level: int = WARNING) -> None:
     """
     Print a warning message in yellow.
     
     Args:
         message: Message to print
+        *args: Values interpolated into message with %-formatting
         typing_effect: Whether to use typing effect
+        level: Message level, checked before any formatting
     """
+    if not is_enabled(level):
+        return
+    if args:
+        message = message % args
+    
     if typing_effect:
         print_with_typing_effect(format_message("WARNING", message), color=YELLOW)
     else:
-        formatted = format_message("WARNING", message)
-        print(f"{YELLOW}{formatted}{RESET}")
+        print(_WARN_PFX, format_message("WARNING", message), RESET, sep="")
 
-def print_error_message(message: Any, typing_effect: bool = False) -> None:
+def print_error_message(message: Any, *args: Any, typing_effect: bool = False, level: int = ERROR) -> None:
     """
     Print an error message in red.
     
     Args:
         message: Message to print
+        *args: Values interpolated into message with %-formatting
         typing_effect: Whether to use typing effect
+        level: Message level, checked before any formatting
     """
+    if not is_enabled(level):
+        return
+    if args:
+        message = message % args
+    
     if typing_effect:
         print_with_typing_effect(format_message("ERROR", message), color=RED)
     else:
-        formatted = format_message("ERROR", message)
-        print(f"{RED}{BOLD}{formatted}{RESET}")
+        print(_ERR_PFX, format_message("ERROR", message), RESET, sep="")
 
 # Shorthand functions without formatting, for use in other functions
 def system_message(message: str) -> str:
     """Return a system message string with color formatting."""
-    return f"{BLUE}{BOLD}{message}{RESET}"
+    return f"{_SYS_PFX}{message}{RESET}"
 
 def info_message(message: str) -> str:
     """Return an info message string with color formatting."""
-    return f"{CYAN}{message}{RESET}"
+    return f"{_INFO_PFX}{message}{RESET}"
 
 def success_message(message: str) -> str:
     """Return a success message string with color formatting."""
-    return f"{GREEN}{BOLD}{message}{RESET}"
+    return f"{_SUCCESS_PFX}{message}{RESET}"
 
 def warning_message(message: str) -> str:
     """Return a warning message string with color formatting."""
-    return f"{YELLOW}{message}{RESET}"
+    return f"{_WARN_PFX}{message}{RESET}"
 
 def error_message(message: str) -> str:
     """Return an error message string with color formatting."""
-    return f"{RED}{BOLD}{message}{RESET}"
+    return f"{_ERR_PFX}{message}{RESET}"
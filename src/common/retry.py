@@ -0,0 +1,53 @@
+"""
+Retry helpers shared by the scrapers and the error handler.
+"""
+import time
+import random
+import functools
+from typing import Any, Callable, Optional, Tuple, Type, Union
+
+# Dedicated generator so retry jitter does not share state with the global random module
+_JITTER_RANDOM = random.Random()
+
+
+def backoff_delay(attempt: int, cap: float = 60, jitter: float = 1.0) -> float:
+    """
+    Seconds to wait before retry number attempt (0-based): capped exponential
+    backoff plus random jitter, so workers that failed together don't retry in lockstep.
+    """
+    return min(cap, 2 ** attempt) + _JITTER_RANDOM.uniform(0, jitter)
+
+
+def with_backoff(
+    exceptions: Union[Type[BaseException], Tuple[Type[BaseException], ...]],
+    attempts: int = 3,
+    cap: float = 60,
+    jitter: float = 1.0,
+    on_retry: Optional[Callable[[int, float, BaseException], Any]] = None
+) -> Callable:
+    """
+    Decorator that retries a function on the given exceptions, waiting
+    backoff_delay() between attempts. The last failure is re-raised.
+
+    Args:
+        exceptions: Exception type(s) that trigger a retry
+        attempts: Total number of calls, including the first
+        cap: Longest wait between attempts in seconds
+        jitter: Upper bound of the random extra wait in seconds
+        on_retry: Called as on_retry(attempt, delay, error) before each wait
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(attempts):
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as e:
+                    if attempt == attempts - 1:
+                        raise
+                    delay = backoff_delay(attempt, cap, jitter)
+                    if on_retry:
+                        on_retry(attempt, delay, e)
+                    time.sleep(delay)
+        return wrapper
+    return decorator
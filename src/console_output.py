@@ -3,15 +3,177 @@ Console output module for TryloByte.
 Centralizes all text output and formatting to ensure consistent styling and color.
 """
 
+import io
+import os
 import sys
 import time
+import collections
+import atexit
 import threading
 from typing import Optional
 
+
+# A finished line is written at once when the terminal is free; while another
+# thread is writing it goes to a single writer thread instead, so threads printing
+# at the same time never wait on each other or on the terminal. The backlog is
+# bounded: if the terminal falls that far behind, the oldest lines are dropped.
+_OUTPUT_LIMIT = 8192
+_output = collections.deque(maxlen=_OUTPUT_LIMIT)
+_output_lock = threading.Lock()
+_has_output = threading.Condition(_output_lock)
+_output_written = threading.Condition(_output_lock)
+_queued = 0      # lines ever queued
+_written = 0     # lines ever written or dropped
+_dropped = 0     # lines dropped since the writer last reported it
+_stopping = False
+# Held by the writer for each write and by a typing animation for its whole message
+_stdout_lock = threading.Lock()
+
+
+def _writer_loop():
+    global _written, _dropped
+    while True:
+        with _output_lock:
+            while not _output and not _stopping:
+                _has_output.wait()
+            if not _output:
+                return
+            batch = "".join(_output)
+            _output.clear()
+            dropped, _dropped = _dropped, 0
+            done = _queued
+        if dropped:
+            batch = f"{WARNING_YELLOW}[ DROPPED {dropped} lines ]{RESET}\n{batch}"
+        try:
+            with _stdout_lock:
+                _raw_stdout().write(batch)
+        except (AttributeError, ValueError):
+            pass
+        with _output_lock:
+            _written = done
+            _output_written.notify_all()
+
+
+_writer = threading.Thread(target=_writer_loop, name="console-output", daemon=True)
+_writer.start()
+
+
+def _emit(text: str):
+    """
+    Write text straight away when nothing is queued and no one else is writing,
+    otherwise queue it for the writer thread; never waits on another thread.
+    """
+    global _queued, _dropped
+    with _output_lock:
+        direct = not _output and _written == _queued and _stdout_lock.acquire(blocking=False)
+        if not direct:
+            if len(_output) == _OUTPUT_LIMIT:
+                _dropped += 1
+            _output.append(text)
+            _queued += 1
+            _has_output.notify()
+            return
+    try:
+        _raw_stdout().write(text)
+    except (AttributeError, ValueError):
+        pass
+    finally:
+        _stdout_lock.release()
+
+
+def _drain_output(timeout: float = 5.0):
+    """Wait until everything queued so far has been written."""
+    if not _writer.is_alive() or threading.current_thread() is _writer:
+        return
+    with _output_lock:
+        target = _queued
+        _output_written.wait_for(lambda: _written >= target, timeout)
+
+
+class _OrderedStdout:
+    """
+    sys.stdout stand-in that lets queued messages out before any direct write,
+    so plain print() and sys.stdout.write() calls keep their place in the output.
+    """
+
+    def __init__(self, stream):
+        self._wrapped = stream
+
+    def write(self, text: str) -> int:
+        _drain_output()
+        with _stdout_lock:
+            return self._wrapped.write(text)
+
+    def writelines(self, lines) -> None:
+        _drain_output()
+        with _stdout_lock:
+            self._wrapped.writelines(lines)
+
+    def flush(self) -> None:
+        _drain_output()
+        self._wrapped.flush()
+
+    def __getattr__(self, name: str):
+        return getattr(self._wrapped, name)
+
+
+def _raw_stdout():
+    """The stream under the ordering wrapper, or sys.stdout if something replaced it since"""
+    stream = sys.stdout
+    return stream._wrapped if isinstance(stream, _OrderedStdout) else stream
+
+
+def _stop_writer():
+    global _stopping
+    with _output_lock:
+        _stopping = True
+        _has_output.notify()
+    _writer.join(timeout=5.0)
+
+
+def flush_console():
+    """Flush any buffered console output (call at scraper phase boundaries)."""
+    _drain_output()
+    try:
+        sys.stdout.flush()
+    except (AttributeError, ValueError):
+        pass
+
+
+def _install_buffered_stdout(buffer_size: int = 65536):
+    """
+    Batch stdout writes through a large buffer when output is redirected.
+    
+    Interactive terminals keep the default line buffering so messages appear
+    immediately; pipes and log files get one write() per buffer instead of
+    one per message.
+    
+    Args:
+        buffer_size: Size of the write buffer in bytes
+    """
+    stream = sys.stdout
+    if stream is None or not hasattr(stream, "buffer") or stream.isatty():
+        return
+    
+    stream.flush()
+    sys.stdout = io.TextIOWrapper(
+        io.BufferedWriter(stream.buffer, buffer_size=buffer_size),
+        encoding=stream.encoding,
+        errors=stream.errors,
+        line_buffering=False
+    )
+    atexit.register(flush_console)
+
+
+# Must run before colorama wraps stdout so its ANSI stripping still applies
+_install_buffered_stdout()
+# Registered after the buffer's flush so it runs first at exit (atexit is LIFO)
+atexit.register(_stop_writer)
+
 try:
     from colorama import init, Fore, Style
-    # Initialize colorama for cross-platform ANSI support
-    init(autoreset=True)
+    # Initialize colorama for cross-platform ANSI support (FORCE_COLOR keeps codes on pipes too)
+    init(autoreset=True, strip=False if os.environ.get("FORCE_COLOR") else None)
     
     # Color definitions
     NEON_GREEN = Fore.LIGHTGREEN_EX
@@ -19,6 +181,7 @@ try:
     WARNING_YELLOW = Fore.LIGHTYELLOW_EX
     ALERT_RED = Fore.LIGHTRED_EX
     SUCCESS_GREEN = Fore.LIGHTGREEN_EX
+    LOADING_BLUE = Fore.LIGHTBLUE_EX
     RESET = Style.RESET_ALL
     
     # Color mapping
@@ -36,7 +199,7 @@ try:
     COLOR_ENABLED = True
 except ImportError:
     # Fallback if colorama is not available
-    NEON_GREEN = INFO_CYAN = WARNING_YELLOW = ALERT_RED = SUCCESS_GREEN = RESET = ""
+    NEON_GREEN = INFO_CYAN = WARNING_YELLOW = ALERT_RED = SUCCESS_GREEN = LOADING_BLUE = RESET = ""
     COLOR_MAP = {
         'green': '',
         'red': '',
@@ -49,6 +212,21 @@ except ImportError:
     }
     COLOR_ENABLED = False
 
+# Installed after colorama so direct writes still pass through its conversion
+if sys.stdout is not None and not isinstance(sys.stdout, _OrderedStdout):
+    sys.stdout = _OrderedStdout(sys.stdout)
+
+# Colour only helps on a terminal, so skip building escape codes for pipes and log
+# files; NO_COLOR and FORCE_COLOR override the detection
+if os.environ.get("NO_COLOR"):
+    COLOR_ENABLED = False
+elif not os.environ.get("FORCE_COLOR"):
+    COLOR_ENABLED = COLOR_ENABLED and sys.stdout.isatty()
+
+if not COLOR_ENABLED:
+    NEON_GREEN = INFO_CYAN = WARNING_YELLOW = ALERT_RED = SUCCESS_GREEN = LOADING_BLUE = RESET = ""
+    COLOR_MAP = dict.fromkeys(COLOR_MAP, '')
+
 # Message prefixes
 system_message = f"{NEON_GREEN}[ SYSTEM ]{RESET}"
 info_message = f"{INFO_CYAN}[ INFO ]{RESET}"
@@ -59,8 +237,39 @@ mission_message = f"{NEON_GREEN}[ MISSION ]{RESET}"
 testing_message = f"{WARNING_YELLOW}[ TESTING ]{RESET}"
 timeout_message = f"{WARNING_YELLOW}[ TIMEOUT ]{RESET}"
 
-# Lock to prevent interleaved print output from multiple threads
-print_lock = threading.Lock()
+def _level_template(prefix: str, color: str):
+    """Return the (head, tail) strings print_message would wrap around a message."""
+    if COLOR_ENABLED:
+        return f"{COLOR_MAP[color]}{prefix} ", f"{RESET}\n"
+    return f"{prefix} ", "\n"
+
+# Prefix and colour of each message type, formatted once
+_LEVELS = {
+    'system': _level_template(system_message, 'green'),
+    'info': _level_template(info_message, 'cyan'),
+    'warning': _level_template(warning_message, 'yellow'),
+    'error': _level_template(error_message, 'red'),
+    'success': _level_template(success_message, 'green'),
+    'mission': _level_template(mission_message, 'green'),
+    'testing': _level_template(testing_message, 'yellow'),
+    'timeout': _level_template(timeout_message, 'yellow'),
+}
+
+# Message levels; messages below the minimum are dropped before any formatting
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+_min_level = INFO
+
+def set_min_level(level: int):
+    """Set the minimum level of messages that are printed (DEBUG, INFO, WARNING, ERROR)."""
+    global _min_level
+    _min_level = level
+
+def is_enabled(level: int) -> bool:
+    """Return True if messages at the given level are printed."""
+    return level >= _min_level
 
 def print_message(message: str, color: Optional[str] = None, prefix: Optional[str] = None):
     """
@@ -71,15 +280,18 @@ def print_message(message: str, color: Optional[str] = None, prefix: Optional[st
         color: Optional color to apply (e.g. 'red', 'green')
         prefix: Optional prefix to add to the message
     """
-    with print_lock:
-        if prefix:
-            message = f"{prefix} {message}"
-            
-        if color and COLOR_ENABLED:
-            color_code = COLOR_MAP.get(color.lower(), '')
-            print(f"{color_code}{message}{RESET}")
-        else:
-            print(message)
+    if prefix:
+        message = f"{prefix} {message}"
+        
+    if color and COLOR_ENABLED:
+        _emit(f"{COLOR_MAP.get(color.lower(), '')}{message}{RESET}\n")
+    else:
+        _emit(f"{message}\n")
+
+def _print_level(level: str, message: str):
+    """Print a message with the prefix and colour of a message type."""
+    head, tail = _LEVELS[level]
+    _emit(f"{head}{message}{tail}")
 
 def print_with_typing_effect(message: str, delay: float = 0.002, prefix: Optional[str] = None, color: Optional[str] = None):
     """
@@ -91,20 +303,28 @@ def print_with_typing_effect(message: str, delay: float = 0.002, prefix: Optiona
         prefix: Optional prefix to add to the message
         color: Optional color to apply to the message
     """
-    if prefix:
-        sys.stdout.write(f"{prefix} ")
-        sys.stdout.flush()
-        
+    prefix = f"{prefix} " if prefix else ""
     color_code = COLOR_MAP.get(color.lower(), '') if color and COLOR_ENABLED else ''
     reset_code = RESET if color and COLOR_ENABLED else ''
     
-    for char in message:
-        sys.stdout.write(f"{color_code}{char}{reset_code}")
-        sys.stdout.flush()
-        time.sleep(delay)
+    # Nobody watches the animation when output is redirected, so write it in one go
+    if delay <= 0 or not sys.stdout.isatty():
+        _emit(f"{prefix}{color_code}{message}{reset_code}\n")
+        return
     
-    sys.stdout.write("\n")
-    sys.stdout.flush()
+    # The animation writes directly, after anything already queued, and keeps the
+    # writer thread out until the whole message is on screen
+    _drain_output()
+    with _stdout_lock:
+        stream = _raw_stdout()
+        stream.write(f"{prefix}{color_code}")
+        for char in message:
+            stream.write(char)
+            stream.flush()
+            time.sleep(delay)
+        
+        stream.write(f"{reset_code}\n")
+        stream.flush()
 
 def print_spinner(stop_event, message: str, color: Optional[str] = None):
     """
@@ -129,68 +349,85 @@ def print_loading_bar(prefix: str = None, duration: int = 3, width: int = 40, co
         width: Width of the loading bar in characters
         color: Optional color to apply to the loading bar
     """
-    with print_lock:
-        if prefix:
-            print(prefix)
-            
-        bar = "█" * width
-        percentage = "100%"
-        
-        if color and COLOR_ENABLED:
-            color_code = COLOR_MAP.get(color.lower(), '')
-            print(f"{color_code}[{bar}] {percentage}{RESET}")
-        else:
-            print(f"[{bar}] {percentage}")
+    bar = "█" * width
+    percentage = "100%"
+    lines = f"{prefix}\n" if prefix else ""
+    
+    if color and COLOR_ENABLED:
+        lines += f"{COLOR_MAP.get(color.lower(), '')}[{bar}] {percentage}{RESET}\n"
+    else:
+        lines += f"[{bar}] {percentage}\n"
+    _emit(lines)
 
-def print_system_message(message: str, typing_effect: bool = False):
+def print_system_message(message: str, *args, typing_effect: bool = False, level: int = INFO):
     """Print a system message."""
+    if not is_enabled(level):
+        return
+    if args:
+        message = message % args
     if typing_effect:
         print_with_typing_effect(message, prefix=system_message, color='green')
     else:
-        print_message(message, prefix=system_message, color='green')
+        _print_level('system', message)
 
-def print_info_message(message: str, typing_effect: bool = False):
+def print_info_message(message: str, *args, typing_effect: bool = False, level: int = INFO):
     """Print an info message."""
+    if not is_enabled(level):
+        return
+    if args:
+        message = message % args
     if typing_effect:
         print_with_typing_effect(message, prefix=info_message, color='cyan')
     else:
-        print_message(message, prefix=info_message, color='cyan')
+        _print_level('info', message)
 
-def print_warning_message(message: str, typing_effect: bool = False):
+def print_warning_message(message: str, *args, typing_effect: bool = False, level: int = WARNING):
     """Print a warning message."""
+    if not is_enabled(level):
+        return
+    if args:
+        message = message % args
     if typing_effect:
         print_with_typing_effect(message, prefix=warning_message, color='yellow')
     else:
-        print_message(message, prefix=warning_message, color='yellow')
+        _print_level('warning', message)
 
-def print_error_message(message: str, typing_effect: bool = False):
+def print_error_message(message: str, *args, typing_effect: bool = False, level: int = ERROR):
     """Print an error message."""
+    if not is_enabled(level):
+        return
+    if args:
+        message = message % args
     if typing_effect:
         print_with_typing_effect(message, prefix=error_message, color='red')
     else:
-        print_message(message, prefix=error_message, color='red')
+        _print_level('error', message)
 
-def print_success_message(message: str, typing_effect: bool = False):
+def print_success_message(message: str, *args, typing_effect: bool = False, level: int = INFO):
     """Print a success message."""
+    if not is_enabled(level):
+        return
+    if args:
+        message = message % args
     if typing_effect:
         print_with_typing_effect(message, prefix=success_message, color='green')
     else:
-        print_message(message, prefix=success_message, color='green')
+        _print_level('success', message)
 
 def print_mission_message(message: str, typing_effect: bool = False):
     """Print a mission message."""
     if typing_effect:
         print_with_typing_effect(message, prefix=mission_message, color='green')
     else:
-        print_message(message, prefix=mission_message, color='green')
+        _print_level('mission', message)
 
 def print_testing_message(message: str):
     """Print a testing message."""
-    print_message(message, prefix=testing_message, color='yellow')
+    _print_level('testing', message)
 
 def print_timeout_message(message: str):
     """Print a timeout message."""
-    print_message(message, prefix=timeout_message, color='yellow')
+    _print_level('timeout', message)
 
 def print_table(headers: list, data: list, color: Optional[str] = None):
     """
@@ -201,29 +438,18 @@ def print_table(headers: list, data: list, color: Optional[str] = None):
         data: List of rows, where each row is a list of values
         color: Optional color to apply to the table
     """
-    # Calculate column widths
-    col_widths = [len(h) for h in headers]
-    for row in data:
-        for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(str(cell)))
-    
-    # Format header row
-    header = " | ".join(h.ljust(col_widths[i]) for i, h in enumerate(headers))
-    separator = "-+-".join("-" * w for w in col_widths)
-    
-    # Print header
-    with print_lock:
-        if color and COLOR_ENABLED:
-            print(f"{COLOR_MAP.get(color.lower(), '')}{header}{RESET}")
-            print(f"{COLOR_MAP.get(color.lower(), '')}{separator}{RESET}")
-        else:
-            print(header)
-            print(separator)
-        
-        # Print data rows
-        for row in data:
-            row_str = " | ".join(str(cell).ljust(col_widths[i]) for i, cell in enumerate(row))
-            if color and COLOR_ENABLED:
-                print(f"{COLOR_MAP.get(color.lower(), '')}{row_str}{RESET}")
-            else:
-                print(row_str)
+    # Stringify every cell once, then size each column from its transpose
+    rows = [[str(cell) for cell in row] for row in data]
+    columns = zip(*rows) if rows else [()] * len(headers)
+    col_widths = [max(len(h), max(map(len, col), default=0)) for h, col in zip(headers, columns)]
+    fmt = " | ".join(f"{{:<{w}}}" for w in col_widths)
+    
+    # Header, separator and data rows go out as one block so other threads cannot interleave
+    lines = [fmt.format(*headers), "-+-".join("-" * w for w in col_widths)]
+    lines.extend(fmt.format(*row) for row in rows)
+    
+    if color and COLOR_ENABLED:
+        color_code = COLOR_MAP.get(color.lower(), '')
+        _emit("".join(f"{color_code}{line}{RESET}\n" for line in lines))
+    else:
+        _emit("".join(f"{line}\n" for line in lines))
@@ -1,8 +1,12 @@
+import re
 import json
+import math
+from array import array
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 import sys
-import random
+import queue
+from concurrent.futures import ThreadPoolExecutor
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -10,24 +14,101 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 
-try:
-    from colorama import init, Fore, Style
-    # Initialize colorama
-    init(autoreset=True)
-    # Color constants
-    NEON_GREEN = Fore.GREEN + Style.BRIGHT
-    ALERT_RED = Fore.RED + Style.BRIGHT
-    WARNING_YELLOW = Fore.YELLOW
-    INFO_CYAN = Fore.CYAN
-    SUCCESS_GREEN = Fore.GREEN
-    LOADING_BLUE = Fore.BLUE + Style.BRIGHT
-    RESET = Style.RESET_ALL
-except ImportError:
-    # Fallback if colorama is not available
-    NEON_GREEN = ALERT_RED = WARNING_YELLOW = INFO_CYAN = SUCCESS_GREEN = LOADING_BLUE = RESET = ""
-
+from .console_output import (
+    NEON_GREEN, ALERT_RED, WARNING_YELLOW, SUCCESS_GREEN, LOADING_BLUE, RESET,
+    print_message, flush_console
+)
 from .human_behavior import HumanBehavior
 
+# Listing card selectors and the patterns used to parse its rating line, e.g. "4.5 (1,234)"
+_CARD_NAME_SELECTOR = "div.fontHeadlineSmall"
+_CARD_RATING_SELECTOR = "span.fontBodyMedium > span"
+_CARD_DETAILS_SELECTOR = "div.fontBodyMedium > div:not(.UaQhfb)"
+_RATING_RE = re.compile(r"\d+(?:[.,]\d+)?")
+_REVIEWS_RE = re.compile(r"\(([\d,.]+)\)")
+
+# Google Maps ships the results of a search page as a JSON string inside
+# window.APP_INITIALIZATION_STATE, prefixed with an anti-JSON-hijacking guard
+_APP_STATE_GUARD = ")]}'"
+# Fields every embedded record must carry; if any is missing the layout guess is
+# off and the cards are scraped instead
+_APP_STATE_REQUIRED = ("name", "address", "category")
+
+
+def _dig(value: Any, *path: int) -> Any:
+    """Follow a path of list indexes into Maps' nested arrays; None if any step is missing."""
+    for index in path:
+        if not isinstance(value, list) or index >= len(value):
+            return None
+        value = value[index]
+    return value
+
+# Reads every simple field of a business page in one script call instead of one
+# find_element round trip per field; missing elements come back as null
+_DETAIL_FIELDS_JS = """
+const q = s => document.querySelector(s);
+const text = s => { const e = q(s); return e ? e.innerText.trim() : null; };
+const reviews = q("div.fontBodyMedium span[aria-label*='reviews']");
+const website = q("a[data-item-id*='authority']");
+return {
+    rating: text("div.fontDisplayLarge"),
+    reviews: reviews ? reviews.getAttribute("aria-label") : null,
+    category: text("button[jsaction*='category']"),
+    address: text("button[data-item-id='address'] div.fontBodyMedium"),
+    phone: text("button[data-item-id*='phone'] div.fontBodyMedium"),
+    website: website ? website.href : null,
+    price: text("span.fontTitleSmall[aria-label*='Price']"),
+    url: location.href
+};
+"""
+
+
+# Listing cards are addressed by position so navigating back to the results never
+# leaves the loop holding stale element references, and only one card crosses the wire
+_CARD_SELECTOR = "div[role='article']"
+_CARD_COUNT_JS = f"return document.querySelectorAll(\"{_CARD_SELECTOR}\").length;"
+_CARD_AT_JS = f"return document.querySelectorAll(\"{_CARD_SELECTOR}\")[arguments[0]] || null;"
+
+# Columns stored as packed doubles by to_columns(); missing values become NaN
+_NUMERIC_COLUMNS = ("rating", "reviews_count", "photos_count", "lat", "lng")
+
+
+def _as_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def to_columns(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Turn a list of listing dicts into one sequence per field.
+    
+    Fields missing from a row are None. "location" is split into "lat" and "lng",
+    and numeric fields are packed into array('d') columns with NaN for missing
+    values, ready for numpy.asarray().
+    
+    Args:
+        rows: Listings as returned by get_listing_results
+        
+    Returns:
+        Mapping of field name to its column
+    """
+    flat = []
+    for row in rows:
+        row = dict(row)
+        location = row.pop("location", None)
+        if isinstance(location, dict):
+            row["lat"], row["lng"] = location.get("lat"), location.get("lng")
+        flat.append(row)
+    
+    keys = list(dict.fromkeys(key for row in flat for key in row))
+    columns = {key: [row.get(key) for row in flat] for key in keys}
+    for key in _NUMERIC_COLUMNS:
+        if key in columns:
+            columns[key] = array("d", map(_as_float, columns[key]))
+    return columns
+
 
 class DataExtractor:
     """Extracts data from Google Maps listings."""
@@ -46,6 +127,14 @@ class DataExtractor:
         self.wait = WebDriverWait(
             driver, 
             wait_timeout, 
+            poll_frequency=0.1,
+            ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+        )
+        # Short, tightly polled wait for elements that are normally already on the page
+        self.fast_wait = WebDriverWait(
+            driver,
+            2,
+            poll_frequency=0.05,
             ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
         )
     
@@ -89,7 +178,7 @@ class DataExtractor:
                 return False
             
         except Exception as e:
-            print(f"Error during search: {e}")
+            print_message(f"Error during search: {e}")
             return False
     
     def _extract_from_listing_card(self, card_element) -> Dict[str, Any]:
@@ -118,29 +207,28 @@ class DataExtractor:
             
             # Extract name
             try:
-                name_element = card_element.find_element(By.CSS_SELECTOR, "div.fontHeadlineSmall")
+                name_element = card_element.find_element(By.CSS_SELECTOR, _CARD_NAME_SELECTOR)
                 data["name"] = name_element.text.strip()
             except NoSuchElementException:
                 pass
             
             # Extract rating and reviews
             try:
-                rating_element = card_element.find_element(By.CSS_SELECTOR, "span.fontBodyMedium > span")
-                rating_text = rating_element.text.strip()
-                if rating_text:
-                    data["rating"] = float(rating_text.split()[0].replace(",", "."))
+                rating_element = card_element.find_element(By.CSS_SELECTOR, _CARD_RATING_SELECTOR)
+                rating_match = _RATING_RE.search(rating_element.text)
+                if rating_match:
+                    data["rating"] = float(rating_match.group().replace(",", "."))
                     
                     # Extract review count
-                    reviews_text = rating_element.find_element(By.XPATH, "..").text
-                    if "(" in reviews_text and ")" in reviews_text:
-                        reviews_count = reviews_text.split("(")[1].split(")")[0].replace(",", "")
-                        data["reviews_count"] = int(reviews_count)
-            except (NoSuchElementException, ValueError, IndexError):
+                    reviews_match = _REVIEWS_RE.search(rating_element.find_element(By.XPATH, "..").text)
+                    if reviews_match:
+                        data["reviews_count"] = int(reviews_match.group(1).replace(",", "").replace(".", ""))
+            except (NoSuchElementException, ValueError):
                 pass
             
             # Extract category and address
             try:
-                details_elements = card_element.find_elements(By.CSS_SELECTOR, "div.fontBodyMedium > div:not(.UaQhfb)")
+                details_elements = card_element.find_elements(By.CSS_SELECTOR, _CARD_DETAILS_SELECTOR)
                 if len(details_elements) >= 1:
                     data["category"] = details_elements[0].text.strip()
                 if len(details_elements) >= 2:
@@ -149,7 +237,7 @@ class DataExtractor:
                 pass
             
         except Exception as e:
-            print(f"Error extracting data from listing card: {e}")
+            print_message(f"Error extracting data from listing card: {e}")
         
         return data
     
@@ -181,53 +269,29 @@ class DataExtractor:
             
             # Extract name
             try:
-                name_element = self.wait.until(
+                name_element = self.fast_wait.until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "h1.fontHeadlineLarge"))
                 )
                 data["name"] = name_element.text.strip()
             except TimeoutException:
                 pass
             
-            # Extract rating and reviews
-            try:
-                rating_element = self.driver.find_element(By.CSS_SELECTOR, "div.fontDisplayLarge")
-                if rating_element:
-                    data["rating"] = float(rating_element.text.replace(",", "."))
-                
-                reviews_element = self.driver.find_element(By.CSS_SELECTOR, "div.fontBodyMedium span[aria-label*='reviews']")
-                if reviews_element:
-                    reviews_text = reviews_element.get_attribute("aria-label")
-                    data["reviews_count"] = int(reviews_text.split()[0].replace(",", "").replace(".", ""))
-            except (NoSuchElementException, ValueError):
-                pass
+            # Read the remaining simple fields in a single round trip
+            fields = self.driver.execute_script(_DETAIL_FIELDS_JS) or {}
             
-            # Extract category
+            # Parse rating and reviews
             try:
-                category_element = self.driver.find_element(By.CSS_SELECTOR, "button[jsaction*='category']")
-                data["category"] = category_element.text.strip()
-            except NoSuchElementException:
-                pass
-            
-            # Extract address
-            try:
-                address_element = self.driver.find_element(By.CSS_SELECTOR, "button[data-item-id='address']")
-                data["address"] = address_element.find_element(By.CSS_SELECTOR, "div.fontBodyMedium").text.strip()
-            except NoSuchElementException:
+                if fields.get("rating"):
+                    data["rating"] = float(fields["rating"].replace(",", "."))
+                if fields.get("reviews"):
+                    data["reviews_count"] = int(fields["reviews"].split()[0].replace(",", "").replace(".", ""))
+            except (IndexError, ValueError):
                 pass
             
-            # Extract phone number
-            try:
-                phone_element = self.driver.find_element(By.CSS_SELECTOR, "button[data-item-id*='phone']")
-                data["phone"] = phone_element.find_element(By.CSS_SELECTOR, "div.fontBodyMedium").text.strip()
-            except NoSuchElementException:
-                pass
-            
-            # Extract website
-            try:
-                website_element = self.driver.find_element(By.CSS_SELECTOR, "a[data-item-id*='authority']")
-                data["website"] = website_element.get_attribute("href")
-            except NoSuchElementException:
-                pass
+            data["category"] = fields.get("category") or ""
+            data["address"] = fields.get("address") or ""
+            data["phone"] = fields.get("phone") or ""
+            data["website"] = fields.get("website") or ""
             
             # Extract hours
             try:
@@ -254,16 +318,13 @@ class DataExtractor:
             except (NoSuchElementException, TimeoutException):
                 pass
             
-            # Extract price level
-            try:
-                price_element = self.driver.find_element(By.CSS_SELECTOR, "span.fontTitleSmall[aria-label*='Price']")
-                data["price_level"] = len(price_element.text.strip())
-            except NoSuchElementException:
-                pass
+            # Price level
+            if fields.get("price"):
+                data["price_level"] = len(fields["price"])
             
-            # Extract coordinates from URL
+            # Extract coordinates from the URL read with the other fields
             try:
-                url = self.driver.current_url
+                url = fields.get("url") or ""
                 if "@" in url and "," in url:
                     coords = url.split("@")[1].split(",")
                     if len(coords) >= 2:
@@ -273,21 +334,117 @@ class DataExtractor:
                 pass
             
         except Exception as e:
-            print(f"Error extracting detailed data: {e}")
+            print_message(f"Error extracting detailed data: {e}")
         
         return data
     
-    def get_listing_results(self, max_results: int = 0) -> List[Dict[str, Any]]:
+    def _extract_via_app_state(self) -> List[Dict[str, Any]]:
+        """
+        Read listing data from the JSON Google Maps embeds in the page, without
+        touching the rendered cards.
+        
+        Only results present when the page was loaded are covered, and the layout
+        is undocumented, so an empty list means "use the DOM" rather than "no results".
+        
+        Returns:
+            List of dictionaries in the same shape as _extract_from_listing_card
+        """
+        try:
+            payload = _dig(self.driver.execute_script("return window.APP_INITIALIZATION_STATE;"), 3, 2)
+            if not isinstance(payload, str):
+                return []
+            if payload.startswith(_APP_STATE_GUARD):
+                payload = payload[len(_APP_STATE_GUARD):]
+            entries = _dig(json.loads(payload), 0, 1)
+        except Exception:
+            return []
+        
+        results = []
+        for entry in entries or []:
+            place = _dig(entry, 14)
+            if not isinstance(place, list) or not isinstance(_dig(place, 11), str):
+                continue
+            
+            categories = _dig(place, 13)
+            lat, lng = _dig(place, 9, 2), _dig(place, 9, 3)
+            results.append({
+                "name": place[11],
+                "rating": _dig(place, 4, 7),
+                "reviews_count": _dig(place, 4, 8),
+                "category": categories[0] if isinstance(categories, list) and categories else "",
+                "address": _dig(place, 39) or "",
+                "phone": _dig(place, 178, 0, 0) or "",
+                "website": _dig(place, 7, 0) or "",
+                "location": {"lat": lat, "lng": lng},
+                # Only the business page has these; keep the schema of the card path
+                "hours": {},
+                "price_level": "",
+                "description": "",
+                "photos_count": 0
+            })
+        return results
+    
+    @staticmethod
+    def _merge_details(card_data: Dict[str, Any], detailed_data: Dict[str, Any]) -> None:
+        """Fill fields the listing card left empty from the business page data"""
+        card_data.update({key: value for key, value in detailed_data.items()
+                          if value and not card_data.get(key)})
+    
+    def _extract_details_parallel(self, pending: List[tuple], detail_drivers: List[webdriver.Remote]) -> None:
+        """
+        Open business pages in separate browser sessions at the same time and merge
+        their details into the card data.
+        
+        Args:
+            pending: (card_data, listing URL) pairs
+            detail_drivers: Browser sessions to spread the pages over, one page each at a time
+        """
+        extractors = queue.Queue()
+        for driver in detail_drivers:
+            extractors.put(DataExtractor(driver, HumanBehavior(driver)))
+        
+        def fetch(item):
+            card_data, url = item
+            extractor = extractors.get()
+            try:
+                extractor.driver.get(url)
+                self._merge_details(card_data, extractor._extract_detailed_data())
+            except Exception as e:
+                print_message(f"Error processing listing details: {e}")
+            finally:
+                extractors.put(extractor)
+        
+        with ThreadPoolExecutor(max_workers=len(detail_drivers)) as executor:
+            list(executor.map(fetch, pending))
+    
+    def get_listing_results(self, max_results: int = 0, use_app_state: bool = False,
+                            columnar: bool = False,
+                            detail_drivers: Optional[List[webdriver.Remote]] = None) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """
         Extract details from Google Maps listing results.
         
         Args:
             max_results: Maximum number of results to extract (0 = unlimited)
+            use_app_state: Take the results from the page's embedded JSON when it
+                holds at least max_results complete ones (max_results must be set),
+                skipping the per-card click-through. Faster, but hours, price level,
+                description and photo count are left empty
+            columnar: Return one column per field (see to_columns) instead of one dict per listing
+            detail_drivers: Extra browser sessions; when given, business pages are opened
+                in them concurrently by URL instead of clicking through each card here
             
         Returns:
-            List of dictionaries containing listing details
+            List of dictionaries containing listing details, or columns if columnar
         """
+        results = self._collect_listing_results(max_results, use_app_state, detail_drivers)
+        return to_columns(results) if columnar else results
+    
+    def _collect_listing_results(self, max_results: int, use_app_state: bool,
+                                 detail_drivers: Optional[List[webdriver.Remote]] = None) -> List[Dict[str, Any]]:
+        """Gather listing dicts for get_listing_results"""
         results = []
+        # (card data, listing URL) pairs waiting for the detail sessions
+        pending_details = []
         scroll_count = 0
         start_time = time.time()
         total_processed = 0
@@ -295,6 +452,10 @@ class DataExtractor:
         # Progress bar variables
         progress_chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
         progress_idx = 0
+        status_line = f"\r[ {LOADING_BLUE}PROCESS{RESET} ] Extracting: %s %d/%d - Found: %d - Rate: %.2f/sec"
+        # The spinner only makes sense on a terminal, and at most 10 redraws a second
+        show_status = sys.stdout.isatty()
+        last_status = 0.0
         
         try:
             # Wait for results container
@@ -302,94 +463,117 @@ class DataExtractor:
                 EC.presence_of_element_located((By.CSS_SELECTOR, "div[role='feed']"))
             )
             
-            # Get all listing cards
-            listing_cards = self.driver.find_elements(By.CSS_SELECTOR, "div[role='article']")
+            if use_app_state and max_results > 0:
+                # The embedded data only holds the first page of results; an unlimited or
+                # larger request still needs the scroll-and-extract loop below
+                embedded = self._extract_via_app_state()[:max_results]
+                if len(embedded) == max_results and all(
+                        listing.get(key) for listing in embedded for key in _APP_STATE_REQUIRED):
+                    results = embedded
+                    print_message(f"[ {SUCCESS_GREEN}COMPLETE{RESET} ] Extracted {len(results)} listings from embedded page data.")
+                    return results
+            
+            # Count the listing cards
+            card_count = self.driver.execute_script(_CARD_COUNT_JS) or 0
             
-            if not listing_cards:
-                print(f"[ {WARNING_YELLOW}ALERT{RESET} ] No listing cards found. Security measures may be active.")
+            if not card_count:
+                print_message(f"[ {WARNING_YELLOW}ALERT{RESET} ] No listing cards found. Security measures may be active.")
                 return results
             
-            print(f"[ {NEON_GREEN}TARGET{RESET} ] Located {len(listing_cards)} potential data packets.")
+            print_message(f"[ {NEON_GREEN}TARGET{RESET} ] Located {card_count} potential data packets.")
             
-            # Process each listing card
-            for i, card in enumerate(listing_cards):
+            # Process each listing card, fetching it by position
+            i = -1
+            while i + 1 < card_count:
+                i += 1
                 try:
+                    card = self.driver.execute_script(_CARD_AT_JS, i)
+                    if card is None:
+                        break
+                    
                     # Update progress spinner
                     progress_idx = (progress_idx + 1) % len(progress_chars)
-                    progress_percentage = (i + 1) / len(listing_cards) * 100 if listing_cards else 0
-                    status_msg = f"[ {LOADING_BLUE}PROCESS{RESET} ] Extracting data {progress_chars[progress_idx]} {i+1}/{len(listing_cards)} ({progress_percentage:.1f}%)"
-                    sys.stdout.write(f"\r{status_msg}")
-                    sys.stdout.flush()
+                    now = time.monotonic()
+                    if show_status and now - last_status > 0.1:
+                        last_status = now
+                        elapsed = time.time() - start_time
+                        rate = total_processed / elapsed if elapsed > 0 else 0
+                        flush_console()  # Queued messages go out before the status line
+                        sys.stdout.write(status_line % (progress_chars[progress_idx], i + 1, card_count, total_processed, rate))
+                        sys.stdout.flush()
                     
                     # Extract data from the card
                     card_data = self._extract_from_listing_card(card)
                     
-                    # Click on the card to view details
-                    try:
-                        self.human.random_delay(1.0, 2.0)
-                        self.human.human_click(card)
-                        
-                        # Extract detailed data
-                        detailed_data = self._extract_detailed_data()
-                        
-                        # Merge card and detailed data
-                        for key, value in detailed_data.items():
-                            if value and (key not in card_data or not card_data[key]):
-                                card_data[key] = value
-                        
-                        # Navigate back to results
-                        self.human.human_navigate_back()
-                        self.human.random_delay(2.0, 3.0)
-                        
-                        # Re-find result cards after navigating back
-                        listing_cards = self.driver.find_elements(By.CSS_SELECTOR, "div[role='article']")
-                    except Exception as e:
-                        print(f"Error processing listing details: {e}")
+                    # Leave the business page to the detail sessions if there are any
+                    url = None
+                    if detail_drivers:
+                        try:
+                            url = card.find_element(By.CSS_SELECTOR, "a").get_attribute("href")
+                        except NoSuchElementException:
+                            pass
+                    
+                    if url:
+                        pending_details.append((card_data, url))
+                    else:
+                        # Click on the card to view details
+                        try:
+                            self.human.random_delay(1.0, 2.0)
+                            self.human.human_click(card)
+                            
+                            # Extract detailed data
+                            self._merge_details(card_data, self._extract_detailed_data())
+                            
+                            # Navigate back to results
+                            self.human.human_navigate_back()
+                            self.human.random_delay(2.0, 3.0)
+                        except Exception as e:
+                            print_message(f"Error processing listing details: {e}")
                     
                     results.append(card_data)
                     total_processed += 1
                     
-                    # Update status line with more detailed info
-                    elapsed = time.time() - start_time
-                    rate = total_processed / elapsed if elapsed > 0 else 0
-                    status_msg = f"[ {LOADING_BLUE}PROCESS{RESET} ] Extracting: {progress_chars[progress_idx]} {i+1}/{len(listing_cards)} - Found: {total_processed} - Rate: {rate:.2f}/sec"
-                    sys.stdout.write(f"\r{status_msg}")
-                    sys.stdout.flush()
-                    
                     # Check if we've reached the maximum results (0 = unlimited)
                     if max_results > 0 and len(results) >= max_results:
-                        print(f"\n[ {SUCCESS_GREEN}SUCCESS{RESET} ] Maximum result limit reached ({max_results}). Extraction complete.")
+                        print_message(f"\n[ {SUCCESS_GREEN}SUCCESS{RESET} ] Maximum result limit reached ({max_results}). Extraction complete.")
                         break
                     
                     # Simulate human behavior with random delays between listings
-                    self.human.random_delay(1.0, 3.0)
+                    if not url:
+                        self.human.random_delay(1.0, 3.0)
                     
                 except Exception as e:
-                    print(f"\n[ {ALERT_RED}ERROR{RESET} ] Failed to extract data from listing {i+1}: {str(e)}")
+                    print_message(f"\n[ {ALERT_RED}ERROR{RESET} ] Failed to extract data from listing {i+1}: {str(e)}")
                     continue
                 
                 # Scroll to load more results if needed
-                if i == len(listing_cards) - 5 and (max_results == 0 or len(results) < max_results):
-                    print(f"\n[ {LOADING_BLUE}SYSTEM{RESET} ] Scrolling to reveal more hidden data...")
+                if i == card_count - 5 and (max_results == 0 or len(results) < max_results):
+                    print_message(f"\n[ {LOADING_BLUE}SYSTEM{RESET} ] Scrolling to reveal more hidden data...")
                     self.human.human_scroll()
                     scroll_count += 1
-                    time.sleep(random.uniform(1.0, 2.0))
+                    self.human.random_delay(1.0, 2.0)
                     
-                    # Get updated listing cards
-                    new_cards = self.driver.find_elements(By.CSS_SELECTOR, "div[role='article']")
-                    if len(new_cards) > len(listing_cards):
-                        print(f"[ {SUCCESS_GREEN}SUCCESS{RESET} ] Found {len(new_cards) - len(listing_cards)} additional targets.")
-                        listing_cards = new_cards
+                    # Count the listing cards again
+                    new_count = self.driver.execute_script(_CARD_COUNT_JS) or 0
+                    if new_count > card_count:
+                        print_message(f"[ {SUCCESS_GREEN}SUCCESS{RESET} ] Found {new_count - card_count} additional targets.")
+                        card_count = new_count
+            
+            if pending_details:
+                print_message(f"[ {LOADING_BLUE}SYSTEM{RESET} ] Opening {len(pending_details)} listings across {len(detail_drivers)} sessions...")
+                self._extract_details_parallel(pending_details, detail_drivers)
             
             # Clear the status line
-            sys.stdout.write("\r" + " " * 100 + "\r")
-            sys.stdout.flush()
+            if show_status:
+                flush_console()
+                sys.stdout.write("\r" + " " * 100 + "\r")
+                sys.stdout.flush()
             
             # Show final status
             elapsed = time.time() - start_time
-            print(f"[ {SUCCESS_GREEN}COMPLETE{RESET} ] Extracted {len(results)} listings in {elapsed:.1f} seconds ({len(results)/elapsed:.2f}/sec)")
+            print_message(f"[ {SUCCESS_GREEN}COMPLETE{RESET} ] Extracted {len(results)} listings in {elapsed:.1f} seconds ({len(results)/elapsed:.2f}/sec)")
                 
         except Exception as e:
-            print(f"[ {ALERT_RED}ERROR{RESET} ] Failed to extract listing results: {str(e)}")
+            print_message(f"[ {ALERT_RED}ERROR{RESET} ] Failed to extract listing results: {str(e)}")
         
         return results
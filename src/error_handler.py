@@ -1,18 +1,133 @@
+import re
+import random
 import time
-from typing import Callable, Optional, Dict
+from typing import Callable, Optional, Dict, List
 
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.common.exceptions import (
-    TimeoutException, WebDriverException, NoSuchElementException
+    TimeoutException, WebDriverException
 )
 
+from src.common.retry import backoff_delay
+from src.console_output import print_message
+
+
+def _phrase_pattern(phrases) -> str:
+    """Alternation regex matching any of the phrases, usable from JavaScript"""
+    return "|".join(re.escape(phrase) for phrase in phrases)
+
 
 class ErrorHandler:
     """
     Handles errors, CAPTCHAs, and rate limiting for the Google Maps scraper.
     """
     
+    # Google reCAPTCHA / captcha form elements
+    CAPTCHA_SELECTORS = (
+        "iframe[src*='recaptcha']",
+        "div[class*='recaptcha']",
+        "form[action='https://www.google.com/search'] div#captcha-form",
+        "div#recaptcha"
+    )
+    
+    # Lowercase phrases looked up in the page's visible text
+    CAPTCHA_PHRASES = ("captcha", "unusual traffic", "suspicious activity")
+    
+    RATE_LIMIT_PHRASES = (
+        "rate limit",
+        "too many requests",
+        "temporarily blocked",
+        "access denied",
+        "unusual traffic from your computer",
+        # Google specific rate limiting message
+        "our systems have detected unusual traffic"
+    )
+    
+    # Only matched against the title and <h1> text: a bare "429" in the body is
+    # far too likely to be part of an address or phone number
+    RATE_LIMIT_HEADING_PHRASES = ("429", "too many requests")
+    
+    # Each phrase list as one alternation, so the page text is scanned once
+    # however many phrases there are
+    CAPTCHA_PATTERN = _phrase_pattern(CAPTCHA_PHRASES)
+    RATE_LIMIT_PATTERN = _phrase_pattern(RATE_LIMIT_PHRASES)
+    RATE_LIMIT_HEADING_PATTERN = _phrase_pattern(RATE_LIMIT_HEADING_PHRASES)
+    
+    # Where block and captcha notices are shown on a Maps page. Listing names and
+    # review text live elsewhere, so a review saying "access denied" can't trip it
+    NOTICE_SELECTORS = "h1, h2, [role='alert'], [role='alertdialog'], [role='dialog'], #captcha-form, #infoDiv"
+    
+    # arguments: CSS selectors, text pattern, heading pattern, notice selectors.
+    # True if any selector matches a displayed element, or a pattern matches whole
+    # words of lowercased visible text: the notice containers on a Maps page, the
+    # whole body on any other page (e.g. Google's /sorry/ interstitial). The text
+    # is searched in a single regex pass rather than with an XPath walk per phrase.
+    SCAN_PAGE_JS = """
+const [selectors, pattern, headingPattern, noticeSelectors] = arguments;
+const visible = e => e.getClientRects().length > 0 && getComputedStyle(e).visibility !== "hidden";
+if (selectors.some(s => Array.from(document.querySelectorAll(s)).some(visible))) return true;
+const wordsMatch = (p, text) => new RegExp("\\\\b(?:" + p + ")\\\\b").test(text.toLowerCase());
+if (pattern) {
+    const mapsUi = document.querySelector("div[role='main'], div[role='feed']");
+    const containers = mapsUi ? Array.from(document.querySelectorAll(noticeSelectors)).filter(visible)
+                              : (document.body ? [document.body] : []);
+    if (wordsMatch(pattern, containers.map(e => e.innerText).join("\\n"))) return true;
+}
+if (!headingPattern) return false;
+const headings = [document.title, ...Array.from(document.querySelectorAll("h1"), h => h.innerText)];
+return wordsMatch(headingPattern, headings.join("\\n"));
+"""
+    
+    # For each XPath in arguments[0], whether any match is displayed. Runs every
+    # probe in one script call instead of one find_element round trip per probe.
+    VISIBLE_XPATHS_JS = """
+const visible = e => e.getClientRects().length > 0 && getComputedStyle(e).visibility !== "hidden";
+return arguments[0].map(xpath => {
+    const nodes = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < nodes.snapshotLength; i++) {
+        if (visible(nodes.snapshotItem(i))) return true;
+    }
+    return false;
+});
+"""
+    
+    # Status of the last Google Maps document/resource load, or null when
+    # unknown; written so a page without matching entries doesn't throw
+    RESPONSE_STATUS_JS = """
+const entries = window.performance.getEntries().filter(e => e.name.includes("google.com/maps"));
+const last = entries[entries.length - 1];
+return last && last.responseStatus ? last.responseStatus : null;
+"""
+    
+    BLOCKED_STATUSES = frozenset((429, 403, 503))
+    
+    # URL, title and results-feed visibility in one small script; enough to
+    # recognise a normal Maps page without running the full detectors
+    PAGE_STATE_JS = """
+const feed = document.querySelector("div[role='feed']");
+return {url: location.href, title: document.title, feed: !!feed && feed.getClientRects().length > 0};
+"""
+    
+    # Lowercase title fragments that make an otherwise normal-looking page suspect
+    SUSPECT_TITLE_MARKERS = ("sorry", "429", "too many requests", "error", "captcha")
+    
+    # Timeout retry backoff: upper bound and random extra, in seconds
+    BACKOFF_CAP = 60
+    BACKOFF_JITTER = 1.0
+    
+    HACKER_MESSAGES = (
+        "[ ALERT ] Breaking through firewall barriers...",
+        "[ ALERT ] Evading neural network detection systems...",
+        "[ ALERT ] Bypassing quantum encryption protocols...",
+        "[ ALERT ] Rerouting through cybernetic nodes...",
+        "[ ALERT ] Deploying stealth algorithms...",
+        "[ ALERT ] Initiating ghost protocol...",
+        "[ ALERT ] Activating digital camouflage...",
+        "[ ALERT ] Implementing counter-surveillance measures...",
+        "[ ALERT ] Triggering system override procedures...",
+        "[ ALERT ] Engaging neural interface bypass...",
+    )
+    
     def __init__(self, driver: webdriver.Remote, change_proxy_callback: Callable, report_proxy_error_callback: Callable):
         """
         Initialize the error handler.
@@ -25,23 +140,43 @@ class ErrorHandler:
         self.driver = driver
         self.change_proxy = change_proxy_callback
         self.report_proxy_error = report_proxy_error_callback
-        self.hacker_messages = [
-            "[ ALERT ] Breaking through firewall barriers...",
-            "[ ALERT ] Evading neural network detection systems...",
-            "[ ALERT ] Bypassing quantum encryption protocols...",
-            "[ ALERT ] Rerouting through cybernetic nodes...",
-            "[ ALERT ] Deploying stealth algorithms...",
-            "[ ALERT ] Initiating ghost protocol...",
-            "[ ALERT ] Activating digital camouflage...",
-            "[ ALERT ] Implementing counter-surveillance measures...",
-            "[ ALERT ] Triggering system override procedures...",
-            "[ ALERT ] Engaging neural interface bypass...",
-        ]
     
     def get_random_hacker_message(self) -> str:
         """Returns a random retro hacker message."""
-        import random
-        return random.choice(self.hacker_messages)
+        return random.choice(self.HACKER_MESSAGES)
+    
+    def _visible_matches(self, xpaths) -> List[bool]:
+        """
+        Check several XPath expressions at once.
+        
+        Returns:
+            One flag per expression, True if any matching element is displayed
+        """
+        try:
+            flags = self.driver.execute_script(self.VISIBLE_XPATHS_JS, list(xpaths))
+        except WebDriverException:
+            flags = None
+        return flags if isinstance(flags, list) else [False] * len(xpaths)
+    
+    def _scan_page(self, selectors=(), pattern: str = "", heading_pattern: str = "") -> bool:
+        """
+        Look for indicator elements and phrases on the current page in one script call.
+        
+        Args:
+            selectors: CSS selectors of indicator elements
+            pattern: Regex (see _phrase_pattern) matched as whole words in the lowercased
+                notice text (NOTICE_SELECTORS) of a Maps page, or the body text of any other page
+            heading_pattern: Regex matched as whole words in the lowercased title and <h1> text
+        
+        Returns:
+            True if any selector or pattern matched
+        """
+        try:
+            return bool(self.driver.execute_script(
+                self.SCAN_PAGE_JS, list(selectors), pattern, heading_pattern, self.NOTICE_SELECTORS
+            ))
+        except WebDriverException:
+            return False
     
     def is_captcha_present(self) -> bool:
         """
@@ -50,27 +185,7 @@ class ErrorHandler:
         Returns:
             True if CAPTCHA is detected, False otherwise
         """
-        captcha_indicators = [
-            # Google reCAPTCHA indicators
-            "//iframe[contains(@src, 'recaptcha')]",
-            "//div[contains(@class, 'recaptcha')]",
-            # Text indicators
-            "//*[contains(text(), 'captcha') or contains(text(), 'CAPTCHA')]",
-            "//*[contains(text(), 'unusual traffic') or contains(text(), 'suspicious activity')]",
-            # Google captcha specific elements
-            "//form[@action='https://www.google.com/search']//div[@id='captcha-form']",
-            "//div[@id='recaptcha']"
-        ]
-        
-        for indicator in captcha_indicators:
-            try:
-                element = self.driver.find_element(By.XPATH, indicator)
-                if element.is_displayed():
-                    return True
-            except NoSuchElementException:
-                continue
-        
-        return False
+        return self._scan_page(self.CAPTCHA_SELECTORS, self.CAPTCHA_PATTERN)
     
     def is_rate_limited(self) -> bool:
         """
@@ -79,36 +194,38 @@ class ErrorHandler:
         Returns:
             True if rate limiting is detected, False otherwise
         """
-        rate_limit_indicators = [
-            # Text patterns for rate limiting
-            "//*[contains(text(), 'rate limit') or contains(text(), 'too many requests')]",
-            "//*[contains(text(), 'temporarily blocked') or contains(text(), 'access denied')]",
-            "//*[contains(text(), 'unusual traffic from your computer')]",
-            # Google specific rate limiting messages
-            "//*[contains(text(), 'Our systems have detected unusual traffic')]",
-            # General error page indicators
-            "//title[contains(text(), '429') or contains(text(), 'Too Many Requests')]",
-            "//h1[contains(text(), '429') or contains(text(), 'Too Many Requests')]"
-        ]
-        
-        for indicator in rate_limit_indicators:
-            try:
-                element = self.driver.find_element(By.XPATH, indicator)
-                if element.is_displayed():
-                    return True
-            except NoSuchElementException:
-                continue
+        if self._scan_page(pattern=self.RATE_LIMIT_PATTERN,
+                           heading_pattern=self.RATE_LIMIT_HEADING_PATTERN):
+            return True
         
         # Check HTTP status code (may not work for all browsers)
         try:
-            script = "return window.performance.getEntries().filter(e => e.name.includes('google.com/maps')).pop().responseStatus"
-            status = self.driver.execute_script(script)
-            if status and status in [429, 403, 503]:
-                return True
-        except Exception:
-            pass
+            status = self.driver.execute_script(self.RESPONSE_STATUS_JS)
+        except WebDriverException:
+            return False
+        return status in self.BLOCKED_STATUSES
+    
+    def _is_normal_page(self) -> bool:
+        """
+        Quick check for a normal Google Maps page: Maps URL, a Maps title without
+        error markers and, on search pages, a visible results feed.
         
-        return False
+        Returns:
+            True if the page looks normal, False if it needs the full checks
+        """
+        try:
+            state = self.driver.execute_script(self.PAGE_STATE_JS)
+        except WebDriverException:
+            return False
+        if not isinstance(state, dict):
+            return False
+        
+        url = state.get("url") or ""
+        title = (state.get("title") or "").lower()
+        return ("google.com/maps" in url
+                and "google maps" in title
+                and not any(marker in title for marker in self.SUSPECT_TITLE_MARKERS)
+                and ("/search" not in url or bool(state.get("feed"))))
     
     def check_page_errors(self, current_proxy: Dict[str, str]) -> bool:
         """
@@ -120,55 +237,57 @@ class ErrorHandler:
         Returns:
             True if any error condition is detected and handled, False otherwise
         """
+        # Normal pages skip the full detector scripts
+        if self._is_normal_page():
+            return False
+        
         # Check for CAPTCHA
         if self.is_captcha_present():
-            print(f"{self.get_random_hacker_message()}")
-            print("[ SECURITY ] CAPTCHA defense system detected! Switching digital identity...")
+            print_message(f"{self.get_random_hacker_message()}")
+            print_message("[ SECURITY ] CAPTCHA defense system detected! Switching digital identity...")
             self.report_proxy_error(current_proxy)
             self.change_proxy()
             return True
         
         # Check for rate limiting
         if self.is_rate_limited():
-            print(f"{self.get_random_hacker_message()}")
-            print("[ SECURITY ] Rate limiting countermeasures detected! Engaging stealth protocols...")
+            print_message(f"{self.get_random_hacker_message()}")
+            print_message("[ SECURITY ] Rate limiting countermeasures detected! Engaging stealth protocols...")
             self.report_proxy_error(current_proxy)
             self.change_proxy()
             return True
         
         # Check for general page load issues
         try:
+            current_url = self.driver.current_url
+            
             # Check if we're on Google Maps
-            if "google.com/maps" not in self.driver.current_url:
-                print(f"{self.get_random_hacker_message()}")
-                print("[ SECURITY ] Digital perimeter breach! Not on target system. Possible redirection detected...")
+            if "google.com/maps" not in current_url:
+                print_message(f"{self.get_random_hacker_message()}")
+                print_message("[ SECURITY ] Digital perimeter breach! Not on target system. Possible redirection detected...")
                 self.report_proxy_error(current_proxy)
                 self.change_proxy()
                 return True
             
             # Check if search results are present (when expected)
-            if "/search" in self.driver.current_url:
-                try:
-                    # Check for a message indicating no results
-                    no_results = self.driver.find_elements(
-                        By.XPATH, "//*[contains(text(), 'No results found')]"
-                    )
-                    if no_results and any(e.is_displayed() for e in no_results):
-                        # This is not an error, just no results
-                        return False
-                    
-                    # Check if results feed is present
-                    results = self.driver.find_elements(By.CSS_SELECTOR, "div[role='feed']")
-                    if not results or not any(e.is_displayed() for e in results):
-                        print(f"{self.get_random_hacker_message()}")
-                        print("[ SECURITY ] Data stream blockage detected! Deploying counter-measures...")
-                        self.report_proxy_error(current_proxy)
-                        self.change_proxy()
-                        return True
-                except NoSuchElementException:
-                    pass
+            if "/search" in current_url:
+                # Check for a "no results" message and for the results feed in one call
+                no_results, has_feed = self._visible_matches((
+                    "//*[contains(text(), 'No results found')]",
+                    "//div[@role='feed']"
+                ))
+                if no_results:
+                    # This is not an error, just no results
+                    return False
+                
+                if not has_feed:
+                    print_message(f"{self.get_random_hacker_message()}")
+                    print_message("[ SECURITY ] Data stream blockage detected! Deploying counter-measures...")
+                    self.report_proxy_error(current_proxy)
+                    self.change_proxy()
+                    return True
         except Exception as e:
-            print(f"[ ERROR ] System integrity breach: {e}")
+            print_message(f"[ ERROR ] System integrity breach: {e}")
         
         return False
     
@@ -185,27 +304,26 @@ class ErrorHandler:
         Returns:
             True if successful after retries, False if max retries exceeded
         """
-        if retry_count >= max_retries:
-            print(f"[ SYSTEM ] Maximum retry attempts ({max_retries}) exceeded for target: {url}")
-            self.report_proxy_error(current_proxy)
-            return False
-        
-        # Exponential backoff
-        wait_time = 2 ** retry_count
-        print(f"{self.get_random_hacker_message()}")
-        print(f"[ SYSTEM ] Connection timeout. Initiating quantum recalibration in {wait_time} seconds... (Attempt {retry_count + 1}/{max_retries})")
-        time.sleep(wait_time)
+        for attempt in range(retry_count, max_retries):
+            wait_time = backoff_delay(attempt, self.BACKOFF_CAP, self.BACKOFF_JITTER)
+            print_message(f"{self.get_random_hacker_message()}")
+            print_message(f"[ SYSTEM ] Connection timeout. Initiating quantum recalibration in {wait_time:.1f} seconds... (Attempt {attempt + 1}/{max_retries})")
+            time.sleep(wait_time)
+            
+            try:
+                self.driver.get(url)
+                return True
+            except TimeoutException:
+                continue
+            except WebDriverException as e:
+                print_message(f"[ ERROR ] Network protocol disruption: {e}")
+                self.report_proxy_error(current_proxy)
+                self.change_proxy()
+                return False
         
-        try:
-            self.driver.get(url)
-            return True
-        except TimeoutException:
-            return self.handle_timeout(url, current_proxy, retry_count + 1, max_retries)
-        except WebDriverException as e:
-            print(f"[ ERROR ] Network protocol disruption: {e}")
-            self.report_proxy_error(current_proxy)
-            self.change_proxy()
-            return False
+        print_message(f"[ SYSTEM ] Maximum retry attempts ({max_retries}) exceeded for target: {url}")
+        self.report_proxy_error(current_proxy)
+        return False
     
     def slow_down_if_needed(self, error_count: int) -> None:
         """
@@ -217,6 +335,6 @@ class ErrorHandler:
         if error_count > 2:
             # Exponential backoff based on error count
             delay = min(30, 5 * (2 ** (error_count - 2)))
-            print(f"{self.get_random_hacker_message()}")
-            print(f"[ SYSTEM ] Defense grid resistance increasing. Cooling system for {delay} seconds to avoid detection...")
+            print_message(f"{self.get_random_hacker_message()}")
+            print_message(f"[ SYSTEM ] Defense grid resistance increasing. Cooling system for {delay} seconds to avoid detection...")
             time.sleep(delay)
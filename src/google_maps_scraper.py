@@ -5,6 +5,12 @@ import argparse
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Any
 
+# orjson is optional; it serializes output much faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -15,17 +21,95 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException, 
-    ElementClickInterceptedException,
-    StaleElementReferenceException
+    ElementClickInterceptedException
 )
 
-from common.logger import (
-    print_system_message,
-    print_info_message, 
-    print_success_message, 
-    print_warning_message, 
-    print_error_message
-)
+# Prefer the package path so this module shares the logger loaded by the rest of
+# the tree; fall back to the bare path when run as a script from inside src/
+try:
+    from src.common.logger import (
+        print_system_message,
+        print_info_message, 
+        print_success_message, 
+        print_warning_message, 
+        print_error_message
+    )
+except ImportError:
+    from common.logger import (
+        print_system_message,
+        print_info_message, 
+        print_success_message, 
+        print_warning_message, 
+        print_error_message
+    )
+
+try:
+    from src.browsers.selenium_browser import BLOCKED_RESOURCE_PATTERNS, SCROLL_UNTIL_LOADED_JS, widen_executor_pool
+    from src.common.retry import with_backoff
+except ImportError:
+    from browsers.selenium_browser import BLOCKED_RESOURCE_PATTERNS, SCROLL_UNTIL_LOADED_JS, widen_executor_pool
+    from common.retry import with_backoff
+
+# Content settings (2 = block) and request patterns used when block_resources is on;
+# extraction only needs the DOM text, not images, fonts or map tiles
+_RESOURCE_BLOCKING_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+}
+_BLOCKED_URLS = BLOCKED_RESOURCE_PATTERNS + ("*google.com/maps/vt*",)
+
+# Reads every detail-panel field in one round trip. arguments[0] is the selectors
+# dict; missing elements come back as empty strings.
+_BUSINESS_FIELDS_JS = """
+const selectors = arguments[0];
+const text = key => {
+    const element = document.querySelector(selectors[key]);
+    return element ? element.innerText.trim() : "";
+};
+return {
+    name: text("business_name"),
+    category: text("business_category"),
+    address: text("business_address"),
+    website: text("business_website"),
+    phone: text("business_phone"),
+    hours_button_present: document.querySelector(selectors["business_hours_button"]) !== null
+};
+"""
+
+# Summary fields Google renders inside each results-feed tile, read for every tile
+# in one round trip. arguments[0] is the result_items selector (the tile's link).
+_TILE_FIELDS_JS = """
+return Array.from(document.querySelectorAll(arguments[0]), link => {
+    const tile = link.parentElement;
+    const lines = Array.from(tile.querySelectorAll("div.fontBodyMedium > div"), line => line.innerText.trim());
+    // "Category · Address" is the first dotted line that isn't the rating line
+    const info = (lines.find(line => line.includes("·") && !/^\\d/.test(line)) || "")
+        .split("·").map(part => part.trim()).filter(Boolean);
+    const stars = tile.querySelector("span[role='img']");
+    return {
+        url: link.href,
+        name: link.getAttribute("aria-label") || "",
+        category: info.length > 0 ? info[0] : "",
+        address: info.length > 1 ? info[info.length - 1] : "",
+        rating: stars ? (stars.getAttribute("aria-label") || "").split(" ")[0] : ""
+    };
+});
+"""
+
+# Required fields for --listing-only runs, all readable from a result tile
+LISTING_REQUIRED_FIELDS = ("name", "category", "address")
+
+# Fields required by default; website, phone and hours need the details panel
+DEFAULT_REQUIRED_FIELDS = ("name", "category", "address", "website", "phone", "hours")
+
+def _dump_json(data: Any, pretty: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON, with orjson when it is installed"""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(data, ensure_ascii=False, indent=2 if pretty else None).encode("utf-8")
+
+def _announce_retry(attempt: int, delay: float, error: BaseException) -> None:
+    print_warning_message(f"Page load timed out, retrying in {delay:.1f} seconds (attempt {attempt + 2})")
 
 class GoogleMapsScraper:
     """
@@ -40,7 +124,9 @@ class GoogleMapsScraper:
         proxy: Optional[Dict[str, str]] = None,
         wait_time: int = 10,
         scroll_pause_time: float = 1.5,
-        max_results: int = 100
+        max_results: int = 100,
+        required_fields: Tuple[str, ...] = DEFAULT_REQUIRED_FIELDS,
+        block_resources: bool = True
     ):
         """
         Initialize the Google Maps Scraper.
@@ -52,6 +138,9 @@ class GoogleMapsScraper:
             wait_time: Maximum wait time for elements to load
             scroll_pause_time: Pause time between scrolls
             max_results: Maximum number of results to scrape
+            required_fields: Fields each business must have; a business is only
+                opened in the details panel if its result tile lacks one of them
+            block_resources: Skip downloading images, fonts, map tiles and trackers
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -61,6 +150,8 @@ class GoogleMapsScraper:
         self.wait_time = wait_time
         self.scroll_pause_time = scroll_pause_time
         self.max_results = max_results
+        self.required_fields = tuple(required_fields)
+        self.block_resources = block_resources
         
         self.driver = None
         self.wait = None
@@ -82,6 +173,16 @@ class GoogleMapsScraper:
             "business_hours_content": "div[role='dialog']",
             "back_button": "button[jsaction*='pane.backButton']",
         }
+        
+        # (By, selector) locators built once for WebDriverWait conditions and find_element calls
+        self._locators = {key: (By.CSS_SELECTOR, selector) for key, selector in self.selectors.items()}
+        
+        # Elements found since the last navigation or click, see _find_present
+        self._dom_cache: Dict[Tuple[str, bool], Any] = {}
+        
+        # JSON Lines file businesses are written to as they are extracted, see open_output
+        self._output_stream = None
+        self._output_meta: Dict[str, Any] = {}
     
     def setup_driver(self) -> None:
         """
@@ -105,10 +206,24 @@ class GoogleMapsScraper:
             elif "https" in self.proxy:
                 chrome_options.add_argument(f"--proxy-server={self.proxy['https'].replace('https://', '')}")
         
+        if self.block_resources:
+            chrome_options.add_experimental_option("prefs", _RESOURCE_BLOCKING_PREFS)
+        
         # Create and configure the WebDriver
         self.driver = webdriver.Chrome(options=chrome_options)
+        widen_executor_pool(self.driver)
+        # Hung loads raise TimeoutException, which _open_url retries with backoff
+        self.driver.set_page_load_timeout(self.wait_time * 3)
         self.wait = WebDriverWait(self.driver, self.wait_time)
         
+        # Drop the remaining heavy requests (fonts via CSS, tiles, trackers) before they are sent
+        if self.block_resources:
+            try:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(_BLOCKED_URLS)})
+            except Exception as e:
+                print_warning_message(f"Could not configure request blocking: {str(e)}")
+        
         # Set window size for better visibility of elements
         self.driver.set_window_size(1920, 1080)
         print_success_message("Chrome WebDriver initialized successfully")
@@ -121,6 +236,33 @@ class GoogleMapsScraper:
             self.driver.quit()
             print_info_message("WebDriver closed and resources released")
     
+    def _find_present(self, key: str, all_elements: bool = False) -> Any:
+        """
+        Wait for the element (or all elements) for a selector key, reusing the
+        result until the page changes.
+        
+        Args:
+            key: Key into self.selectors
+            all_elements: Return every matching element instead of the first
+            
+        Returns:
+            The element, or the list of elements
+        """
+        cache_key = (key, all_elements)
+        if cache_key not in self._dom_cache:
+            condition = EC.presence_of_all_elements_located if all_elements else EC.presence_of_element_located
+            self._dom_cache[cache_key] = self.wait.until(condition(self._locators[key]))
+        return self._dom_cache[cache_key]
+    
+    def _invalidate_dom_cache(self) -> None:
+        """Forget found elements after anything that may replace the page content"""
+        self._dom_cache.clear()
+    
+    @with_backoff(TimeoutException, on_retry=_announce_retry)
+    def _open_url(self, url: str) -> None:
+        """Load a URL, retrying page-load timeouts with backoff"""
+        self.driver.get(url)
+    
     def search_query(self, query: str, location: Optional[str] = None) -> bool:
         """
         Perform a search on Google Maps.
@@ -134,12 +276,13 @@ class GoogleMapsScraper:
         """
         try:
             # Navigate to Google Maps
-            self.driver.get(self.base_url)
+            self._invalidate_dom_cache()
+            self._open_url(self.base_url)
             print_info_message(f"Navigated to {self.base_url}")
             
             # Wait for search box to be available
             search_box = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, self.selectors["search_box"]))
+                EC.presence_of_element_located(self._locators["search_box"])
             )
             
             # Clear and fill the search box
@@ -153,17 +296,16 @@ class GoogleMapsScraper:
             # Click search button or press Enter
             try:
                 search_button = self.wait.until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, self.selectors["search_button"]))
+                    EC.element_to_be_clickable(self._locators["search_button"])
                 )
                 search_button.click()
             except (TimeoutException, ElementClickInterceptedException):
                 # Fallback to pressing Enter
                 search_box.send_keys(Keys.ENTER)
+            self._invalidate_dom_cache()
             
             # Wait for results to load
-            self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, self.selectors["results_container"]))
-            )
+            self._find_present("results_container")
             
             print_success_message(f"Search for '{full_query}' completed successfully")
             return True
@@ -172,6 +314,36 @@ class GoogleMapsScraper:
             print_error_message(f"Failed to perform search: {str(e)}")
             return False
     
+    def _scroll_in_page(self, timeout: float = 300) -> Optional[int]:
+        """
+        Scroll the results panel until it stops growing or holds max_results items,
+        in one execute_async_script call instead of a round trip per scroll.
+        
+        Args:
+            timeout: Give up scrolling after this many seconds
+            
+        Returns:
+            Number of listings loaded, or None if the script could not run
+        """
+        previous_timeout = None
+        try:
+            previous_timeout = self.driver.timeouts.script
+            self.driver.set_script_timeout(timeout + 5)
+            return self.driver.execute_async_script(
+                SCROLL_UNTIL_LOADED_JS, self.selectors["results_container"], self.selectors["result_items"],
+                self.max_results, int(self.scroll_pause_time * 1000), 3, int(timeout * 1000)
+            )
+        except Exception as e:
+            print_warning_message(f"In-page scrolling failed, scrolling step by step: {str(e)}")
+            return None
+        finally:
+            # Keep later async scripts from inheriting the long timeout
+            if previous_timeout is not None:
+                try:
+                    self.driver.set_script_timeout(previous_timeout)
+                except Exception:
+                    pass
+    
     def scroll_results(self) -> int:
         """
         Scroll through the search results to load more items.
@@ -182,10 +354,18 @@ class GoogleMapsScraper:
         print_system_message("Scrolling through results to load all available listings...")
         
         try:
-            # Wait for the results container to be present
-            results_container = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, self.selectors["results_container"]))
-            )
+            # Wait for the results container to be present (already found by the search)
+            results_container = self._find_present("results_container")
+            
+            # Run the whole scroll loop inside the page; poll from here only if that fails
+            loaded = self._scroll_in_page()
+            if loaded is not None:
+                if loaded >= self.max_results:
+                    print_info_message(f"Reached maximum result limit: {self.max_results}")
+                else:
+                    print_info_message("No new listings found after multiple scrolls, likely reached the end")
+                print_success_message(f"Scrolling complete. Found {loaded} business listings")
+                return loaded
             
             # Track the number of items
             last_count = 0
@@ -194,7 +374,7 @@ class GoogleMapsScraper:
             # Scroll until no new items are loaded or max_results is reached
             while True:
                 # Get current items
-                items = self.driver.find_elements(By.CSS_SELECTOR, self.selectors["result_items"])
+                items = self.driver.find_elements(*self._locators["result_items"])
                 current_count = len(items)
                 
                 # Print the current count
@@ -227,7 +407,7 @@ class GoogleMapsScraper:
                 last_count = current_count
             
             # Final count after scrolling
-            final_items = self.driver.find_elements(By.CSS_SELECTOR, self.selectors["result_items"])
+            final_items = self.driver.find_elements(*self._locators["result_items"])
             final_count = len(final_items)
             
             print_success_message(f"Scrolling complete. Found {final_count} business listings")
@@ -237,10 +417,37 @@ class GoogleMapsScraper:
             print_error_message(f"Error while scrolling through results: {str(e)}")
             return 0
     
+    def _extract_tile_data_bulk(self) -> List[Dict[str, str]]:
+        """
+        Read the summary fields of every loaded result tile in one script call.
+        
+        Returns:
+            One dictionary per result item, in the same order as result_items,
+            including the place page URL under "url"
+        """
+        tiles = self.driver.execute_script(_TILE_FIELDS_JS, self.selectors["result_items"])
+        return tiles if isinstance(tiles, list) else []
+    
+    def needs_detail(self, business_data: Dict[str, Any]) -> bool:
+        """
+        Check whether a business still misses a required field after reading its tile.
+        
+        Args:
+            business_data: Data read so far for the business
+            
+        Returns:
+            True if the business has to be opened in the details panel
+        """
+        return any(not business_data.get(field) for field in self.required_fields)
+    
     def extract_business_data(self) -> List[Dict[str, Any]]:
         """
         Extract data from all visible business listings.
         
+        Tile data is read for every listing at once; a listing's place page is
+        only opened (by its URL, so the results list is never revisited) when a
+        required field is missing from its tile.
+        
         Returns:
             List of dictionaries containing business data
         """
@@ -249,9 +456,8 @@ class GoogleMapsScraper:
         all_business_data = []
         
         try:
-            # Get all result items
-            items = self.driver.find_elements(By.CSS_SELECTOR, self.selectors["result_items"])
-            total_items = len(items)
+            tiles = self._extract_tile_data_bulk()
+            total_items = len(tiles)
             
             if total_items == 0:
                 print_warning_message("No business listings found to extract")
@@ -260,37 +466,33 @@ class GoogleMapsScraper:
             print_info_message(f"Found {total_items} businesses to process")
             
             # Process each business listing
-            for index, item in enumerate(items[:self.max_results]):
+            for index, tile in enumerate(tiles[:self.max_results]):
                 print_info_message(f"Processing business {index + 1} of {min(total_items, self.max_results)}")
                 
+                place_url = tile.pop("url", "")
+                if not self.needs_detail(tile) or not place_url:
+                    tile["timestamp"] = time.strftime("%Y-%m-%d %H:%M:%S")
+                    all_business_data.append(tile)
+                    self._write_record(tile)
+                    print_success_message(f"Successfully extracted data for: {tile['name']}")
+                    continue
+                
                 try:
-                    # Click on the listing to view details
-                    item.click()
-                    time.sleep(2)  # Wait for business details to load
+                    # Open the business's place page directly
+                    self._invalidate_dom_cache()
+                    self._open_url(place_url)
                     
-                    # Extract business data
+                    # Extract business data, keeping tile values the details panel didn't provide
                     business_data = self._extract_current_business_data()
+                    for field, value in tile.items():
+                        if not business_data.get(field) or business_data[field] == "Unknown":
+                            business_data[field] = value or business_data.get(field, "")
                     
                     if business_data:
                         all_business_data.append(business_data)
+                        self._write_record(business_data)
                         print_success_message(f"Successfully extracted data for: {business_data.get('name', 'Unknown Business')}")
                     
-                    # Go back to the results list
-                    back_button = self.wait.until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, self.selectors["back_button"]))
-                    )
-                    back_button.click()
-                    time.sleep(1.5)  # Wait for results to reload
-                    
-                    # Re-find the items as the DOM has likely been refreshed
-                    items = self.driver.find_elements(By.CSS_SELECTOR, self.selectors["result_items"])
-                    
-                except (StaleElementReferenceException, ElementClickInterceptedException):
-                    # If element becomes stale, refresh the items list
-                    print_warning_message(f"Element reference issue with item {index + 1}, skipping")
-                    items = self.driver.find_elements(By.CSS_SELECTOR, self.selectors["result_items"])
-                    continue
-                    
                 except Exception as e:
                     print_error_message(f"Error processing business {index + 1}: {str(e)}")
                     continue
@@ -312,56 +514,35 @@ class GoogleMapsScraper:
         business_data = {}
         
         try:
-            # Extract business name
+            # Wait for the details panel, then read all text fields in one script call
             try:
-                name_element = self.wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, self.selectors["business_name"]))
+                self.wait.until(
+                    EC.visibility_of_element_located(self._locators["business_name"])
                 )
-                business_data["name"] = name_element.text.strip()
             except TimeoutException:
-                business_data["name"] = "Unknown"
-            
-            # Extract business category
-            try:
-                category_element = self.driver.find_element(By.CSS_SELECTOR, self.selectors["business_category"])
-                business_data["category"] = category_element.text.strip()
-            except NoSuchElementException:
-                business_data["category"] = ""
+                pass
             
-            # Extract address
-            try:
-                address_element = self.driver.find_element(By.CSS_SELECTOR, self.selectors["business_address"])
-                business_data["address"] = address_element.text.strip()
-            except NoSuchElementException:
-                business_data["address"] = ""
+            fields = self.driver.execute_script(_BUSINESS_FIELDS_JS, self.selectors)
+            hours_button_present = fields.pop("hours_button_present")
+            business_data.update(fields)
+            business_data["name"] = business_data["name"] or "Unknown"
             
-            # Extract website
-            try:
-                website_element = self.driver.find_element(By.CSS_SELECTOR, self.selectors["business_website"])
-                business_data["website"] = website_element.text.strip()
-            except NoSuchElementException:
-                business_data["website"] = ""
-            
-            # Extract phone number
-            try:
-                phone_element = self.driver.find_element(By.CSS_SELECTOR, self.selectors["business_phone"])
-                business_data["phone"] = phone_element.text.strip()
-            except NoSuchElementException:
-                business_data["phone"] = ""
-            
-            # Extract business hours
-            try:
-                hours_button = self.driver.find_element(By.CSS_SELECTOR, self.selectors["business_hours_button"])
-                hours_button.click()
-                time.sleep(1)  # Wait for hours dialog to open
-                
-                hours_content = self.driver.find_element(By.CSS_SELECTOR, self.selectors["business_hours_content"])
-                business_data["hours"] = hours_content.text.strip()
-                
-                # Close the hours dialog by clicking outside
-                self.driver.find_element(By.TAG_NAME, "body").click()
-            except (NoSuchElementException, ElementClickInterceptedException):
-                business_data["hours"] = ""
+            # Extract business hours (only open the dialog when there is a button for it)
+            business_data["hours"] = ""
+            if hours_button_present:
+                try:
+                    hours_button = self.driver.find_element(*self._locators["business_hours_button"])
+                    hours_button.click()
+                    
+                    hours_content = self.wait.until(
+                        EC.visibility_of_element_located(self._locators["business_hours_content"])
+                    )
+                    business_data["hours"] = hours_content.text.strip()
+                    
+                    # Close the hours dialog by clicking outside
+                    self.driver.find_element(By.TAG_NAME, "body").click()
+                except (NoSuchElementException, ElementClickInterceptedException, TimeoutException):
+                    pass
             
             # Add timestamp
             business_data["timestamp"] = time.strftime("%Y-%m-%d %H:%M:%S")
@@ -372,13 +553,14 @@ class GoogleMapsScraper:
             print_error_message(f"Error extracting data for current business: {str(e)}")
             return business_data
     
-    def save_data(self, data: List[Dict[str, Any]], search_query: str) -> str:
+    def save_data(self, data: List[Dict[str, Any]], search_query: str, pretty: bool = False) -> str:
         """
         Save the scraped data to a JSON file.
         
         Args:
             data: List of business data dictionaries
             search_query: The search query used
+            pretty: Indent the JSON for reading by hand
             
         Returns:
             Path to the saved file
@@ -403,8 +585,8 @@ class GoogleMapsScraper:
             }
             
             # Save to JSON file
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+            with open(filepath, "wb") as f:
+                f.write(_dump_json(output_data, pretty))
             
             print_success_message(f"Scraped data saved to: {filepath}")
             return str(filepath)
@@ -413,6 +595,69 @@ class GoogleMapsScraper:
             print_error_message(f"Failed to save data: {str(e)}")
             return ""
     
+    def open_output(self, search_query: str) -> Path:
+        """
+        Start a JSON Lines output file that extracted businesses are appended to
+        one per line as soon as they are extracted, so a crash keeps everything
+        scraped so far. Query, timestamp and count go to a .meta.json sidecar
+        written by close_output.
+        
+        Args:
+            search_query: The search query used
+            
+        Returns:
+            Path to the output file
+        """
+        self.close_output()
+        
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        safe_query = search_query.replace(" ", "_").lower()
+        filepath = self.output_dir / f"gmaps_{safe_query}_{timestamp}.jsonl"
+        
+        # Unbuffered: every record reaches the file with its own single write
+        self._output_stream = open(filepath, "wb", buffering=0)
+        self._output_meta = {"search_query": search_query, "timestamp": timestamp, "count": 0}
+        return filepath
+    
+    def _write_record(self, business_data: Dict[str, Any]) -> None:
+        """Append one business to the open output file, if any"""
+        if self._output_stream is None:
+            return
+        if orjson:
+            line = orjson.dumps(business_data, option=orjson.OPT_APPEND_NEWLINE)
+        else:
+            line = (json.dumps(business_data, ensure_ascii=False) + "\n").encode("utf-8")
+        self._output_stream.write(line)
+        self._output_meta["count"] += 1
+    
+    def close_output(self) -> str:
+        """
+        Close the output file opened by open_output and write its .meta.json sidecar.
+        
+        Returns:
+            Path to the output file, or "" if nothing was written
+        """
+        if self._output_stream is None:
+            return ""
+        
+        filepath = Path(self._output_stream.name)
+        self._output_stream.close()
+        self._output_stream = None
+        
+        if not self._output_meta["count"]:
+            filepath.unlink(missing_ok=True)
+            print_warning_message("No data to save")
+            return ""
+        
+        try:
+            with open(filepath.with_suffix(".meta.json"), "w", encoding="utf-8") as f:
+                json.dump(self._output_meta, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print_error_message(f"Failed to save data summary: {str(e)}")
+        
+        print_success_message(f"Scraped data saved to: {filepath}")
+        return str(filepath)
+    
     def run(self, query: str, location: Optional[str] = None) -> Tuple[List[Dict[str, Any]], str]:
         """
         Run the complete scraping process.
@@ -434,8 +679,13 @@ class GoogleMapsScraper:
             if not self.search_query(query, location):
                 raise Exception("Search failed")
             
-            # Allow the page to load fully
-            time.sleep(3)
+            # Wait for the first listings before scrolling (none at all is handled below)
+            try:
+                self.wait.until(
+                    EC.presence_of_element_located(self._locators["result_items"])
+                )
+            except TimeoutException:
+                pass
             
             # Scroll to load all results
             result_count = self.scroll_results()
@@ -445,12 +695,13 @@ class GoogleMapsScraper:
                 self.close_driver()
                 return [], ""
             
-            # Extract business data
-            business_data = self.extract_business_data()
-            
-            # Save the data
+            # Extract business data, saving each business as it is extracted
             full_query = f"{query} {location}" if location else query
-            output_file = self.save_data(business_data, full_query)
+            self.open_output(full_query)
+            try:
+                business_data = self.extract_business_data()
+            finally:
+                output_file = self.close_output()
             
             # Cleanup
             self.close_driver()
@@ -476,6 +727,10 @@ def main():
     parser.add_argument("--headless", action="store_true", help="Run browser in headless mode")
     parser.add_argument("--max-results", "-m", type=int, default=100, help="Maximum number of results to scrape")
     parser.add_argument("--proxy", "-p", help="Proxy in format 'ip:port'")
+    parser.add_argument("--load-resources", action="store_true",
+                        help="Download images, fonts and map tiles instead of blocking them")
+    parser.add_argument("--listing-only", action="store_true",
+                        help="Only save fields shown in the results list (no website, phone or hours), without opening each business")
     
     args = parser.parse_args()
     
@@ -492,7 +747,9 @@ def main():
         output_dir=args.output,
         headless=args.headless,
         proxy=proxy,
-        max_results=args.max_results
+        max_results=args.max_results,
+        required_fields=LISTING_REQUIRED_FIELDS if args.listing_only else DEFAULT_REQUIRED_FIELDS,
+        block_resources=not args.load_resources
     )
     
     scraper.run(args.query, args.location)
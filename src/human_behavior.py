@@ -21,6 +21,9 @@ class HumanBehavior:
         """
         self.driver = driver
         self.action_chains = ActionChains(driver)
+        # Each instance draws from its own generator, so workers driving separate
+        # sessions in parallel do not share the module-level random state
+        self._random = random.Random()
     
     def random_delay(self, min_seconds: float = 1.0, max_seconds: float = 5.0) -> None:
         """
@@ -30,7 +33,7 @@ class HumanBehavior:
             min_seconds: Minimum wait time in seconds
             max_seconds: Maximum wait time in seconds
         """
-        delay = random.uniform(min_seconds, max_seconds)
+        delay = self._random.uniform(min_seconds, max_seconds)
         time.sleep(delay)
     
     def human_type(self, element: WebElement, text: str, min_delay: float = 0.1, max_delay: float = 0.3) -> None:
@@ -46,7 +49,7 @@ class HumanBehavior:
         element.clear()
         for char in text:
             element.send_keys(char)
-            delay = random.uniform(min_delay, max_delay)
+            delay = self._random.uniform(min_delay, max_delay)
             time.sleep(delay)
         
         # Add a final delay before pressing Enter
@@ -67,8 +70,8 @@ class HumanBehavior:
         width, height = size['width'], size['height']
         
         # Calculate random offset from center (but ensure we stay within the element)
-        x_offset = random.randint(-min(offset_range, width // 2), min(offset_range, width // 2))
-        y_offset = random.randint(-min(offset_range, height // 2), min(offset_range, height // 2))
+        x_offset = self._random.randint(-min(offset_range, width // 2), min(offset_range, width // 2))
+        y_offset = self._random.randint(-min(offset_range, height // 2), min(offset_range, height // 2))
         
         # Move to random position within element and click
         try:
@@ -86,13 +89,13 @@ class HumanBehavior:
             direction: 'up' or 'down'
         """
         if scroll_amount is None:
-            scroll_amount = random.randint(300, 700)
+            scroll_amount = self._random.randint(300, 700)
         
         if direction == "up":
             scroll_amount = -scroll_amount
         
         # Split scroll into several smaller scrolls
-        num_steps = random.randint(3, 7)
+        num_steps = self._random.randint(3, 7)
         scroll_step = scroll_amount // num_steps
         
         for _ in range(num_steps):
@@ -111,8 +114,8 @@ class HumanBehavior:
         viewport_height = self.driver.execute_script("return window.innerHeight;")
         
         for _ in range(num_movements):
-            x = random.randint(0, viewport_width)
-            y = random.randint(0, viewport_height)
+            x = self._random.randint(0, viewport_width)
+            y = self._random.randint(0, viewport_height)
             
             self.action_chains.move_by_offset(x, y).perform()
             self.random_delay(0.1, 0.5)
@@ -126,7 +129,7 @@ class HumanBehavior:
             hover_time: Time to hover in seconds, random if None
         """
         if hover_time is None:
-            hover_time = random.uniform(0.5, 2.0)
+            hover_time = self._random.uniform(0.5, 2.0)
         
         try:
             self.action_chains.move_to_element(element).perform()
@@ -138,7 +141,7 @@ class HumanBehavior:
     def human_navigate_back(self) -> None:
         """Navigate back using browser back button with human-like behavior."""
         # Small chance to use keyboard shortcut instead of browser button
-        if random.random() < 0.2:
+        if self._random.random() < 0.2:
             self.action_chains.key_down(Keys.ALT).send_keys(Keys.LEFT).key_up(Keys.ALT).perform()
         else:
             self.driver.back()
@@ -3,8 +3,10 @@ import sys
 import json
 import time
 import random
+import asyncio
 import argparse
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
@@ -12,11 +14,13 @@ from datetime import datetime
 from src.proxy_manager import ProxyManager
 from src.browser_manager import BrowserManager
 from src.console_output import (
+    print_message,
     print_system_message, 
     print_info_message, 
     print_warning_message, 
     print_error_message, 
-    print_success_message
+    print_success_message,
+    flush_console
 )
 from src.human_behavior import HumanBehavior
 from src.data_extractor import DataExtractor
@@ -57,6 +61,8 @@ class GoogleMapsScraper:
         self.browser_type = browser_type
         self.max_results = max_results
         self.listings_per_proxy = listings_per_proxy
+        self.proxy_test_url = proxy_test_url
+        self.target_proxy_count = target_proxy_count
         
         # Initialize managers
         self.proxy_manager = ProxyManager(
@@ -111,15 +117,6 @@ class GoogleMapsScraper:
         Returns:
             True if successful, False otherwise
         """
-        # Close any existing browser
-        if self.current_browser:
-            try:
-                self.current_browser.quit()
-            except Exception as e:
-                print_warning_message(f"Error closing browser: {e}")
-            finally:
-                self.current_browser = None
-        
         # Get a new proxy
         self.current_proxy = self.proxy_manager.get_next_proxy()
         if not self.current_proxy:
@@ -132,10 +129,23 @@ class GoogleMapsScraper:
         else:
             proxy_str = self.current_proxy.get('http', 'unknown')
             print_system_message(f"Deploying digital proxy: {proxy_str}")
+        
+        # Keep a running browser and only switch the proxy behind its local forwarder
+        if self.current_browser:
+            try:
+                if self.browser_manager.set_proxy(self.current_proxy):
+                    self.browser_manager.clear_browsing_data(self.current_browser)
+                    return True
+            except Exception as e:
+                print_warning_message(f"Could not switch proxy in place, restarting browser: {e}")
+            try:
+                self.browser_manager.close_browser(self.current_browser)
+            finally:
+                self.current_browser = None
             
         # Try to get a browser with the new proxy
         try:
-            self.current_browser = self.browser_manager.get_browser(self.current_proxy)
+            self.current_browser = self.browser_manager.get_browser(self.current_proxy, rotatable=True)
             return True
         except Exception as e:
             print_error_message(f"Failed to initialize browser with proxy: {e}")
@@ -155,7 +165,7 @@ class GoogleMapsScraper:
             True if the error was handled and scraping should continue,
             False if scraping should stop
         """
-        print(f"Error during search: {error}")
+        print_message(f"Error during search: {error}")
         
         # Report proxy failure if using a proxy
         if self.current_proxy:
@@ -247,6 +257,7 @@ class GoogleMapsScraper:
                 print_system_message(f"Target acquired. Extracting {self.max_results} data nodes for: '{query}'")
             else:
                 print_system_message(f"Target acquired. Extracting ALL available data nodes for: '{query}'")
+            flush_console()
             results = self.data_extractor.get_listing_results(max_results=self.max_results)
             
             print_success_message(f"Digital heist complete! Extracted {len(results)} data packages.")
@@ -257,6 +268,7 @@ class GoogleMapsScraper:
                 json.dump(results, f, ensure_ascii=False, indent=2)
             
             print_system_message(f"Data saved to encrypted storage: {output_file}")
+            flush_console()
             
             # Report proxy success
             self.proxy_manager.report_proxy_success(self.current_proxy)
@@ -267,40 +279,46 @@ class GoogleMapsScraper:
         finally:
             # Close the browser
             if self.current_browser:
-                self.current_browser.quit()
+                self.browser_manager.close_browser(self.current_browser)
                 self.current_browser = None
         
         return all_results
     
     def scrape_multiple_queries(self, queries: List[str], output_prefix: str = "gmaps_results", max_workers: int = None) -> Dict[str, List[Dict]]:
         """
-        Scrape multiple queries using multithreading.
+        Scrape multiple queries concurrently.
         
         Args:
             queries: List of search queries
             output_prefix: Prefix for output filenames
-            max_workers: Maximum number of worker threads (default: CPU count)
+            max_workers: Maximum number of queries scraped at once (default: 3)
             
         Returns:
             Dictionary mapping queries to their results
         """
-        results = {}
-        
-        # Determine the maximum number of worker threads (default to CPU count)
-        if max_workers is None:
-            max_workers = min(multiprocessing.cpu_count(), len(queries))
-        
-        print_system_message(f"Deploying {max_workers} parallel neural interfaces for {len(queries)} queries.")
+        return asyncio.run(self.run_many(queries, output_prefix, max_workers or 3))
+    
+    async def run_many(self, queries: List[str], output_prefix: str = "gmaps_results", max_concurrency: int = 3) -> Dict[str, List[Dict]]:
+        """
+        Scrape multiple queries from asyncio code, each in its own scraper (own
+        browser and proxy) on a worker thread.
         
-        def scrape_query(args):
-            """Worker function for thread pool"""
-            i, query = args
-            print(f"\n{self.get_status_message(i+1, len(queries))}")
+        Args:
+            queries: List of search queries
+            output_prefix: Prefix for output filenames
+            max_concurrency: Maximum number of queries scraped at once
             
-            # Generate unique filename
-            filename = f"{output_prefix}_{i+1}"
+        Returns:
+            Dictionary mapping queries to their results, in query order
+        """
+        max_concurrency = max(1, min(max_concurrency, len(queries)))
+        print_system_message(f"Deploying {max_concurrency} parallel neural interfaces for {len(queries)} queries.")
+        
+        def scrape_query(i: int, query: str) -> List[Dict]:
+            """Worker function for the thread pool"""
+            print_message(f"\n{self.get_status_message(i+1, len(queries))}")
             
-            # Create a new scraper instance for each thread
+            # Create a new scraper instance for each query
             scraper = GoogleMapsScraper(
                 output_dir=self.output_dir,
                 headless=self.headless,
@@ -310,19 +328,20 @@ class GoogleMapsScraper:
                 proxy_test_url=self.proxy_test_url,
                 target_proxy_count=self.target_proxy_count
             )
-            
-            # Scrape the query
-            query_results = scraper.scrape(query, filename)
-            return query, query_results
+            return scraper.scrape(query, f"{output_prefix}_{i+1}")
+        
+        async def run_query(i: int, query: str) -> List[Dict]:
+            query_results = await loop.run_in_executor(pool, scrape_query, i, query)
+            print_system_message(f"Query completed: {query} - {len(query_results)} results")
+            return query_results
         
-        # Use ThreadPoolExecutor for parallel scraping
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            for query, query_results in executor.map(scrape_query, enumerate(queries)):
-                results[query] = query_results
-                print_system_message(f"Query completed: {query} - {len(query_results)} results")
+        # The pool size bounds how many browsers run at once
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+            all_results = await asyncio.gather(*(run_query(i, query) for i, query in enumerate(queries)))
         
         print_success_message(f"All {len(queries)} queries successfully processed!")
-        return results
+        return dict(zip(queries, all_results))
 
 
 def parse_arguments():
@@ -337,7 +356,7 @@ def parse_arguments():
     parser.add_argument("--max-results", "-m", type=int, default=0, help="Maximum number of results to scrape per query (0 = unlimited)")
     parser.add_argument("--listings-per-proxy", "-l", type=int, default=0, help="Number of listings to scrape before rotating proxy (0 = unlimited)")
     parser.add_argument("--proxy-test-url", "-p", type=str, default="http://httpbin.org/ip", help="URL to use for testing proxies")
-    parser.add_argument("--threads", "-t", type=int, default=None, help="Number of threads for parallel scraping (default: CPU count)")
+    parser.add_argument("--threads", "-t", type=int, default=None, help="Number of queries scraped in parallel (default: 3)")
     parser.add_argument("--target-proxy-count", "-c", type=int, default=10, help="Number of working proxies to find (default: 10)")
     
     return parser.parse_args()
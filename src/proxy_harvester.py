@@ -7,8 +7,10 @@ and saves working proxies to a CSV file for later use.
 
 import csv
 import time
+import asyncio
 import threading
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import random
 import json
@@ -18,6 +20,13 @@ from pathlib import Path
 from typing import List, Dict, Tuple, Optional, Set
 from datetime import datetime
 
+# aiohttp is optional; without it proxy validation falls back to a thread pool
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 # Import the console output module for consistent styling
 try:
     from console_output import (
@@ -35,13 +44,15 @@ except ImportError:
 class ProxyHarvester:
     """Harvests working proxies from various free proxy sources."""
     
-    def __init__(self, output_dir: str = "../data", country_filter: str = "US"):
+    def __init__(self, output_dir: str = "../data", country_filter: str = "US",
+                 session: Optional[requests.Session] = None):
         """
         Initialize the proxy harvester.
         
         Args:
             output_dir: Directory to save the CSV file
             country_filter: Only include proxies from this country ('ALL' for no filter)
+            session: Optional requests session to reuse (one with a pooled adapter is created if omitted)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -83,6 +94,9 @@ class ProxyHarvester:
         self.max_proxies_per_source = 100  # Limit proxies per source to avoid processing too many
         self.min_speed_threshold = 5.0  # Max seconds for a proxy to be considered "fast"
         
+        # Shared keep-alive session so source fetches and proxy tests reuse sockets
+        self.session = session or self._create_session()
+        
         # Use user-agents to mimic real browsers when testing proxies
         self.user_agents = [
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -101,6 +115,20 @@ class ProxyHarvester:
         # Timestamp for output files
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
+    def _create_session(self) -> requests.Session:
+        """
+        Create a requests session with a connection pool sized for concurrent testing.
+        
+        Returns:
+            Configured requests session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        return session
+    
     def _scrape_free_proxy_list(self, url: str) -> List[Dict[str, str]]:
         """
         Scrape proxies from free-proxy-list.net and similar sites.
@@ -114,7 +142,7 @@ class ProxyHarvester:
         proxies = []
         try:
             print_info_message(f"Intercepting digital signals from {url}")
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             soup = BeautifulSoup(response.text, "html.parser")
             
             # Find the proxy table
@@ -224,7 +252,7 @@ class ProxyHarvester:
             
             # Random user agent for request
             headers = {"User-Agent": random.choice(self.user_agents)}
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=headers, timeout=10)
             
             if response.status_code != 200:
                 print_warning_message(f"API returned status {response.status_code} for {url}")
@@ -333,7 +361,7 @@ class ProxyHarvester:
             
             # Random user agent for request
             headers = {"User-Agent": random.choice(self.user_agents)}
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=headers, timeout=10)
             
             if response.status_code != 200:
                 print_warning_message(f"Text source returned status {response.status_code} for {url}")
@@ -413,34 +441,12 @@ class ProxyHarvester:
         
         start_time = time.time()
         try:
-            response = requests.get(test_url, proxies=proxies, headers=headers, timeout=self.timeout)
+            response = self.session.get(test_url, proxies=proxies, headers=headers, timeout=self.timeout)
             response_time = time.time() - start_time
             
             if response.status_code == 200:
-                # For httpbin.org, check if the origin IP matches the proxy IP
-                if "httpbin.org" in test_url:
-                    returned_ip = response.json().get('origin', '').split(',')[0]
-                # For icanhazip.com
-                elif "icanhazip.com" in test_url:
-                    returned_ip = response.text.strip()
-                # For api.myip.com
-                elif "myip.com" in test_url:
-                    returned_ip = response.json().get('ip', '')
-                else:
-                    returned_ip = "unknown"
-                
-                # Perform anonymity check
-                anonymity_level = self._check_anonymity(proxy, returned_ip)
-                
-                # Update proxy with test results
-                proxy["working"] = True
-                proxy["returned_ip"] = returned_ip
-                proxy["response_time"] = round(response_time, 2)
-                proxy["anonymity"] = anonymity_level
-                proxy["speed_category"] = self._categorize_speed(response_time)
-                proxy["last_checked"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                
-                return proxy
+                returned_ip = self._parse_returned_ip(test_url, response.text)
+                return self._mark_working(proxy, returned_ip, response_time)
         except requests.exceptions.ConnectTimeout:
             # Specific timeout error
             return None
@@ -454,6 +460,112 @@ class ProxyHarvester:
             
         return None
         
+    async def _test_proxy_async(self, session, proxy: Dict[str, str]) -> Optional[Dict[str, str]]:
+        """
+        Test a single proxy through a shared aiohttp session.
+        
+        Args:
+            session: aiohttp.ClientSession used for all validation requests
+            proxy: Proxy dictionary with format {'http': 'http://ip:port'}
+            
+        Returns:
+            Updated proxy dict if working, None otherwise
+        """
+        test_url = random.choice(self.test_urls)
+        headers = {"User-Agent": random.choice(self.user_agents)}
+        
+        start_time = time.time()
+        try:
+            async with session.get(test_url, proxy=proxy["http"], headers=headers) as response:
+                if response.status != 200:
+                    return None
+                body = await response.text()
+            response_time = time.time() - start_time
+            
+            returned_ip = self._parse_returned_ip(test_url, body)
+            return self._mark_working(proxy, returned_ip, response_time)
+        except Exception:
+            return None
+    
+    async def _validate_proxies(self, candidates: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Test all candidate proxies concurrently on a single event loop.
+        
+        Args:
+            candidates: List of proxy dictionaries to test
+            
+        Returns:
+            List of working proxy dictionaries (unsorted)
+        """
+        working_proxies = []
+        proxy_count = len(candidates)
+        
+        connector = aiohttp.TCPConnector(limit=self.max_workers, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            tasks = [self._test_proxy_async(session, proxy) for proxy in candidates]
+            
+            tested = 0
+            for task in asyncio.as_completed(tasks):
+                result = await task
+                tested += 1
+                if tested % 10 == 0 or tested == proxy_count:
+                    print_info_message(f"Tested {tested}/{proxy_count} proxies")
+                
+                if result:
+                    working_proxies.append(result)
+                    print_success_message(f"Found working proxy: {result['http']} ({result['country']}) - {result['response_time']}s")
+        
+        return working_proxies
+    
+    def _parse_returned_ip(self, test_url: str, body: str) -> str:
+        """
+        Extract the IP address reported by a test endpoint.
+        
+        Args:
+            test_url: URL the test request was sent to
+            body: Raw response body
+            
+        Returns:
+            Reported IP address, or 'unknown' for unrecognised endpoints
+        """
+        # For httpbin.org, check if the origin IP matches the proxy IP
+        if "httpbin.org" in test_url:
+            return json.loads(body).get('origin', '').split(',')[0]
+        # For icanhazip.com
+        elif "icanhazip.com" in test_url:
+            return body.strip()
+        # For api.myip.com
+        elif "myip.com" in test_url:
+            return json.loads(body).get('ip', '')
+        return "unknown"
+    
+    def _mark_working(self, proxy: Dict[str, str], returned_ip: str, response_time: float) -> Dict[str, str]:
+        """
+        Update a proxy dictionary with the results of a successful test.
+        
+        Args:
+            proxy: Proxy dictionary that passed the test
+            returned_ip: IP reported by the test endpoint
+            response_time: Request round-trip time in seconds
+            
+        Returns:
+            The updated proxy dictionary
+        """
+        # Perform anonymity check
+        anonymity_level = self._check_anonymity(proxy, returned_ip)
+        
+        # Update proxy with test results
+        proxy["working"] = True
+        proxy["returned_ip"] = returned_ip
+        proxy["response_time"] = round(response_time, 2)
+        proxy["anonymity"] = anonymity_level
+        proxy["speed_category"] = self._categorize_speed(response_time)
+        proxy["last_checked"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        return proxy
+        
     def _check_anonymity(self, proxy: Dict[str, str], returned_ip: str) -> str:
         """
         Determine the anonymity level of a proxy based on returned IP.
@@ -509,20 +621,24 @@ class ProxyHarvester:
         print_system_message(f"Testing {proxy_count} digital proxies for viability...")
         print_info_message(f"Expected completion time: ~{max(1, proxy_count // self.max_workers)} seconds")
         
-        # Use ThreadPoolExecutor for concurrent testing
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_proxy = {executor.submit(self.test_proxy, proxy): proxy for proxy in proxies}
-            
-            tested = 0
-            for future in as_completed(future_to_proxy):
-                tested += 1
-                if tested % 10 == 0 or tested == proxy_count:
-                    print_info_message(f"Tested {tested}/{proxy_count} proxies")
-                    
-                result = future.result()
-                if result:
-                    working_proxies.append(result)
-                    print_success_message(f"Found working proxy: {result['http']} ({result['country']}) - {result['response_time']}s")
+        if AIOHTTP_AVAILABLE:
+            # Fan out all tests on one event loop so setup costs ~one round trip
+            working_proxies = asyncio.run(self._validate_proxies(proxies))
+        else:
+            # Use ThreadPoolExecutor for concurrent testing
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                future_to_proxy = {executor.submit(self.test_proxy, proxy): proxy for proxy in proxies}
+                
+                tested = 0
+                for future in as_completed(future_to_proxy):
+                    tested += 1
+                    if tested % 10 == 0 or tested == proxy_count:
+                        print_info_message(f"Tested {tested}/{proxy_count} proxies")
+                        
+                    result = future.result()
+                    if result:
+                        working_proxies.append(result)
+                        print_success_message(f"Found working proxy: {result['http']} ({result['country']}) - {result['response_time']}s")
         
         # Sort by response time (fastest first)
         working_proxies.sort(key=lambda x: x.get('response_time', 999))
@@ -676,6 +792,28 @@ class ProxyHarvester:
         print_success_message(f"Selected {len(best_proxies)} optimal proxies from pool of {len(proxies)}")
         return best_proxies
 
+    def harvest_and_test(self, limit: int = 5, proxy_type: str = "all") -> List[Dict[str, str]]:
+        """
+        Harvest and validate proxies, returning the best matches for immediate use.
+        
+        Args:
+            limit: Maximum number of proxies to return
+            proxy_type: Anonymity level to keep ('elite', 'anonymous', 'all')
+            
+        Returns:
+            List of working proxies, best first
+        """
+        candidates = self.scrape_all_sources()
+        if not candidates:
+            print_error_message("No proxies found from any source. Extraction failed.")
+            return []
+        
+        working_proxies = self.test_proxies(candidates)
+        if proxy_type != "all":
+            working_proxies = [p for p in working_proxies if p.get("anonymity") == proxy_type]
+        
+        return self.select_best_proxies(working_proxies, count=limit)
+
     def run(self, country_filter: str = None) -> Tuple[List[Dict[str, str]], int, int]:
         """
         Run the full proxy harvesting process.
@@ -13,6 +13,7 @@ from datetime import datetime, timedelta
 
 # Import the new proxy harvester
 from src.proxy_harvester import ProxyHarvester
+from src.console_output import print_message
 
 class ProxyManager:
     """Manages proxy retrieval, testing, and rotation."""
@@ -53,7 +54,7 @@ class ProxyManager:
                      list(self.proxy_cache_dir.glob("working_proxies_*.json"))
         
         if not proxy_files:
-            print("No cached proxy files found.")
+            print_message("No cached proxy files found.")
             return False
         
         # Sort by modification time, newest first
@@ -63,7 +64,7 @@ class ProxyManager:
         # Check if the file is recent (less than 24 hours old)
         file_age = time.time() - newest_proxy_file.stat().st_mtime
         if file_age > 86400:  # 24 hours in seconds
-            print(f"Cached proxy file {newest_proxy_file.name} is older than 24 hours.")
+            print_message(f"Cached proxy file {newest_proxy_file.name} is older than 24 hours.")
             return False
         
         # Load the proxies
@@ -86,10 +87,10 @@ class ProxyManager:
                 
                 # Convert to our format
                 self.working_proxies = proxies
-                print(f"Loaded {len(self.working_proxies)} proxies from {csv_path}")
+                print_message(f"Loaded {len(self.working_proxies)} proxies from {csv_path}")
                 return True
         except Exception as e:
-            print(f"Error loading proxies from CSV: {e}")
+            print_message(f"Error loading proxies from CSV: {e}")
             return False
 
     def _load_from_json(self, json_path: Path) -> bool:
@@ -104,10 +105,10 @@ class ProxyManager:
                 if 'blacklisted_proxies' in data:
                     self.blacklisted_proxies = data['blacklisted_proxies']
                 
-                print(f"Loaded {len(self.working_proxies)} proxies from {json_path}")
+                print_message(f"Loaded {len(self.working_proxies)} proxies from {json_path}")
                 return len(self.working_proxies) > 0
         except Exception as e:
-            print(f"Error loading proxies from JSON: {e}")
+            print_message(f"Error loading proxies from JSON: {e}")
             return False
 
     def refresh_proxies(self) -> bool:
@@ -117,7 +118,7 @@ class ProxyManager:
         Returns:
             True if successful, False otherwise
         """
-        print("Running proxy harvester to refresh proxy list...")
+        print_message("Running proxy harvester to refresh proxy list...")
         harvester = ProxyHarvester(output_dir=str(self.proxy_cache_dir))
         working_proxies, csv_path, json_path = harvester.run()
         
@@ -137,7 +138,7 @@ class ProxyManager:
         """
         # Check if we should use direct connection
         if self.consecutive_proxy_failures >= self.max_proxy_failures and self.allow_direct_connection:
-            print(f"Using direct connection after {self.consecutive_proxy_failures} consecutive proxy failures")
+            print_message(f"Using direct connection after {self.consecutive_proxy_failures} consecutive proxy failures")
             return {"direct": True}
         
         # If no working proxies, try to refresh
@@ -146,7 +147,7 @@ class ProxyManager:
             if not proxies_loaded:
                 if not self.refresh_proxies():
                     if self.allow_direct_connection:
-                        print("No working proxies available. Using direct connection.")
+                        print_message("No working proxies available. Using direct connection.")
                         return {"direct": True}
                     return None
         
@@ -227,7 +228,7 @@ class ProxyManager:
             with open(filepath, "w") as jsonfile:
                 json.dump(data, jsonfile, indent=2)
         except Exception as e:
-            print(f"Error saving proxy lists: {e}")
+            print_message(f"Error saving proxy lists: {e}")
 
     def report_proxy_failure(self, proxy: Dict[str, str]):
         """
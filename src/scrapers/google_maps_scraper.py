@@ -9,6 +9,12 @@ import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Union
 
+# orjson is optional; it serializes output much faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.browsers.base import BaseBrowser
 from src.browsers.selenium_browser import SeleniumBrowser
 from src.common.logger import (
@@ -106,24 +112,22 @@ class GoogleMapsScraper(BaseScraper):
             browser_type = kwargs.get('browser_type', 'chrome')
             
             # Enhanced Chrome arguments to fix transparency and freezing issues on Linux
-            chrome_arguments = {
-                # Basic rendering fixes
-                'disable-features': 'VizDisplayCompositor,IsolateOrigins,site-per-process',
-                
+            # (shared-memory and background-service flags come from SeleniumBrowser's
+            # CONTAINER_SAFE_ARGS). Headless runs keep GPU rasterization enabled.
+            gpu_fixes = {} if headless else {
                 # Aggressive rendering fixes for Linux transparency/freezing issues
-                'disable-gpu': '',
                 'disable-gpu-compositing': '',
                 'disable-gpu-vsync': '',
-                'disable-software-rasterizer': '',
                 'disable-gpu-rasterization': '',
+            }
+            chrome_arguments = {
+                **gpu_fixes,
                 
                 # Force compositing mode and layers
                 'force-color-profile': 'srgb',
                 'force-device-scale-factor': '1',
                 
                 # Window and UI fixes
-                'disable-background-networking': '',
-                'disable-default-apps': '',
                 'window-size': '1920,1080',
                 'window-position': '0,0',
                 
@@ -136,7 +140,9 @@ class GoogleMapsScraper(BaseScraper):
                 headless=headless,
                 browser_type=browser_type,
                 chrome_arguments=chrome_arguments,
-                proxy=proxy
+                proxy=proxy,
+                block_resources=kwargs.get('block_resources', False),
+                undetected=kwargs.get('undetected', True)
             )
             
             if not success:
@@ -254,14 +260,28 @@ class GoogleMapsScraper(BaseScraper):
                 print_error_message("Results container not found")
                 return 0
             
+            # Run the whole scroll loop inside the page; poll from here only if that fails
+            loaded = self.browser.scroll_until_loaded(
+                self.selectors["results_container"],
+                self.selectors["result_items"],
+                max_items=self.max_results,
+                pause=self.scroll_pause_time
+            )
+            if loaded is not None:
+                if 0 < self.max_results <= loaded:
+                    print_success_message(f"Reached maximum results limit: {self.max_results}")
+                else:
+                    print_success_message(f"No new results loaded after multiple scrolls, {loaded} listings loaded")
+                return loaded
+            
             # Track the number of items
             last_count = 0
             same_count_iterations = 0
             
             # Scroll until no new items are loaded or max_results is reached
             while True:
-                # Get current items
-                items = self.browser.find_elements(self.selectors["result_items"])
+                # Count current items (one script call, no element handles to transfer)
+                items = self.browser.batch_extract(self.selectors["result_items"], get_text=False)
                 current_count = len(items)
                 
                 # Print the current count
@@ -323,30 +343,31 @@ class GoogleMapsScraper(BaseScraper):
             # Wait for business details to load
             time.sleep(2)
             
-            # Extract business name
-            name_element = self.browser.wait_for_element(
+            # Wait for the business name, then read all detail fields in one call
+            self.browser.wait_for_element(
                 self.selectors["business_name"],
                 timeout=5
             )
-            name = self.browser.get_text(name_element) if name_element else "Unknown"
+            fields = self.browser.bulk_extract({
+                "name": {"selector": self.selectors["business_name"]},
+                "category": {"selector": self.selectors["business_category"]},
+                "address": {"selector": self.selectors["business_address"]},
+                "website": {"selector": self.selectors["business_website"], "attr": "href"},
+                "phone": {"selector": self.selectors["business_phone"]},
+            })
             
-            print_info_message(f"Extracting data for: {name}")
+            def first(key: str, default: str = "") -> str:
+                values = fields.get(key)
+                return values[0] if values and values[0] is not None else default
             
-            # Extract business category
-            category_element = self.browser.find_element(self.selectors["business_category"])
-            category = self.browser.get_text(category_element) if category_element else ""
+            name = first("name", "Unknown")
             
-            # Extract business address
-            address_element = self.browser.find_element(self.selectors["business_address"])
-            address = self.browser.get_text(address_element) if address_element else ""
-            
-            # Extract website
-            website_element = self.browser.find_element(self.selectors["business_website"])
-            website = self.browser.get_attribute(website_element, "href") if website_element else ""
+            print_info_message(f"Extracting data for: {name}")
             
-            # Extract phone number
-            phone_element = self.browser.find_element(self.selectors["business_phone"])
-            phone = self.browser.get_text(phone_element) if phone_element else ""
+            category = first("category")
+            address = first("address")
+            website = first("website")
+            phone = first("phone")
             
             # Extract hours of operation
             hours = ""
@@ -385,12 +406,13 @@ class GoogleMapsScraper(BaseScraper):
             print_error_message(f"Error extracting business data: {str(e)}")
             return None
     
-    def save_data(self, businesses: List[Dict[str, Any]]) -> str:
+    def save_data(self, businesses: List[Dict[str, Any]], pretty: bool = False) -> str:
         """
         Save the scraped business data to a JSON file.
         
         Args:
             businesses: List of business data dictionaries
+            pretty: Indent the JSON for reading by hand
             
         Returns:
             Path to the saved output file
@@ -418,20 +440,27 @@ class GoogleMapsScraper(BaseScraper):
         }
         
         # Write to file
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        if orjson:
+            payload = orjson.dumps(output_data, option=orjson.OPT_INDENT_2 if pretty else 0)
+        else:
+            payload = json.dumps(output_data, ensure_ascii=False, indent=2 if pretty else None).encode("utf-8")
+        with open(output_file, "wb") as f:
+            f.write(payload)
         
         print_success_message(f"Saved {len(businesses)} businesses to {output_file}")
         
         return str(output_file)
     
-    def run(self, query: str, location: Optional[str] = None, **kwargs) -> Tuple[List[Dict[str, Any]], str]:
+    def run(self, query: str, location: Optional[str] = None, keep_browser: bool = False,
+            **kwargs) -> Tuple[List[Dict[str, Any]], str]:
         """
         Run the Google Maps scraper.
         
         Args:
             query: Search query
             location: Optional location for the search
+            keep_browser: Leave the browser open afterwards so the next run can
+                reuse it; the caller is then responsible for calling cleanup()
             **kwargs: Additional options
             
         Returns:
@@ -443,6 +472,15 @@ class GoogleMapsScraper(BaseScraper):
         self.location = location  # Store location for graceful exit
         
         try:
+            # Reuse the browser from a previous run if its session is still usable
+            if self.browser:
+                if not (self.browser.initialized and self.browser.session_alive()
+                        and self.browser.reset_session()):
+                    if self.browser.initialized:
+                        print_warning_message("Browser session lost, starting a new browser")
+                    self.cleanup()
+                    self.browser = None
+            
             # Set up the browser if not already done
             if not self.browser:
                 if not self.setup(**kwargs):
@@ -486,5 +524,6 @@ class GoogleMapsScraper(BaseScraper):
             print_error_message(f"Error running Google Maps scraper: {str(e)}")
             return [], ""
         finally:
-            # Always clean up resources
-            self.cleanup()
+            # Clean up resources unless the caller wants to reuse the browser
+            if not keep_browser:
+                self.cleanup()
@@ -24,6 +24,8 @@ from src.common.logger import (
     system_message, info_message, warning_message, error_message, success_message,
     NEON_GREEN, INFO_CYAN, WARNING_YELLOW, ALERT_RED, SUCCESS_GREEN, RESET
 )
+# Scraper modules queue their output; drain it before reading input or writing directly
+from src.console_output import flush_console
 
 # ASCII Art for the retro terminal interface
 TRYLOBYTE_ASCII = r"""
@@ -228,80 +230,46 @@ class TryloByteCLI:
         """
         Clean up any browser processes that might be running.
         This helps prevent zombie processes and resource leaks.
-        Uses standard system tools to avoid dependencies.
+        Only descendants of this process are touched, so unrelated browsers keep running.
         """
-        import subprocess
-        import os
-        import signal
+        try:
+            import psutil
+        except ImportError:
+            print_warning_message("psutil not installed, skipping browser cleanup")
+            return
         
         try:
             print_info_message("Running browser cleanup...")
             
-            # Clean up Chrome/Chromium processes using pgrep and pkill
-            browser_process_patterns = [
-                "chrome", "chromium", "chromedriver", 
+            browser_process_names = (
+                "chrome", "chromium", "chromedriver",
                 "google-chrome", "chromium-browser",
                 "firefox", "geckodriver"
-            ]
+            )
             
-            # First, check if there are any matching processes
-            for pattern in browser_process_patterns:
+            # Collect browser processes started by this session (directly or via the scraper)
+            browser_processes = []
+            for child in psutil.Process().children(recursive=True):
                 try:
-                    # Use pgrep to find processes matching our pattern
-                    result = subprocess.run(
-                        ["pgrep", "-f", pattern], 
-                        capture_output=True, 
-                        text=True,
-                        check=False
-                    )
-                    
-                    # If we found matching processes
-                    if result.returncode == 0 and result.stdout.strip():
-                        pids = result.stdout.strip().split('\n')
-                        
-                        for pid_str in pids:
-                            try:
-                                pid = int(pid_str)
-                                
-                                # Try to check if this process has our tryloByte in its command line
-                                # to avoid killing unrelated browser processes
-                                cmd_result = subprocess.run(
-                                    ["ps", "-p", str(pid), "-o", "cmd="],
-                                    capture_output=True,
-                                    text=True,
-                                    check=False
-                                )
-                                
-                                cmd_line = cmd_result.stdout.lower()
-                                
-                                # Only kill if it seems to be related to our application
-                                if ("trylobyte" in cmd_line or 
-                                    "google_maps_scraper" in cmd_line or
-                                    "chromedriver" in cmd_line or
-                                    "--remote-debugging-port" in cmd_line):
-                                    
-                                    print_info_message(f"Terminating browser process: {pattern} (PID: {pid})")
-                                    
-                                    # Try graceful termination first
-                                    try:
-                                        os.kill(pid, signal.SIGTERM)
-                                    except:
-                                        # If graceful termination fails, force kill
-                                        try:
-                                            os.kill(pid, signal.SIGKILL)
-                                        except:
-                                            pass
-                            except ValueError:
-                                # Skip invalid PIDs
-                                pass
-                except subprocess.SubprocessError:
+                    name = child.name().lower()
+                except psutil.Error:
+                    continue
+                if any(pattern in name for pattern in browser_process_names):
+                    print_info_message(f"Terminating browser process: {name} (PID: {child.pid})")
+                    browser_processes.append(child)
+            
+            # Try graceful termination first, then force kill anything still running
+            for proc in browser_processes:
+                try:
+                    proc.terminate()
+                except psutil.Error:
                     pass
             
-            # Additional cleanup for any zombie Chromedriver or debugging ports
-            for cleanup_pattern in ["chromedriver", "chrome --remote-debugging-port"]:
+            _, alive = psutil.wait_procs(browser_processes, timeout=2)
+            for proc in alive:
                 try:
-                    subprocess.run(["pkill", "-f", cleanup_pattern], check=False)
-                except subprocess.SubprocessError:
+                    proc.kill()
+                except psutil.Error:
                     pass
             
             print_success_message("Browser cleanup completed")
@@ -352,6 +320,7 @@ Available commands:
                 
                 # Ask user if they want to install
                 print_info_message("Install missing packages? (y/n)")
+                flush_console()
                 choice = input(f"{NEON_GREEN}>>{RESET} ").lower()
                 
                 if choice.startswith('y'):
@@ -637,7 +606,8 @@ Available commands:
         history_index = len(self.command_history)
         saved_current_line = ""
         
-        # Print initial prompt
+        # Print initial prompt once queued output is on screen
+        flush_console()
         sys.stdout.write(f"{NEON_GREEN}{prompt}{RESET}")
         sys.stdout.flush()
         